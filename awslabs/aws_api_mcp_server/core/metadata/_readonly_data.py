@@ -0,0 +1,5507 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""읽기 전용 (서비스, 작업) 목록.
+
+scripts/gen_readonly_module.py가 생성한 파일이므로 직접 수정하지 않는다.
+"""
+
+READONLY: frozenset[tuple[str, str]] = frozenset(
+    {
+        ('accessanalyzer', 'GetAccessPreview'),
+        ('accessanalyzer', 'GetAnalyzedResource'),
+        ('accessanalyzer', 'GetAnalyzer'),
+        ('accessanalyzer', 'GetArchiveRule'),
+        ('accessanalyzer', 'GetFinding'),
+        ('accessanalyzer', 'GetFindingV2'),
+        ('accessanalyzer', 'GetGeneratedPolicy'),
+        ('accessanalyzer', 'ListAccessPreviewFindings'),
+        ('accessanalyzer', 'ListAccessPreviews'),
+        ('accessanalyzer', 'ListAnalyzedResources'),
+        ('accessanalyzer', 'ListAnalyzers'),
+        ('accessanalyzer', 'ListArchiveRules'),
+        ('accessanalyzer', 'ListFindings'),
+        ('accessanalyzer', 'ListFindingsV2'),
+        ('accessanalyzer', 'ListPolicyGenerations'),
+        ('accessanalyzer', 'ListTagsForResource'),
+        ('accessanalyzer', 'ValidatePolicy'),
+        ('account', 'GetAlternateContact'),
+        ('account', 'GetContactInformation'),
+        ('account', 'GetRegionOptStatus'),
+        ('account', 'ListRegions'),
+        ('acm', 'DescribeCertificate'),
+        ('acm', 'GetAccountConfiguration'),
+        ('acm', 'GetCertificate'),
+        ('acm', 'ListCertificates'),
+        ('acm', 'ListTagsForCertificate'),
+        ('acm-pca', 'DescribeCertificateAuthority'),
+        ('acm-pca', 'DescribeCertificateAuthorityAuditReport'),
+        ('acm-pca', 'GetCertificate'),
+        ('acm-pca', 'GetCertificateAuthorityCertificate'),
+        ('acm-pca', 'GetCertificateAuthorityCsr'),
+        ('acm-pca', 'GetPolicy'),
+        ('acm-pca', 'ListCertificateAuthorities'),
+        ('acm-pca', 'ListPermissions'),
+        ('acm-pca', 'ListTags'),
+        ('aiops', 'GetInvestigation'),
+        ('aiops', 'GetInvestigationEvent'),
+        ('aiops', 'GetInvestigationResource'),
+        ('aiops', 'ListInvestigationEvents'),
+        ('aiops', 'ListInvestigations'),
+        ('alexaforbusiness', 'GetAddressBook'),
+        ('alexaforbusiness', 'GetConferencePreference'),
+        ('alexaforbusiness', 'GetConferenceProvider'),
+        ('alexaforbusiness', 'GetContact'),
+        ('alexaforbusiness', 'GetDevice'),
+        ('alexaforbusiness', 'GetGateway'),
+        ('alexaforbusiness', 'GetGatewayGroup'),
+        ('alexaforbusiness', 'GetInvitationConfiguration'),
+        ('alexaforbusiness', 'GetNetworkProfile'),
+        ('alexaforbusiness', 'GetProfile'),
+        ('alexaforbusiness', 'GetRoom'),
+        ('alexaforbusiness', 'GetRoomSkillParameter'),
+        ('alexaforbusiness', 'GetSkillGroup'),
+        ('alexaforbusiness', 'ListBusinessReportSchedules'),
+        ('alexaforbusiness', 'ListConferenceProviders'),
+        ('alexaforbusiness', 'ListDeviceEvents'),
+        ('alexaforbusiness', 'ListGatewayGroups'),
+        ('alexaforbusiness', 'ListGateways'),
+        ('alexaforbusiness', 'ListSkills'),
+        ('alexaforbusiness', 'ListSkillsStoreCategories'),
+        ('alexaforbusiness', 'ListSkillsStoreSkillsByCategory'),
+        ('alexaforbusiness', 'ListSmartHomeAppliances'),
+        ('alexaforbusiness', 'ListTags'),
+        ('alexaforbusiness', 'SearchAddressBooks'),
+        ('alexaforbusiness', 'SearchContacts'),
+        ('alexaforbusiness', 'SearchDevices'),
+        ('alexaforbusiness', 'SearchNetworkProfiles'),
+        ('alexaforbusiness', 'SearchProfiles'),
+        ('alexaforbusiness', 'SearchRooms'),
+        ('alexaforbusiness', 'SearchSkillGroups'),
+        ('alexaforbusiness', 'SearchUsers'),
+        ('amp', 'DescribeAlertManagerDefinition'),
+        ('amp', 'DescribeLoggingConfiguration'),
+        ('amp', 'DescribeRuleGroupsNamespace'),
+        ('amp', 'DescribeScraper'),
+        ('amp', 'DescribeWorkspace'),
+        ('amp', 'GetDefaultScraperConfiguration'),
+        ('amp', 'ListRuleGroupsNamespaces'),
+        ('amp', 'ListScrapers'),
+        ('amp', 'ListTagsForResource'),
+        ('amp', 'ListWorkspaces'),
+        ('amplify', 'GetApp'),
+        ('amplify', 'GetArtifactUrl'),
+        ('amplify', 'GetBackendEnvironment'),
+        ('amplify', 'GetBranch'),
+        ('amplify', 'GetDomainAssociation'),
+        ('amplify', 'GetJob'),
+        ('amplify', 'GetWebhook'),
+        ('amplify', 'ListApps'),
+        ('amplify', 'ListArtifacts'),
+        ('amplify', 'ListBackendEnvironments'),
+        ('amplify', 'ListBranches'),
+        ('amplify', 'ListDomainAssociations'),
+        ('amplify', 'ListJobs'),
+        ('amplify', 'ListTagsForResource'),
+        ('amplify', 'ListWebhooks'),
+        ('apigateway', 'GetAccount'),
+        ('apigateway', 'GetApiKey'),
+        ('apigateway', 'GetApiKeys'),
+        ('apigateway', 'GetAuthorizer'),
+        ('apigateway', 'GetAuthorizers'),
+        ('apigateway', 'GetBasePathMapping'),
+        ('apigateway', 'GetBasePathMappings'),
+        ('apigateway', 'GetClientCertificate'),
+        ('apigateway', 'GetClientCertificates'),
+        ('apigateway', 'GetDeployment'),
+        ('apigateway', 'GetDeployments'),
+        ('apigateway', 'GetDocumentationPart'),
+        ('apigateway', 'GetDocumentationParts'),
+        ('apigateway', 'GetDocumentationVersion'),
+        ('apigateway', 'GetDocumentationVersions'),
+        ('apigateway', 'GetDomainName'),
+        ('apigateway', 'GetDomainNames'),
+        ('apigateway', 'GetExport'),
+        ('apigateway', 'GetGatewayResponse'),
+        ('apigateway', 'GetGatewayResponses'),
+        ('apigateway', 'GetIntegration'),
+        ('apigateway', 'GetIntegrationResponse'),
+        ('apigateway', 'GetMethod'),
+        ('apigateway', 'GetMethodResponse'),
+        ('apigateway', 'GetModel'),
+        ('apigateway', 'GetModelTemplate'),
+        ('apigateway', 'GetModels'),
+        ('apigateway', 'GetRequestValidator'),
+        ('apigateway', 'GetRequestValidators'),
+        ('apigateway', 'GetResource'),
+        ('apigateway', 'GetResources'),
+        ('apigateway', 'GetRestApi'),
+        ('apigateway', 'GetRestApis'),
+        ('apigateway', 'GetSdk'),
+        ('apigateway', 'GetSdkType'),
+        ('apigateway', 'GetSdkTypes'),
+        ('apigateway', 'GetStage'),
+        ('apigateway', 'GetStages'),
+        ('apigateway', 'GetTags'),
+        ('apigateway', 'GetUsage'),
+        ('apigateway', 'GetUsagePlan'),
+        ('apigateway', 'GetUsagePlanKey'),
+        ('apigateway', 'GetUsagePlanKeys'),
+        ('apigateway', 'GetUsagePlans'),
+        ('apigateway', 'GetVpcLink'),
+        ('apigateway', 'GetVpcLinks'),
+        ('apigatewayv2', 'GetApi'),
+        ('apigatewayv2', 'GetApiMapping'),
+        ('apigatewayv2', 'GetApiMappings'),
+        ('apigatewayv2', 'GetApis'),
+        ('apigatewayv2', 'GetAuthorizer'),
+        ('apigatewayv2', 'GetAuthorizers'),
+        ('apigatewayv2', 'GetDeployment'),
+        ('apigatewayv2', 'GetDeployments'),
+        ('apigatewayv2', 'GetDomainName'),
+        ('apigatewayv2', 'GetDomainNames'),
+        ('apigatewayv2', 'GetIntegration'),
+        ('apigatewayv2', 'GetIntegrationResponse'),
+        ('apigatewayv2', 'GetIntegrationResponses'),
+        ('apigatewayv2', 'GetIntegrations'),
+        ('apigatewayv2', 'GetModel'),
+        ('apigatewayv2', 'GetModelTemplate'),
+        ('apigatewayv2', 'GetModels'),
+        ('apigatewayv2', 'GetRoute'),
+        ('apigatewayv2', 'GetRouteResponse'),
+        ('apigatewayv2', 'GetRouteResponses'),
+        ('apigatewayv2', 'GetRoutes'),
+        ('apigatewayv2', 'GetStage'),
+        ('apigatewayv2', 'GetStages'),
+        ('apigatewayv2', 'GetTags'),
+        ('apigatewayv2', 'GetVpcLink'),
+        ('apigatewayv2', 'GetVpcLinks'),
+        ('appconfig', 'GetApplication'),
+        ('appconfig', 'GetConfiguration'),
+        ('appconfig', 'GetConfigurationProfile'),
+        ('appconfig', 'GetDeployment'),
+        ('appconfig', 'GetDeploymentStrategy'),
+        ('appconfig', 'GetEnvironment'),
+        ('appconfig', 'GetExtension'),
+        ('appconfig', 'GetExtensionAssociation'),
+        ('appconfig', 'GetHostedConfigurationVersion'),
+        ('appconfig', 'ListApplications'),
+        ('appconfig', 'ListConfigurationProfiles'),
+        ('appconfig', 'ListDeploymentStrategies'),
+        ('appconfig', 'ListDeployments'),
+        ('appconfig', 'ListEnvironments'),
+        ('appconfig', 'ListExtensionAssociations'),
+        ('appconfig', 'ListExtensions'),
+        ('appconfig', 'ListHostedConfigurationVersions'),
+        ('appconfig', 'ListTagsForResource'),
+        ('appconfigdata', 'GetLatestConfiguration'),
+        ('appfabric', 'GetAppAuthorization'),
+        ('appfabric', 'GetAppBundle'),
+        ('appfabric', 'GetIngestion'),
+        ('appfabric', 'GetIngestionDestination'),
+        ('appfabric', 'ListAppAuthorizations'),
+        ('appfabric', 'ListAppBundles'),
+        ('appfabric', 'ListIngestionDestinations'),
+        ('appfabric', 'ListIngestions'),
+        ('appfabric', 'ListTagsForResource'),
+        ('appflow', 'DescribeConnector'),
+        ('appflow', 'DescribeConnectorEntity'),
+        ('appflow', 'DescribeConnectorProfiles'),
+        ('appflow', 'DescribeConnectors'),
+        ('appflow', 'DescribeFlow'),
+        ('appflow', 'DescribeFlowExecutionRecords'),
+        ('appflow', 'ListConnectorEntities'),
+        ('appflow', 'ListConnectors'),
+        ('appflow', 'ListFlows'),
+        ('appflow', 'ListTagsForResource'),
+        ('application-autoscaling', 'DescribeScalableTargets'),
+        ('application-autoscaling', 'DescribeScalingActivities'),
+        ('application-autoscaling', 'DescribeScalingPolicies'),
+        ('application-autoscaling', 'DescribeScheduledActions'),
+        ('application-autoscaling', 'ListTagsForResource'),
+        ('application-insights', 'DescribeApplication'),
+        ('application-insights', 'DescribeComponent'),
+        ('application-insights', 'DescribeComponentConfiguration'),
+        ('application-insights', 'DescribeComponentConfigurationRecommendation'),
+        ('application-insights', 'DescribeLogPattern'),
+        ('application-insights', 'DescribeObservation'),
+        ('application-insights', 'DescribeProblem'),
+        ('application-insights', 'DescribeProblemObservations'),
+        ('application-insights', 'DescribeWorkload'),
+        ('application-insights', 'ListApplications'),
+        ('application-insights', 'ListComponents'),
+        ('application-insights', 'ListConfigurationHistory'),
+        ('application-insights', 'ListLogPatternSets'),
+        ('application-insights', 'ListLogPatterns'),
+        ('application-insights', 'ListProblems'),
+        ('application-insights', 'ListTagsForResource'),
+        ('application-insights', 'ListWorkloads'),
+        ('appmesh', 'DescribeGatewayRoute'),
+        ('appmesh', 'DescribeMesh'),
+        ('appmesh', 'DescribeRoute'),
+        ('appmesh', 'DescribeVirtualGateway'),
+        ('appmesh', 'DescribeVirtualNode'),
+        ('appmesh', 'DescribeVirtualRouter'),
+        ('appmesh', 'DescribeVirtualService'),
+        ('appmesh', 'ListGatewayRoutes'),
+        ('appmesh', 'ListMeshes'),
+        ('appmesh', 'ListRoutes'),
+        ('appmesh', 'ListTagsForResource'),
+        ('appmesh', 'ListVirtualGateways'),
+        ('appmesh', 'ListVirtualNodes'),
+        ('appmesh', 'ListVirtualRouters'),
+        ('appmesh', 'ListVirtualServices'),
+        ('apprunner', 'DescribeAutoScalingConfiguration'),
+        ('apprunner', 'DescribeCustomDomains'),
+        ('apprunner', 'DescribeObservabilityConfiguration'),
+        ('apprunner', 'DescribeService'),
+        ('apprunner', 'DescribeVpcConnector'),
+        ('apprunner', 'DescribeVpcIngressConnection'),
+        ('apprunner', 'ListAutoScalingConfigurations'),
+        ('apprunner', 'ListConnections'),
+        ('apprunner', 'ListObservabilityConfigurations'),
+        ('apprunner', 'ListOperations'),
+        ('apprunner', 'ListServices'),
+        ('apprunner', 'ListServicesForAutoScalingConfiguration'),
+        ('apprunner', 'ListTagsForResource'),
+        ('apprunner', 'ListVpcConnectors'),
+        ('apprunner', 'ListVpcIngressConnections'),
+        ('appstream', 'DescribeAppBlockBuilderAppBlockAssociations'),
+        ('appstream', 'DescribeAppBlockBuilders'),
+        ('appstream', 'DescribeAppBlocks'),
+        ('appstream', 'DescribeApplicationFleetAssociations'),
+        ('appstream', 'DescribeApplications'),
+        ('appstream', 'DescribeDirectoryConfigs'),
+        ('appstream', 'DescribeEntitlements'),
+        ('appstream', 'DescribeFleets'),
+        ('appstream', 'DescribeImageBuilders'),
+        ('appstream', 'DescribeImagePermissions'),
+        ('appstream', 'DescribeImages'),
+        ('appstream', 'DescribeSessions'),
+        ('appstream', 'DescribeStacks'),
+        ('appstream', 'DescribeUsageReportSubscriptions'),
+        ('appstream', 'DescribeUserStackAssociations'),
+        ('appstream', 'DescribeUsers'),
+        ('appstream', 'ListAssociatedFleets'),
+        ('appstream', 'ListAssociatedStacks'),
+        ('appstream', 'ListEntitledApplications'),
+        ('appstream', 'ListTagsForResource'),
+        ('appsync', 'GetApiAssociation'),
+        ('appsync', 'GetApiCache'),
+        ('appsync', 'GetDataSource'),
+        ('appsync', 'GetDataSourceIntrospection'),
+        ('appsync', 'GetDomainName'),
+        ('appsync', 'GetFunction'),
+        ('appsync', 'GetGraphqlApi'),
+        ('appsync', 'GetGraphqlApiEnvironmentVariables'),
+        ('appsync', 'GetIntrospectionSchema'),
+        ('appsync', 'GetResolver'),
+        ('appsync', 'GetSchemaCreationStatus'),
+        ('appsync', 'GetSourceApiAssociation'),
+        ('appsync', 'GetType'),
+        ('appsync', 'ListApiKeys'),
+        ('appsync', 'ListDataSources'),
+        ('appsync', 'ListDomainNames'),
+        ('appsync', 'ListFunctions'),
+        ('appsync', 'ListGraphqlApis'),
+        ('appsync', 'ListResolvers'),
+        ('appsync', 'ListResolversByFunction'),
+        ('appsync', 'ListSourceApiAssociations'),
+        ('appsync', 'ListTagsForResource'),
+        ('appsync', 'ListTypes'),
+        ('appsync', 'ListTypesByAssociation'),
+        ('arc-zonal-shift', 'GetManagedResource'),
+        ('arc-zonal-shift', 'ListAutoshifts'),
+        ('arc-zonal-shift', 'ListManagedResources'),
+        ('arc-zonal-shift', 'ListZonalShifts'),
+        ('artifact', 'GetAccountSettings'),
+        ('artifact', 'GetReport'),
+        ('artifact', 'GetReportMetadata'),
+        ('artifact', 'GetTermForReport'),
+        ('artifact', 'ListReports'),
+        ('athena', 'BatchGetNamedQuery'),
+        ('athena', 'BatchGetPreparedStatement'),
+        ('athena', 'BatchGetQueryExecution'),
+        ('athena', 'GetCalculationExecution'),
+        ('athena', 'GetCalculationExecutionCode'),
+        ('athena', 'GetCalculationExecutionStatus'),
+        ('athena', 'GetCapacityAssignmentConfiguration'),
+        ('athena', 'GetCapacityReservation'),
+        ('athena', 'GetDataCatalog'),
+        ('athena', 'GetDatabase'),
+        ('athena', 'GetNamedQuery'),
+        ('athena', 'GetNotebookMetadata'),
+        ('athena', 'GetPreparedStatement'),
+        ('athena', 'GetQueryExecution'),
+        ('athena', 'GetQueryResults'),
+        ('athena', 'GetQueryRuntimeStatistics'),
+        ('athena', 'GetSession'),
+        ('athena', 'GetSessionStatus'),
+        ('athena', 'GetTableMetadata'),
+        ('athena', 'GetWorkGroup'),
+        ('athena', 'ListApplicationDPUSizes'),
+        ('athena', 'ListCalculationExecutions'),
+        ('athena', 'ListCapacityReservations'),
+        ('athena', 'ListDataCatalogs'),
+        ('athena', 'ListDatabases'),
+        ('athena', 'ListEngineVersions'),
+        ('athena', 'ListExecutors'),
+        ('athena', 'ListNamedQueries'),
+        ('athena', 'ListNotebookMetadata'),
+        ('athena', 'ListNotebookSessions'),
+        ('athena', 'ListPreparedStatements'),
+        ('athena', 'ListQueryExecutions'),
+        ('athena', 'ListSessions'),
+        ('athena', 'ListTableMetadata'),
+        ('athena', 'ListTagsForResource'),
+        ('athena', 'ListWorkGroups'),
+        ('auditmanager', 'GetAccountStatus'),
+        ('auditmanager', 'GetAssessment'),
+        ('auditmanager', 'GetAssessmentFramework'),
+        ('auditmanager', 'GetAssessmentReportUrl'),
+        ('auditmanager', 'GetChangeLogs'),
+        ('auditmanager', 'GetControl'),
+        ('auditmanager', 'GetDelegations'),
+        ('auditmanager', 'GetEvidence'),
+        ('auditmanager', 'GetEvidenceByEvidenceFolder'),
+        ('auditmanager', 'GetEvidenceFileUploadUrl'),
+        ('auditmanager', 'GetEvidenceFolder'),
+        ('auditmanager', 'GetEvidenceFoldersByAssessment'),
+        ('auditmanager', 'GetEvidenceFoldersByAssessmentControl'),
+        ('auditmanager', 'GetInsights'),
+        ('auditmanager', 'GetInsightsByAssessment'),
+        ('auditmanager', 'GetOrganizationAdminAccount'),
+        ('auditmanager', 'GetServicesInScope'),
+        ('auditmanager', 'GetSettings'),
+        ('auditmanager', 'ListAssessmentControlInsightsByControlDomain'),
+        ('auditmanager', 'ListAssessmentFrameworkShareRequests'),
+        ('auditmanager', 'ListAssessmentFrameworks'),
+        ('auditmanager', 'ListAssessmentReports'),
+        ('auditmanager', 'ListAssessments'),
+        ('auditmanager', 'ListControlDomainInsights'),
+        ('auditmanager', 'ListControlDomainInsightsByAssessment'),
+        ('auditmanager', 'ListControlInsightsByControlDomain'),
+        ('auditmanager', 'ListControls'),
+        ('auditmanager', 'ListKeywordsForDataSource'),
+        ('auditmanager', 'ListNotifications'),
+        ('auditmanager', 'ListTagsForResource'),
+        ('auditmanager', 'ValidateAssessmentReportIntegrity'),
+        ('autoscaling', 'DescribeAccountLimits'),
+        ('autoscaling', 'DescribeAdjustmentTypes'),
+        ('autoscaling', 'DescribeAutoScalingGroups'),
+        ('autoscaling', 'DescribeAutoScalingInstances'),
+        ('autoscaling', 'DescribeAutoScalingNotificationTypes'),
+        ('autoscaling', 'DescribeInstanceRefreshes'),
+        ('autoscaling', 'DescribeLaunchConfigurations'),
+        ('autoscaling', 'DescribeLifecycleHookTypes'),
+        ('autoscaling', 'DescribeLifecycleHooks'),
+        ('autoscaling', 'DescribeLoadBalancerTargetGroups'),
+        ('autoscaling', 'DescribeLoadBalancers'),
+        ('autoscaling', 'DescribeMetricCollectionTypes'),
+        ('autoscaling', 'DescribeNotificationConfigurations'),
+        ('autoscaling', 'DescribePolicies'),
+        ('autoscaling', 'DescribeScalingActivities'),
+        ('autoscaling', 'DescribeScalingProcessTypes'),
+        ('autoscaling', 'DescribeScheduledActions'),
+        ('autoscaling', 'DescribeTags'),
+        ('autoscaling', 'DescribeTerminationPolicyTypes'),
+        ('autoscaling', 'DescribeTrafficSources'),
+        ('autoscaling', 'DescribeWarmPool'),
+        ('autoscaling', 'GetPredictiveScalingForecast'),
+        ('autoscaling-plans', 'DescribeScalingPlanResources'),
+        ('autoscaling-plans', 'DescribeScalingPlans'),
+        ('autoscaling-plans', 'GetScalingPlanResourceForecastData'),
+        ('backup', 'DescribeBackupJob'),
+        ('backup', 'DescribeBackupVault'),
+        ('backup', 'DescribeCopyJob'),
+        ('backup', 'DescribeFramework'),
+        ('backup', 'DescribeGlobalSettings'),
+        ('backup', 'DescribeProtectedResource'),
+        ('backup', 'DescribeRecoveryPoint'),
+        ('backup', 'DescribeRegionSettings'),
+        ('backup', 'DescribeReportJob'),
+        ('backup', 'DescribeReportPlan'),
+        ('backup', 'DescribeRestoreJob'),
+        ('backup', 'GetBackupPlan'),
+        ('backup', 'GetBackupPlanFromJSON'),
+        ('backup', 'GetBackupPlanFromTemplate'),
+        ('backup', 'GetBackupSelection'),
+        ('backup', 'GetBackupVaultAccessPolicy'),
+        ('backup', 'GetBackupVaultNotifications'),
+        ('backup', 'GetLegalHold'),
+        ('backup', 'GetRecoveryPointRestoreMetadata'),
+        ('backup', 'GetRestoreJobMetadata'),
+        ('backup', 'GetRestoreTestingInferredMetadata'),
+        ('backup', 'GetRestoreTestingPlan'),
+        ('backup', 'GetRestoreTestingSelection'),
+        ('backup', 'GetSupportedResourceTypes'),
+        ('backup', 'ListBackupJobSummaries'),
+        ('backup', 'ListBackupJobs'),
+        ('backup', 'ListBackupPlanTemplates'),
+        ('backup', 'ListBackupPlanVersions'),
+        ('backup', 'ListBackupPlans'),
+        ('backup', 'ListBackupSelections'),
+        ('backup', 'ListBackupVaults'),
+        ('backup', 'ListCopyJobSummaries'),
+        ('backup', 'ListCopyJobs'),
+        ('backup', 'ListFrameworks'),
+        ('backup', 'ListLegalHolds'),
+        ('backup', 'ListProtectedResources'),
+        ('backup', 'ListProtectedResourcesByBackupVault'),
+        ('backup', 'ListRecoveryPointsByBackupVault'),
+        ('backup', 'ListRecoveryPointsByLegalHold'),
+        ('backup', 'ListRecoveryPointsByResource'),
+        ('backup', 'ListReportJobs'),
+        ('backup', 'ListReportPlans'),
+        ('backup', 'ListRestoreJobSummaries'),
+        ('backup', 'ListRestoreJobs'),
+        ('backup', 'ListRestoreJobsByProtectedResource'),
+        ('backup', 'ListRestoreTestingPlans'),
+        ('backup', 'ListRestoreTestingSelections'),
+        ('backup', 'ListTags'),
+        ('backup-gateway', 'GetBandwidthRateLimitSchedule'),
+        ('backup-gateway', 'GetGateway'),
+        ('backup-gateway', 'GetHypervisor'),
+        ('backup-gateway', 'GetHypervisorPropertyMappings'),
+        ('backup-gateway', 'GetVirtualMachine'),
+        ('backup-gateway', 'ListGateways'),
+        ('backup-gateway', 'ListHypervisors'),
+        ('backup-gateway', 'ListTagsForResource'),
+        ('backup-gateway', 'ListVirtualMachines'),
+        ('batch', 'DescribeComputeEnvironments'),
+        ('batch', 'DescribeJobDefinitions'),
+        ('batch', 'DescribeJobQueues'),
+        ('batch', 'DescribeJobs'),
+        ('batch', 'DescribeSchedulingPolicies'),
+        ('batch', 'ListJobs'),
+        ('batch', 'ListSchedulingPolicies'),
+        ('batch', 'ListTagsForResource'),
+        ('bedrock', 'GetCustomModel'),
+        ('bedrock', 'GetFoundationModel'),
+        ('bedrock', 'GetModelCustomizationJob'),
+        ('bedrock', 'GetModelInvocationLoggingConfiguration'),
+        ('bedrock', 'GetProvisionedModelThroughput'),
+        ('bedrock', 'ListCustomModels'),
+        ('bedrock', 'ListFoundationModels'),
+        ('bedrock', 'ListModelCustomizationJobs'),
+        ('bedrock', 'ListProvisionedModelThroughputs'),
+        ('bedrock', 'ListTagsForResource'),
+        ('bedrock-agent', 'GetAgent'),
+        ('bedrock-agent', 'GetAgentActionGroup'),
+        ('bedrock-agent', 'GetAgentAlias'),
+        ('bedrock-agent', 'GetAgentKnowledgeBase'),
+        ('bedrock-agent', 'GetAgentVersion'),
+        ('bedrock-agent', 'GetDataSource'),
+        ('bedrock-agent', 'GetIngestionJob'),
+        ('bedrock-agent', 'GetKnowledgeBase'),
+        ('bedrock-agent', 'ListAgentActionGroups'),
+        ('bedrock-agent', 'ListAgentAliases'),
+        ('bedrock-agent', 'ListAgentKnowledgeBases'),
+        ('bedrock-agent', 'ListAgentVersions'),
+        ('bedrock-agent', 'ListAgents'),
+        ('bedrock-agent', 'ListDataSources'),
+        ('bedrock-agent', 'ListIngestionJobs'),
+        ('bedrock-agent', 'ListKnowledgeBases'),
+        ('bedrock-agent', 'ListTagsForResource'),
+        ('billingconductor', 'GetBillingGroupCostReport'),
+        ('billingconductor', 'ListAccountAssociations'),
+        ('billingconductor', 'ListBillingGroupCostReports'),
+        ('billingconductor', 'ListBillingGroups'),
+        ('billingconductor', 'ListCustomLineItemVersions'),
+        ('billingconductor', 'ListCustomLineItems'),
+        ('billingconductor', 'ListPricingPlans'),
+        ('billingconductor', 'ListPricingPlansAssociatedWithPricingRule'),
+        ('billingconductor', 'ListPricingRules'),
+        ('billingconductor', 'ListPricingRulesAssociatedToPricingPlan'),
+        ('billingconductor', 'ListResourcesAssociatedToCustomLineItem'),
+        ('billingconductor', 'ListTagsForResource'),
+        ('braket', 'GetDevice'),
+        ('braket', 'GetJob'),
+        ('braket', 'GetQuantumTask'),
+        ('braket', 'ListTagsForResource'),
+        ('braket', 'SearchDevices'),
+        ('braket', 'SearchJobs'),
+        ('braket', 'SearchQuantumTasks'),
+        ('budgets', 'DescribeBudget'),
+        ('budgets', 'DescribeBudgetAction'),
+        ('budgets', 'DescribeBudgetActionHistories'),
+        ('budgets', 'DescribeBudgetActionsForAccount'),
+        ('budgets', 'DescribeBudgetActionsForBudget'),
+        ('budgets', 'DescribeBudgetNotificationsForAccount'),
+        ('budgets', 'DescribeBudgetPerformanceHistory'),
+        ('budgets', 'DescribeBudgets'),
+        ('budgets', 'DescribeNotificationsForBudget'),
+        ('budgets', 'DescribeSubscribersForNotification'),
+        ('ce', 'DescribeCostCategoryDefinition'),
+        ('ce', 'GetAnomalies'),
+        ('ce', 'GetAnomalyMonitors'),
+        ('ce', 'GetAnomalySubscriptions'),
+        ('ce', 'GetApproximateUsageRecords'),
+        ('ce', 'GetCostAndUsage'),
+        ('ce', 'GetCostAndUsageWithResources'),
+        ('ce', 'GetCostCategories'),
+        ('ce', 'GetCostForecast'),
+        ('ce', 'GetDimensionValues'),
+        ('ce', 'GetReservationCoverage'),
+        ('ce', 'GetReservationPurchaseRecommendation'),
+        ('ce', 'GetReservationUtilization'),
+        ('ce', 'GetRightsizingRecommendation'),
+        ('ce', 'GetSavingsPlanPurchaseRecommendationDetails'),
+        ('ce', 'GetSavingsPlansCoverage'),
+        ('ce', 'GetSavingsPlansPurchaseRecommendation'),
+        ('ce', 'GetSavingsPlansUtilization'),
+        ('ce', 'GetSavingsPlansUtilizationDetails'),
+        ('ce', 'GetTags'),
+        ('ce', 'GetUsageForecast'),
+        ('ce', 'ListCostAllocationTagBackfillHistory'),
+        ('ce', 'ListCostAllocationTags'),
+        ('ce', 'ListCostCategoryDefinitions'),
+        ('ce', 'ListSavingsPlansPurchaseRecommendationGeneration'),
+        ('ce', 'ListTagsForResource'),
+        ('chatbot', 'DescribeChimeWebhookConfigurations'),
+        ('chatbot', 'DescribeSlackChannelConfigurations'),
+        ('chatbot', 'DescribeSlackUserIdentities'),
+        ('chatbot', 'DescribeSlackWorkspaces'),
+        ('chatbot', 'GetAccountPreferences'),
+        ('chatbot', 'GetMicrosoftTeamsChannelConfiguration'),
+        ('chatbot', 'ListMicrosoftTeamsChannelConfigurations'),
+        ('chatbot', 'ListMicrosoftTeamsConfiguredTeams'),
+        ('chatbot', 'ListMicrosoftTeamsUserIdentities'),
+        ('chime', 'GetAccount'),
+        ('chime', 'GetAccountSettings'),
+        ('chime', 'GetAppInstanceRetentionSettings'),
+        ('chime', 'GetAppInstanceStreamingConfigurations'),
+        ('chime', 'GetAttendee'),
+        ('chime', 'GetBot'),
+        ('chime', 'GetChannelMessage'),
+        ('chime', 'GetEventsConfiguration'),
+        ('chime', 'GetGlobalSettings'),
+        ('chime', 'GetMediaCapturePipeline'),
+        ('chime', 'GetMeeting'),
+        ('chime', 'GetMessagingSessionEndpoint'),
+        ('chime', 'GetPhoneNumber'),
+        ('chime', 'GetPhoneNumberOrder'),
+        ('chime', 'GetPhoneNumberSettings'),
+        ('chime', 'GetProxySession'),
+        ('chime', 'GetRetentionSettings'),
+        ('chime', 'GetRoom'),
+        ('chime', 'GetSipMediaApplication'),
+        ('chime', 'GetSipMediaApplicationLoggingConfiguration'),
+        ('chime', 'GetSipRule'),
+        ('chime', 'GetUser'),
+        ('chime', 'GetUserSettings'),
+        ('chime', 'GetVoiceConnector'),
+        ('chime', 'GetVoiceConnectorEmergencyCallingConfiguration'),
+        ('chime', 'GetVoiceConnectorGroup'),
+        ('chime', 'GetVoiceConnectorLoggingConfiguration'),
+        ('chime', 'GetVoiceConnectorOrigination'),
+        ('chime', 'GetVoiceConnectorProxy'),
+        ('chime', 'GetVoiceConnectorStreamingConfiguration'),
+        ('chime', 'GetVoiceConnectorTermination'),
+        ('chime', 'GetVoiceConnectorTerminationHealth'),
+        ('chime', 'ListAccounts'),
+        ('chime', 'ListAppInstanceAdmins'),
+        ('chime', 'ListAppInstanceUsers'),
+        ('chime', 'ListAppInstances'),
+        ('chime', 'ListAttendeeTags'),
+        ('chime', 'ListAttendees'),
+        ('chime', 'ListBots'),
+        ('chime', 'ListChannelBans'),
+        ('chime', 'ListChannelMemberships'),
+        ('chime', 'ListChannelMembershipsForAppInstanceUser'),
+        ('chime', 'ListChannelMessages'),
+        ('chime', 'ListChannelModerators'),
+        ('chime', 'ListChannels'),
+        ('chime', 'ListChannelsModeratedByAppInstanceUser'),
+        ('chime', 'ListMediaCapturePipelines'),
+        ('chime', 'ListMeetingTags'),
+        ('chime', 'ListMeetings'),
+        ('chime', 'ListPhoneNumberOrders'),
+        ('chime', 'ListPhoneNumbers'),
+        ('chime', 'ListProxySessions'),
+        ('chime', 'ListRoomMemberships'),
+        ('chime', 'ListRooms'),
+        ('chime', 'ListSipMediaApplications'),
+        ('chime', 'ListSipRules'),
+        ('chime', 'ListSupportedPhoneNumberCountries'),
+        ('chime', 'ListTagsForResource'),
+        ('chime', 'ListUsers'),
+        ('chime', 'ListVoiceConnectorGroups'),
+        ('chime', 'ListVoiceConnectorTerminationCredentials'),
+        ('chime', 'ListVoiceConnectors'),
+        ('chime', 'SearchAvailablePhoneNumbers'),
+        ('chime', 'ValidateE911Address'),
+        ('chime-sdk-identity', 'GetAppInstanceRetentionSettings'),
+        ('chime-sdk-identity', 'ListAppInstanceAdmins'),
+        ('chime-sdk-identity', 'ListAppInstanceBots'),
+        ('chime-sdk-identity', 'ListAppInstanceUserEndpoints'),
+        ('chime-sdk-identity', 'ListAppInstanceUsers'),
+        ('chime-sdk-identity', 'ListAppInstances'),
+        ('chime-sdk-identity', 'ListTagsForResource'),
+        ('chime-sdk-media-pipelines', 'GetMediaCapturePipeline'),
+        ('chime-sdk-media-pipelines', 'GetMediaInsightsPipelineConfiguration'),
+        ('chime-sdk-media-pipelines', 'GetMediaPipeline'),
+        ('chime-sdk-media-pipelines', 'GetMediaPipelineKinesisVideoStreamPool'),
+        ('chime-sdk-media-pipelines', 'GetSpeakerSearchTask'),
+        ('chime-sdk-media-pipelines', 'GetVoiceToneAnalysisTask'),
+        ('chime-sdk-media-pipelines', 'ListMediaCapturePipelines'),
+        ('chime-sdk-media-pipelines', 'ListMediaInsightsPipelineConfigurations'),
+        ('chime-sdk-media-pipelines', 'ListMediaPipelineKinesisVideoStreamPools'),
+        ('chime-sdk-media-pipelines', 'ListMediaPipelines'),
+        ('chime-sdk-media-pipelines', 'ListTagsForResource'),
+        ('chime-sdk-meetings', 'GetAttendee'),
+        ('chime-sdk-meetings', 'GetMeeting'),
+        ('chime-sdk-meetings', 'ListAttendees'),
+        ('chime-sdk-meetings', 'ListTagsForResource'),
+        ('chime-sdk-messaging', 'GetChannelMembershipPreferences'),
+        ('chime-sdk-messaging', 'GetChannelMessage'),
+        ('chime-sdk-messaging', 'GetChannelMessageStatus'),
+        ('chime-sdk-messaging', 'GetMessagingSessionEndpoint'),
+        ('chime-sdk-messaging', 'GetMessagingStreamingConfigurations'),
+        ('chime-sdk-messaging', 'ListChannelBans'),
+        ('chime-sdk-messaging', 'ListChannelFlows'),
+        ('chime-sdk-messaging', 'ListChannelMemberships'),
+        ('chime-sdk-messaging', 'ListChannelMembershipsForAppInstanceUser'),
+        ('chime-sdk-messaging', 'ListChannelMessages'),
+        ('chime-sdk-messaging', 'ListChannelModerators'),
+        ('chime-sdk-messaging', 'ListChannels'),
+        ('chime-sdk-messaging', 'ListChannelsAssociatedWithChannelFlow'),
+        ('chime-sdk-messaging', 'ListChannelsModeratedByAppInstanceUser'),
+        ('chime-sdk-messaging', 'ListSubChannels'),
+        ('chime-sdk-messaging', 'ListTagsForResource'),
+        ('chime-sdk-messaging', 'SearchChannels'),
+        ('chime-sdk-voice', 'GetGlobalSettings'),
+        ('chime-sdk-voice', 'GetPhoneNumber'),
+        ('chime-sdk-voice', 'GetPhoneNumberOrder'),
+        ('chime-sdk-voice', 'GetPhoneNumberSettings'),
+        ('chime-sdk-voice', 'GetProxySession'),
+        ('chime-sdk-voice', 'GetSipMediaApplication'),
+        ('chime-sdk-voice', 'GetSipMediaApplicationAlexaSkillConfiguration'),
+        ('chime-sdk-voice', 'GetSipMediaApplicationLoggingConfiguration'),
+        ('chime-sdk-voice', 'GetSipRule'),
+        ('chime-sdk-voice', 'GetSpeakerSearchTask'),
+        ('chime-sdk-voice', 'GetVoiceConnector'),
+        ('chime-sdk-voice', 'GetVoiceConnectorEmergencyCallingConfiguration'),
+        ('chime-sdk-voice', 'GetVoiceConnectorGroup'),
+        ('chime-sdk-voice', 'GetVoiceConnectorLoggingConfiguration'),
+        ('chime-sdk-voice', 'GetVoiceConnectorOrigination'),
+        ('chime-sdk-voice', 'GetVoiceConnectorProxy'),
+        ('chime-sdk-voice', 'GetVoiceConnectorStreamingConfiguration'),
+        ('chime-sdk-voice', 'GetVoiceConnectorTermination'),
+        ('chime-sdk-voice', 'GetVoiceConnectorTerminationHealth'),
+        ('chime-sdk-voice', 'GetVoiceProfile'),
+        ('chime-sdk-voice', 'GetVoiceProfileDomain'),
+        ('chime-sdk-voice', 'GetVoiceToneAnalysisTask'),
+        ('chime-sdk-voice', 'ListAvailableVoiceConnectorRegions'),
+        ('chime-sdk-voice', 'ListPhoneNumberOrders'),
+        ('chime-sdk-voice', 'ListPhoneNumbers'),
+        ('chime-sdk-voice', 'ListProxySessions'),
+        ('chime-sdk-voice', 'ListSipMediaApplications'),
+        ('chime-sdk-voice', 'ListSipRules'),
+        ('chime-sdk-voice', 'ListSupportedPhoneNumberCountries'),
+        ('chime-sdk-voice', 'ListTagsForResource'),
+        ('chime-sdk-voice', 'ListVoiceConnectorGroups'),
+        ('chime-sdk-voice', 'ListVoiceConnectorTerminationCredentials'),
+        ('chime-sdk-voice', 'ListVoiceConnectors'),
+        ('chime-sdk-voice', 'ListVoiceProfileDomains'),
+        ('chime-sdk-voice', 'ListVoiceProfiles'),
+        ('chime-sdk-voice', 'SearchAvailablePhoneNumbers'),
+        ('chime-sdk-voice', 'ValidateE911Address'),
+        ('cleanrooms', 'BatchGetCollaborationAnalysisTemplate'),
+        ('cleanrooms', 'BatchGetSchema'),
+        ('cleanrooms', 'GetAnalysisTemplate'),
+        ('cleanrooms', 'GetCollaboration'),
+        ('cleanrooms', 'GetCollaborationAnalysisTemplate'),
+        ('cleanrooms', 'GetCollaborationConfiguredAudienceModelAssociation'),
+        ('cleanrooms', 'GetCollaborationPrivacyBudgetTemplate'),
+        ('cleanrooms', 'GetConfiguredAudienceModelAssociation'),
+        ('cleanrooms', 'GetConfiguredTable'),
+        ('cleanrooms', 'GetConfiguredTableAnalysisRule'),
+        ('cleanrooms', 'GetConfiguredTableAssociation'),
+        ('cleanrooms', 'GetMembership'),
+        ('cleanrooms', 'GetPrivacyBudgetTemplate'),
+        ('cleanrooms', 'GetProtectedQuery'),
+        ('cleanrooms', 'GetSchema'),
+        ('cleanrooms', 'GetSchemaAnalysisRule'),
+        ('cleanrooms', 'ListAnalysisTemplates'),
+        ('cleanrooms', 'ListCollaborationAnalysisTemplates'),
+        ('cleanrooms', 'ListCollaborationConfiguredAudienceModelAssociations'),
+        ('cleanrooms', 'ListCollaborationPrivacyBudgetTemplates'),
+        ('cleanrooms', 'ListCollaborationPrivacyBudgets'),
+        ('cleanrooms', 'ListCollaborations'),
+        ('cleanrooms', 'ListConfiguredAudienceModelAssociations'),
+        ('cleanrooms', 'ListConfiguredTableAssociations'),
+        ('cleanrooms', 'ListConfiguredTables'),
+        ('cleanrooms', 'ListMembers'),
+        ('cleanrooms', 'ListMemberships'),
+        ('cleanrooms', 'ListPrivacyBudgetTemplates'),
+        ('cleanrooms', 'ListPrivacyBudgets'),
+        ('cleanrooms', 'ListProtectedQueries'),
+        ('cleanrooms', 'ListSchemas'),
+        ('cleanrooms', 'ListTagsForResource'),
+        ('cloud9', 'DescribeEnvironmentMemberships'),
+        ('cloud9', 'DescribeEnvironmentStatus'),
+        ('cloud9', 'DescribeEnvironments'),
+        ('cloud9', 'ListEnvironments'),
+        ('cloud9', 'ListTagsForResource'),
+        ('cloudcontrol', 'GetResource'),
+        ('cloudcontrol', 'GetResourceRequestStatus'),
+        ('cloudcontrol', 'ListResourceRequests'),
+        ('cloudcontrol', 'ListResources'),
+        ('clouddirectory', 'BatchRead'),
+        ('clouddirectory', 'GetAppliedSchemaVersion'),
+        ('clouddirectory', 'GetDirectory'),
+        ('clouddirectory', 'GetFacet'),
+        ('clouddirectory', 'GetLinkAttributes'),
+        ('clouddirectory', 'GetObjectAttributes'),
+        ('clouddirectory', 'GetObjectInformation'),
+        ('clouddirectory', 'GetSchemaAsJson'),
+        ('clouddirectory', 'GetTypedLinkFacetInformation'),
+        ('clouddirectory', 'ListAppliedSchemaArns'),
+        ('clouddirectory', 'ListAttachedIndices'),
+        ('clouddirectory', 'ListDevelopmentSchemaArns'),
+        ('clouddirectory', 'ListDirectories'),
+        ('clouddirectory', 'ListFacetAttributes'),
+        ('clouddirectory', 'ListFacetNames'),
+        ('clouddirectory', 'ListIncomingTypedLinks'),
+        ('clouddirectory', 'ListIndex'),
+        ('clouddirectory', 'ListManagedSchemaArns'),
+        ('clouddirectory', 'ListObjectAttributes'),
+        ('clouddirectory', 'ListObjectChildren'),
+        ('clouddirectory', 'ListObjectParentPaths'),
+        ('clouddirectory', 'ListObjectParents'),
+        ('clouddirectory', 'ListObjectPolicies'),
+        ('clouddirectory', 'ListOutgoingTypedLinks'),
+        ('clouddirectory', 'ListPolicyAttachments'),
+        ('clouddirectory', 'ListPublishedSchemaArns'),
+        ('clouddirectory', 'ListTagsForResource'),
+        ('clouddirectory', 'ListTypedLinkFacetAttributes'),
+        ('clouddirectory', 'ListTypedLinkFacetNames'),
+        ('clouddirectory', 'LookupPolicy'),
+        ('cloudformation', 'DescribeAccountLimits'),
+        ('cloudformation', 'DescribeChangeSet'),
+        ('cloudformation', 'DescribeChangeSetHooks'),
+        ('cloudformation', 'DescribeGeneratedTemplate'),
+        ('cloudformation', 'DescribeOrganizationsAccess'),
+        ('cloudformation', 'DescribePublisher'),
+        ('cloudformation', 'DescribeResourceScan'),
+        ('cloudformation', 'DescribeStackDriftDetectionStatus'),
+        ('cloudformation', 'DescribeStackEvents'),
+        ('cloudformation', 'DescribeStackInstance'),
+        ('cloudformation', 'DescribeStackResource'),
+        ('cloudformation', 'DescribeStackResourceDrifts'),
+        ('cloudformation', 'DescribeStackResources'),
+        ('cloudformation', 'DescribeStackSet'),
+        ('cloudformation', 'DescribeStackSetOperation'),
+        ('cloudformation', 'DescribeStacks'),
+        ('cloudformation', 'DescribeType'),
+        ('cloudformation', 'DescribeTypeRegistration'),
+        ('cloudformation', 'DetectStackDrift'),
+        ('cloudformation', 'DetectStackResourceDrift'),
+        ('cloudformation', 'DetectStackSetDrift'),
+        ('cloudformation', 'EstimateTemplateCost'),
+        ('cloudformation', 'GetGeneratedTemplate'),
+        ('cloudformation', 'GetStackPolicy'),
+        ('cloudformation', 'GetTemplate'),
+        ('cloudformation', 'GetTemplateSummary'),
+        ('cloudformation', 'ListChangeSets'),
+        ('cloudformation', 'ListExports'),
+        ('cloudformation', 'ListGeneratedTemplates'),
+        ('cloudformation', 'ListImports'),
+        ('cloudformation', 'ListResourceScanRelatedResources'),
+        ('cloudformation', 'ListResourceScanResources'),
+        ('cloudformation', 'ListResourceScans'),
+        ('cloudformation', 'ListStackInstanceResourceDrifts'),
+        ('cloudformation', 'ListStackInstances'),
+        ('cloudformation', 'ListStackResources'),
+        ('cloudformation', 'ListStackSetAutoDeploymentTargets'),
+        ('cloudformation', 'ListStackSetOperationResults'),
+        ('cloudformation', 'ListStackSetOperations'),
+        ('cloudformation', 'ListStackSets'),
+        ('cloudformation', 'ListStacks'),
+        ('cloudformation', 'ListTypeRegistrations'),
+        ('cloudformation', 'ListTypeVersions'),
+        ('cloudformation', 'ListTypes'),
+        ('cloudformation', 'ValidateTemplate'),
+        ('cloudfront', 'DescribeFunction'),
+        ('cloudfront', 'DescribeKeyValueStore'),
+        ('cloudfront', 'GetCachePolicy'),
+        ('cloudfront', 'GetCachePolicyConfig'),
+        ('cloudfront', 'GetCloudFrontOriginAccessIdentity'),
+        ('cloudfront', 'GetCloudFrontOriginAccessIdentityConfig'),
+        ('cloudfront', 'GetContinuousDeploymentPolicy'),
+        ('cloudfront', 'GetContinuousDeploymentPolicyConfig'),
+        ('cloudfront', 'GetDistribution'),
+        ('cloudfront', 'GetDistributionConfig'),
+        ('cloudfront', 'GetFieldLevelEncryption'),
+        ('cloudfront', 'GetFieldLevelEncryptionConfig'),
+        ('cloudfront', 'GetFieldLevelEncryptionProfile'),
+        ('cloudfront', 'GetFieldLevelEncryptionProfileConfig'),
+        ('cloudfront', 'GetFunction'),
+        ('cloudfront', 'GetInvalidation'),
+        ('cloudfront', 'GetKeyGroup'),
+        ('cloudfront', 'GetKeyGroupConfig'),
+        ('cloudfront', 'GetMonitoringSubscription'),
+        ('cloudfront', 'GetOriginAccessControl'),
+        ('cloudfront', 'GetOriginAccessControlConfig'),
+        ('cloudfront', 'GetOriginRequestPolicy'),
+        ('cloudfront', 'GetOriginRequestPolicyConfig'),
+        ('cloudfront', 'GetPublicKey'),
+        ('cloudfront', 'GetPublicKeyConfig'),
+        ('cloudfront', 'GetRealtimeLogConfig'),
+        ('cloudfront', 'GetResponseHeadersPolicy'),
+        ('cloudfront', 'GetResponseHeadersPolicyConfig'),
+        ('cloudfront', 'GetStreamingDistribution'),
+        ('cloudfront', 'GetStreamingDistributionConfig'),
+        ('cloudfront', 'ListCachePolicies'),
+        ('cloudfront', 'ListCloudFrontOriginAccessIdentities'),
+        ('cloudfront', 'ListConflictingAliases'),
+        ('cloudfront', 'ListContinuousDeploymentPolicies'),
+        ('cloudfront', 'ListDistributions'),
+        ('cloudfront', 'ListDistributionsByCachePolicyId'),
+        ('cloudfront', 'ListDistributionsByKeyGroup'),
+        ('cloudfront', 'ListDistributionsByOriginRequestPolicyId'),
+        ('cloudfront', 'ListDistributionsByRealtimeLogConfig'),
+        ('cloudfront', 'ListDistributionsByResponseHeadersPolicyId'),
+        ('cloudfront', 'ListDistributionsByWebACLId'),
+        ('cloudfront', 'ListFieldLevelEncryptionConfigs'),
+        ('cloudfront', 'ListFieldLevelEncryptionProfiles'),
+        ('cloudfront', 'ListFunctions'),
+        ('cloudfront', 'ListInvalidations'),
+        ('cloudfront', 'ListKeyGroups'),
+        ('cloudfront', 'ListKeyValueStores'),
+        ('cloudfront', 'ListOriginAccessControls'),
+        ('cloudfront', 'ListOriginRequestPolicies'),
+        ('cloudfront', 'ListPublicKeys'),
+        ('cloudfront', 'ListRealtimeLogConfigs'),
+        ('cloudfront', 'ListResponseHeadersPolicies'),
+        ('cloudfront', 'ListStreamingDistributions'),
+        ('cloudfront', 'ListTagsForResource'),
+        ('cloudfront', 'sign'),
+        ('cloudfront-keyvaluestore', 'DescribeKeyValueStore'),
+        ('cloudfront-keyvaluestore', 'GetKey'),
+        ('cloudfront-keyvaluestore', 'ListKeys'),
+        ('cloudhsm', 'DescribeHapg'),
+        ('cloudhsm', 'DescribeHsm'),
+        ('cloudhsm', 'DescribeLunaClient'),
+        ('cloudhsm', 'ListAvailableZones'),
+        ('cloudhsm', 'ListHapgs'),
+        ('cloudhsm', 'ListHsms'),
+        ('cloudhsm', 'ListLunaClients'),
+        ('cloudhsm', 'ListTagsForResource'),
+        ('cloudhsmv2', 'DescribeBackups'),
+        ('cloudhsmv2', 'DescribeClusters'),
+        ('cloudhsmv2', 'ListTags'),
+        ('cloudsearch', 'DescribeAnalysisSchemes'),
+        ('cloudsearch', 'DescribeAvailabilityOptions'),
+        ('cloudsearch', 'DescribeDomainEndpointOptions'),
+        ('cloudsearch', 'DescribeDomains'),
+        ('cloudsearch', 'DescribeExpressions'),
+        ('cloudsearch', 'DescribeIndexFields'),
+        ('cloudsearch', 'DescribeScalingParameters'),
+        ('cloudsearch', 'DescribeServiceAccessPolicies'),
+        ('cloudsearch', 'DescribeSuggesters'),
+        ('cloudsearch', 'ListDomainNames'),
+        ('cloudtrail', 'DescribeQuery'),
+        ('cloudtrail', 'DescribeTrails'),
+        ('cloudtrail', 'GetChannel'),
+        ('cloudtrail', 'GetEventDataStore'),
+        ('cloudtrail', 'GetEventSelectors'),
+        ('cloudtrail', 'GetImport'),
+        ('cloudtrail', 'GetInsightSelectors'),
+        ('cloudtrail', 'GetQueryResults'),
+        ('cloudtrail', 'GetResourcePolicy'),
+        ('cloudtrail', 'GetTrail'),
+        ('cloudtrail', 'GetTrailStatus'),
+        ('cloudtrail', 'ListChannels'),
+        ('cloudtrail', 'ListEventDataStores'),
+        ('cloudtrail', 'ListImportFailures'),
+        ('cloudtrail', 'ListImports'),
+        ('cloudtrail', 'ListInsightsMetricData'),
+        ('cloudtrail', 'ListPublicKeys'),
+        ('cloudtrail', 'ListQueries'),
+        ('cloudtrail', 'ListTags'),
+        ('cloudtrail', 'ListTrails'),
+        ('cloudtrail', 'LookupEvents'),
+        ('cloudtrail', 'SearchSampleQueries'),
+        ('cloudtrail', 'validate-logs'),
+        ('cloudwatch', 'DescribeAlarmHistory'),
+        ('cloudwatch', 'DescribeAlarms'),
+        ('cloudwatch', 'DescribeAlarmsForMetric'),
+        ('cloudwatch', 'DescribeAnomalyDetectors'),
+        ('cloudwatch', 'DescribeInsightRules'),
+        ('cloudwatch', 'GetDashboard'),
+        ('cloudwatch', 'GetInsightRuleReport'),
+        ('cloudwatch', 'GetMetricData'),
+        ('cloudwatch', 'GetMetricStatistics'),
+        ('cloudwatch', 'GetMetricStream'),
+        ('cloudwatch', 'GetMetricWidgetImage'),
+        ('cloudwatch', 'ListDashboards'),
+        ('cloudwatch', 'ListManagedInsightRules'),
+        ('cloudwatch', 'ListMetricStreams'),
+        ('cloudwatch', 'ListMetrics'),
+        ('cloudwatch', 'ListTagsForResource'),
+        ('codeartifact', 'DescribeDomain'),
+        ('codeartifact', 'DescribePackage'),
+        ('codeartifact', 'DescribePackageGroup'),
+        ('codeartifact', 'DescribePackageVersion'),
+        ('codeartifact', 'DescribeRepository'),
+        ('codeartifact', 'GetAssociatedPackageGroup'),
+        ('codeartifact', 'GetAuthorizationToken'),
+        ('codeartifact', 'GetDomainPermissionsPolicy'),
+        ('codeartifact', 'GetPackageVersionAsset'),
+        ('codeartifact', 'GetPackageVersionReadme'),
+        ('codeartifact', 'GetRepositoryEndpoint'),
+        ('codeartifact', 'GetRepositoryPermissionsPolicy'),
+        ('codeartifact', 'ListAllowedRepositoriesForGroup'),
+        ('codeartifact', 'ListAssociatedPackages'),
+        ('codeartifact', 'ListDomains'),
+        ('codeartifact', 'ListPackageGroups'),
+        ('codeartifact', 'ListPackageVersionAssets'),
+        ('codeartifact', 'ListPackageVersionDependencies'),
+        ('codeartifact', 'ListPackageVersions'),
+        ('codeartifact', 'ListPackages'),
+        ('codeartifact', 'ListRepositories'),
+        ('codeartifact', 'ListRepositoriesInDomain'),
+        ('codeartifact', 'ListSubPackageGroups'),
+        ('codeartifact', 'ListTagsForResource'),
+        ('codeartifact', 'login'),
+        ('codebuild', 'BatchGetBuildBatches'),
+        ('codebuild', 'BatchGetBuilds'),
+        ('codebuild', 'BatchGetFleets'),
+        ('codebuild', 'BatchGetProjects'),
+        ('codebuild', 'BatchGetReportGroups'),
+        ('codebuild', 'BatchGetReports'),
+        ('codebuild', 'DescribeCodeCoverages'),
+        ('codebuild', 'DescribeTestCases'),
+        ('codebuild', 'ListBuildBatches'),
+        ('codebuild', 'ListBuildBatchesForProject'),
+        ('codebuild', 'ListBuilds'),
+        ('codebuild', 'ListBuildsForProject'),
+        ('codebuild', 'ListCuratedEnvironmentImages'),
+        ('codebuild', 'ListFleets'),
+        ('codebuild', 'ListProjects'),
+        ('codebuild', 'ListReportGroups'),
+        ('codebuild', 'ListReports'),
+        ('codebuild', 'ListReportsForReportGroup'),
+        ('codebuild', 'ListSharedProjects'),
+        ('codebuild', 'ListSharedReportGroups'),
+        ('codebuild', 'ListSourceCredentials'),
+        ('codecatalyst', 'GetDevEnvironment'),
+        ('codecatalyst', 'GetProject'),
+        ('codecatalyst', 'GetSourceRepository'),
+        ('codecatalyst', 'GetSourceRepositoryCloneUrls'),
+        ('codecatalyst', 'GetSpace'),
+        ('codecatalyst', 'GetSubscription'),
+        ('codecatalyst', 'GetUserDetails'),
+        ('codecatalyst', 'GetWorkflow'),
+        ('codecatalyst', 'GetWorkflowRun'),
+        ('codecatalyst', 'ListAccessTokens'),
+        ('codecatalyst', 'ListDevEnvironmentSessions'),
+        ('codecatalyst', 'ListDevEnvironments'),
+        ('codecatalyst', 'ListEventLogs'),
+        ('codecatalyst', 'ListProjects'),
+        ('codecatalyst', 'ListSourceRepositories'),
+        ('codecatalyst', 'ListSourceRepositoryBranches'),
+        ('codecatalyst', 'ListSpaces'),
+        ('codecatalyst', 'ListWorkflowRuns'),
+        ('codecatalyst', 'ListWorkflows'),
+        ('codecommit', 'BatchGetCommits'),
+        ('codecommit', 'BatchGetRepositories'),
+        ('codecommit', 'DescribeMergeConflicts'),
+        ('codecommit', 'DescribePullRequestEvents'),
+        ('codecommit', 'GetApprovalRuleTemplate'),
+        ('codecommit', 'GetBlob'),
+        ('codecommit', 'GetBranch'),
+        ('codecommit', 'GetComment'),
+        ('codecommit', 'GetCommentReactions'),
+        ('codecommit', 'GetCommentsForComparedCommit'),
+        ('codecommit', 'GetCommentsForPullRequest'),
+        ('codecommit', 'GetCommit'),
+        ('codecommit', 'GetDifferences'),
+        ('codecommit', 'GetFile'),
+        ('codecommit', 'GetFolder'),
+        ('codecommit', 'GetMergeCommit'),
+        ('codecommit', 'GetMergeConflicts'),
+        ('codecommit', 'GetMergeOptions'),
+        ('codecommit', 'GetPullRequest'),
+        ('codecommit', 'GetPullRequestApprovalStates'),
+        ('codecommit', 'GetPullRequestOverrideState'),
+        ('codecommit', 'GetRepository'),
+        ('codecommit', 'GetRepositoryTriggers'),
+        ('codecommit', 'ListApprovalRuleTemplates'),
+        ('codecommit', 'ListAssociatedApprovalRuleTemplatesForRepository'),
+        ('codecommit', 'ListBranches'),
+        ('codecommit', 'ListFileCommitHistory'),
+        ('codecommit', 'ListPullRequests'),
+        ('codecommit', 'ListRepositories'),
+        ('codecommit', 'ListRepositoriesForApprovalRuleTemplate'),
+        ('codecommit', 'ListTagsForResource'),
+        ('codecommit', 'credential-helper'),
+        ('codedeploy', 'BatchGetApplicationRevisions'),
+        ('codedeploy', 'BatchGetApplications'),
+        ('codedeploy', 'BatchGetDeploymentGroups'),
+        ('codedeploy', 'BatchGetDeploymentInstances'),
+        ('codedeploy', 'BatchGetDeploymentTargets'),
+        ('codedeploy', 'BatchGetDeployments'),
+        ('codedeploy', 'BatchGetOnPremisesInstances'),
+        ('codedeploy', 'GetApplication'),
+        ('codedeploy', 'GetApplicationRevision'),
+        ('codedeploy', 'GetDeployment'),
+        ('codedeploy', 'GetDeploymentConfig'),
+        ('codedeploy', 'GetDeploymentGroup'),
+        ('codedeploy', 'GetDeploymentInstance'),
+        ('codedeploy', 'GetDeploymentTarget'),
+        ('codedeploy', 'GetOnPremisesInstance'),
+        ('codedeploy', 'ListApplicationRevisions'),
+        ('codedeploy', 'ListApplications'),
+        ('codedeploy', 'ListDeploymentConfigs'),
+        ('codedeploy', 'ListDeploymentGroups'),
+        ('codedeploy', 'ListDeploymentInstances'),
+        ('codedeploy', 'ListDeploymentTargets'),
+        ('codedeploy', 'ListDeployments'),
+        ('codedeploy', 'ListGitHubAccountTokenNames'),
+        ('codedeploy', 'ListOnPremisesInstances'),
+        ('codedeploy', 'ListTagsForResource'),
+        ('codeguru-reviewer', 'DescribeCodeReview'),
+        ('codeguru-reviewer', 'DescribeRecommendationFeedback'),
+        ('codeguru-reviewer', 'DescribeRepositoryAssociation'),
+        ('codeguru-reviewer', 'ListCodeReviews'),
+        ('codeguru-reviewer', 'ListRecommendationFeedback'),
+        ('codeguru-reviewer', 'ListRecommendations'),
+        ('codeguru-reviewer', 'ListRepositoryAssociations'),
+        ('codeguru-reviewer', 'ListTagsForResource'),
+        ('codeguruprofiler', 'DescribeProfilingGroup'),
+        ('codeguruprofiler', 'GetFindingsReportAccountSummary'),
+        ('codeguruprofiler', 'GetNotificationConfiguration'),
+        ('codeguruprofiler', 'GetPolicy'),
+        ('codeguruprofiler', 'GetProfile'),
+        ('codeguruprofiler', 'GetRecommendations'),
+        ('codeguruprofiler', 'ListFindingsReports'),
+        ('codeguruprofiler', 'ListProfileTimes'),
+        ('codeguruprofiler', 'ListProfilingGroups'),
+        ('codeguruprofiler', 'ListTagsForResource'),
+        ('codepipeline', 'GetActionType'),
+        ('codepipeline', 'GetJobDetails'),
+        ('codepipeline', 'GetPipeline'),
+        ('codepipeline', 'GetPipelineExecution'),
+        ('codepipeline', 'GetPipelineState'),
+        ('codepipeline', 'GetThirdPartyJobDetails'),
+        ('codepipeline', 'ListActionExecutions'),
+        ('codepipeline', 'ListActionTypes'),
+        ('codepipeline', 'ListPipelineExecutions'),
+        ('codepipeline', 'ListPipelines'),
+        ('codepipeline', 'ListTagsForResource'),
+        ('codepipeline', 'ListWebhooks'),
+        ('codestar', 'DescribeProject'),
+        ('codestar', 'DescribeUserProfile'),
+        ('codestar', 'ListProjects'),
+        ('codestar', 'ListResources'),
+        ('codestar', 'ListTagsForProject'),
+        ('codestar', 'ListTeamMembers'),
+        ('codestar', 'ListUserProfiles'),
+        ('codestar-connections', 'GetConnection'),
+        ('codestar-connections', 'GetHost'),
+        ('codestar-connections', 'GetRepositoryLink'),
+        ('codestar-connections', 'GetRepositorySyncStatus'),
+        ('codestar-connections', 'GetResourceSyncStatus'),
+        ('codestar-connections', 'GetSyncBlockerSummary'),
+        ('codestar-connections', 'GetSyncConfiguration'),
+        ('codestar-connections', 'ListConnections'),
+        ('codestar-connections', 'ListHosts'),
+        ('codestar-connections', 'ListRepositoryLinks'),
+        ('codestar-connections', 'ListRepositorySyncDefinitions'),
+        ('codestar-connections', 'ListSyncConfigurations'),
+        ('codestar-connections', 'ListTagsForResource'),
+        ('codestar-notifications', 'DescribeNotificationRule'),
+        ('codestar-notifications', 'ListEventTypes'),
+        ('codestar-notifications', 'ListNotificationRules'),
+        ('codestar-notifications', 'ListTagsForResource'),
+        ('codestar-notifications', 'ListTargets'),
+        ('cognito-identity', 'DescribeIdentity'),
+        ('cognito-identity', 'DescribeIdentityPool'),
+        ('cognito-identity', 'GetCredentialsForIdentity'),
+        ('cognito-identity', 'GetIdentityPoolRoles'),
+        ('cognito-identity', 'GetOpenIdToken'),
+        ('cognito-identity', 'GetOpenIdTokenForDeveloperIdentity'),
+        ('cognito-identity', 'ListIdentities'),
+        ('cognito-identity', 'ListIdentityPools'),
+        ('cognito-identity', 'ListTagsForResource'),
+        ('cognito-identity', 'LookupDeveloperIdentity'),
+        ('cognito-idp', 'AdminGetDevice'),
+        ('cognito-idp', 'AdminGetUser'),
+        ('cognito-idp', 'AdminListDevices'),
+        ('cognito-idp', 'AdminListGroupsForUser'),
+        ('cognito-idp', 'AdminListUserAuthEvents'),
+        ('cognito-idp', 'DescribeIdentityProvider'),
+        ('cognito-idp', 'DescribeResourceServer'),
+        ('cognito-idp', 'DescribeRiskConfiguration'),
+        ('cognito-idp', 'DescribeUserImportJob'),
+        ('cognito-idp', 'DescribeUserPool'),
+        ('cognito-idp', 'DescribeUserPoolClient'),
+        ('cognito-idp', 'DescribeUserPoolDomain'),
+        ('cognito-idp', 'GetCSVHeader'),
+        ('cognito-idp', 'GetDevice'),
+        ('cognito-idp', 'GetGroup'),
+        ('cognito-idp', 'GetIdentityProviderByIdentifier'),
+        ('cognito-idp', 'GetLogDeliveryConfiguration'),
+        ('cognito-idp', 'GetSigningCertificate'),
+        ('cognito-idp', 'GetUICustomization'),
+        ('cognito-idp', 'GetUser'),
+        ('cognito-idp', 'GetUserAttributeVerificationCode'),
+        ('cognito-idp', 'GetUserPoolMfaConfig'),
+        ('cognito-idp', 'ListDevices'),
+        ('cognito-idp', 'ListGroups'),
+        ('cognito-idp', 'ListIdentityProviders'),
+        ('cognito-idp', 'ListResourceServers'),
+        ('cognito-idp', 'ListTagsForResource'),
+        ('cognito-idp', 'ListUserImportJobs'),
+        ('cognito-idp', 'ListUserPoolClients'),
+        ('cognito-idp', 'ListUserPools'),
+        ('cognito-idp', 'ListUsers'),
+        ('cognito-idp', 'ListUsersInGroup'),
+        ('cognito-sync', 'DescribeDataset'),
+        ('cognito-sync', 'DescribeIdentityPoolUsage'),
+        ('cognito-sync', 'DescribeIdentityUsage'),
+        ('cognito-sync', 'GetBulkPublishDetails'),
+        ('cognito-sync', 'GetCognitoEvents'),
+        ('cognito-sync', 'GetIdentityPoolConfiguration'),
+        ('cognito-sync', 'ListDatasets'),
+        ('cognito-sync', 'ListIdentityPoolUsage'),
+        ('cognito-sync', 'ListRecords'),
+        ('comprehend', 'BatchDetectDominantLanguage'),
+        ('comprehend', 'BatchDetectEntities'),
+        ('comprehend', 'BatchDetectKeyPhrases'),
+        ('comprehend', 'BatchDetectSentiment'),
+        ('comprehend', 'BatchDetectSyntax'),
+        ('comprehend', 'BatchDetectTargetedSentiment'),
+        ('comprehend', 'ClassifyDocument'),
+        ('comprehend', 'ContainsPiiEntities'),
+        ('comprehend', 'DescribeDataset'),
+        ('comprehend', 'DescribeDocumentClassificationJob'),
+        ('comprehend', 'DescribeDocumentClassifier'),
+        ('comprehend', 'DescribeDominantLanguageDetectionJob'),
+        ('comprehend', 'DescribeEndpoint'),
+        ('comprehend', 'DescribeEntitiesDetectionJob'),
+        ('comprehend', 'DescribeEntityRecognizer'),
+        ('comprehend', 'DescribeEventsDetectionJob'),
+        ('comprehend', 'DescribeFlywheel'),
+        ('comprehend', 'DescribeFlywheelIteration'),
+        ('comprehend', 'DescribeKeyPhrasesDetectionJob'),
+        ('comprehend', 'DescribePiiEntitiesDetectionJob'),
+        ('comprehend', 'DescribeResourcePolicy'),
+        ('comprehend', 'DescribeSentimentDetectionJob'),
+        ('comprehend', 'DescribeTargetedSentimentDetectionJob'),
+        ('comprehend', 'DescribeTopicsDetectionJob'),
+        ('comprehend', 'DetectDominantLanguage'),
+        ('comprehend', 'DetectEntities'),
+        ('comprehend', 'DetectKeyPhrases'),
+        ('comprehend', 'DetectPiiEntities'),
+        ('comprehend', 'DetectSentiment'),
+        ('comprehend', 'DetectSyntax'),
+        ('comprehend', 'DetectTargetedSentiment'),
+        ('comprehend', 'DetectToxicContent'),
+        ('comprehend', 'ListDatasets'),
+        ('comprehend', 'ListDocumentClassificationJobs'),
+        ('comprehend', 'ListDocumentClassifierSummaries'),
+        ('comprehend', 'ListDocumentClassifiers'),
+        ('comprehend', 'ListDominantLanguageDetectionJobs'),
+        ('comprehend', 'ListEndpoints'),
+        ('comprehend', 'ListEntitiesDetectionJobs'),
+        ('comprehend', 'ListEntityRecognizerSummaries'),
+        ('comprehend', 'ListEntityRecognizers'),
+        ('comprehend', 'ListEventsDetectionJobs'),
+        ('comprehend', 'ListFlywheelIterationHistory'),
+        ('comprehend', 'ListFlywheels'),
+        ('comprehend', 'ListKeyPhrasesDetectionJobs'),
+        ('comprehend', 'ListPiiEntitiesDetectionJobs'),
+        ('comprehend', 'ListSentimentDetectionJobs'),
+        ('comprehend', 'ListTagsForResource'),
+        ('comprehend', 'ListTargetedSentimentDetectionJobs'),
+        ('comprehend', 'ListTopicsDetectionJobs'),
+        ('compute-optimizer', 'DescribeRecommendationExportJobs'),
+        ('compute-optimizer', 'GetAutoScalingGroupRecommendations'),
+        ('compute-optimizer', 'GetEBSVolumeRecommendations'),
+        ('compute-optimizer', 'GetEC2InstanceRecommendations'),
+        ('compute-optimizer', 'GetEC2RecommendationProjectedMetrics'),
+        ('compute-optimizer', 'GetECSServiceRecommendationProjectedMetrics'),
+        ('compute-optimizer', 'GetECSServiceRecommendations'),
+        ('compute-optimizer', 'GetEffectiveRecommendationPreferences'),
+        ('compute-optimizer', 'GetEnrollmentStatus'),
+        ('compute-optimizer', 'GetEnrollmentStatusesForOrganization'),
+        ('compute-optimizer', 'GetLambdaFunctionRecommendations'),
+        ('compute-optimizer', 'GetLicenseRecommendations'),
+        ('compute-optimizer', 'GetRecommendationPreferences'),
+        ('compute-optimizer', 'GetRecommendationSummaries'),
+        ('config', 'BatchGetAggregateResourceConfig'),
+        ('config', 'BatchGetResourceConfig'),
+        ('config', 'DeliverConfigSnapshot'),
+        ('config', 'DescribeAggregateComplianceByConfigRules'),
+        ('config', 'DescribeAggregateComplianceByConformancePacks'),
+        ('config', 'DescribeAggregationAuthorizations'),
+        ('config', 'DescribeComplianceByConfigRule'),
+        ('config', 'DescribeComplianceByResource'),
+        ('config', 'DescribeConfigRuleEvaluationStatus'),
+        ('config', 'DescribeConfigRules'),
+        ('config', 'DescribeConfigurationAggregatorSourcesStatus'),
+        ('config', 'DescribeConfigurationAggregators'),
+        ('config', 'DescribeConfigurationRecorderStatus'),
+        ('config', 'DescribeConfigurationRecorders'),
+        ('config', 'DescribeConformancePackCompliance'),
+        ('config', 'DescribeConformancePackStatus'),
+        ('config', 'DescribeConformancePacks'),
+        ('config', 'DescribeDeliveryChannelStatus'),
+        ('config', 'DescribeDeliveryChannels'),
+        ('config', 'DescribeOrganizationConfigRuleStatuses'),
+        ('config', 'DescribeOrganizationConfigRules'),
+        ('config', 'DescribeOrganizationConformancePackStatuses'),
+        ('config', 'DescribeOrganizationConformancePacks'),
+        ('config', 'DescribePendingAggregationRequests'),
+        ('config', 'DescribeRemediationConfigurations'),
+        ('config', 'DescribeRemediationExceptions'),
+        ('config', 'DescribeRemediationExecutionStatus'),
+        ('config', 'DescribeRetentionConfigurations'),
+        ('config', 'GetAggregateComplianceDetailsByConfigRule'),
+        ('config', 'GetAggregateConfigRuleComplianceSummary'),
+        ('config', 'GetAggregateConformancePackComplianceSummary'),
+        ('config', 'GetAggregateDiscoveredResourceCounts'),
+        ('config', 'GetAggregateResourceConfig'),
+        ('config', 'GetComplianceDetailsByConfigRule'),
+        ('config', 'GetComplianceDetailsByResource'),
+        ('config', 'GetComplianceSummaryByConfigRule'),
+        ('config', 'GetComplianceSummaryByResourceType'),
+        ('config', 'GetConformancePackComplianceDetails'),
+        ('config', 'GetConformancePackComplianceSummary'),
+        ('config', 'GetCustomRulePolicy'),
+        ('config', 'GetDiscoveredResourceCounts'),
+        ('config', 'GetOrganizationConfigRuleDetailedStatus'),
+        ('config', 'GetOrganizationConformancePackDetailedStatus'),
+        ('config', 'GetOrganizationCustomRulePolicy'),
+        ('config', 'GetResourceConfigHistory'),
+        ('config', 'GetResourceEvaluationSummary'),
+        ('config', 'GetStoredQuery'),
+        ('config', 'ListAggregateDiscoveredResources'),
+        ('config', 'ListConformancePackComplianceScores'),
+        ('config', 'ListDiscoveredResources'),
+        ('config', 'ListResourceEvaluations'),
+        ('config', 'ListStoredQueries'),
+        ('config', 'ListTagsForResource'),
+        ('config', 'SelectAggregateResourceConfig'),
+        ('config', 'SelectResourceConfig'),
+        ('configservice', 'get-status'),
+        ('connect', 'DescribeAgentStatus'),
+        ('connect', 'DescribeContact'),
+        ('connect', 'DescribeContactEvaluation'),
+        ('connect', 'DescribeContactFlow'),
+        ('connect', 'DescribeContactFlowModule'),
+        ('connect', 'DescribeEvaluationForm'),
+        ('connect', 'DescribeHoursOfOperation'),
+        ('connect', 'DescribeInstance'),
+        ('connect', 'DescribeInstanceAttribute'),
+        ('connect', 'DescribeInstanceStorageConfig'),
+        ('connect', 'DescribePhoneNumber'),
+        ('connect', 'DescribePredefinedAttribute'),
+        ('connect', 'DescribePrompt'),
+        ('connect', 'DescribeQueue'),
+        ('connect', 'DescribeQuickConnect'),
+        ('connect', 'DescribeRoutingProfile'),
+        ('connect', 'DescribeRule'),
+        ('connect', 'DescribeSecurityProfile'),
+        ('connect', 'DescribeTrafficDistributionGroup'),
+        ('connect', 'DescribeUser'),
+        ('connect', 'DescribeUserHierarchyGroup'),
+        ('connect', 'DescribeUserHierarchyStructure'),
+        ('connect', 'DescribeView'),
+        ('connect', 'DescribeVocabulary'),
+        ('connect', 'GetContactAttributes'),
+        ('connect', 'GetCurrentMetricData'),
+        ('connect', 'GetCurrentUserData'),
+        ('connect', 'GetFederationToken'),
+        ('connect', 'GetMetricData'),
+        ('connect', 'GetMetricDataV2'),
+        ('connect', 'GetTaskTemplate'),
+        ('connect', 'GetTrafficDistribution'),
+        ('connect', 'ListAgentStatuses'),
+        ('connect', 'ListAnalyticsDataAssociations'),
+        ('connect', 'ListApprovedOrigins'),
+        ('connect', 'ListBots'),
+        ('connect', 'ListContactEvaluations'),
+        ('connect', 'ListContactFlowModules'),
+        ('connect', 'ListContactFlows'),
+        ('connect', 'ListContactReferences'),
+        ('connect', 'ListDefaultVocabularies'),
+        ('connect', 'ListEvaluationFormVersions'),
+        ('connect', 'ListEvaluationForms'),
+        ('connect', 'ListFlowAssociations'),
+        ('connect', 'ListHoursOfOperations'),
+        ('connect', 'ListInstanceAttributes'),
+        ('connect', 'ListInstanceStorageConfigs'),
+        ('connect', 'ListInstances'),
+        ('connect', 'ListIntegrationAssociations'),
+        ('connect', 'ListLambdaFunctions'),
+        ('connect', 'ListLexBots'),
+        ('connect', 'ListPhoneNumbers'),
+        ('connect', 'ListPhoneNumbersV2'),
+        ('connect', 'ListPredefinedAttributes'),
+        ('connect', 'ListPrompts'),
+        ('connect', 'ListQueueQuickConnects'),
+        ('connect', 'ListQueues'),
+        ('connect', 'ListQuickConnects'),
+        ('connect', 'ListRealtimeContactAnalysisSegmentsV2'),
+        ('connect', 'ListRoutingProfileQueues'),
+        ('connect', 'ListRoutingProfiles'),
+        ('connect', 'ListRules'),
+        ('connect', 'ListSecurityKeys'),
+        ('connect', 'ListSecurityProfileApplications'),
+        ('connect', 'ListSecurityProfilePermissions'),
+        ('connect', 'ListSecurityProfiles'),
+        ('connect', 'ListTagsForResource'),
+        ('connect', 'ListTaskTemplates'),
+        ('connect', 'ListTrafficDistributionGroupUsers'),
+        ('connect', 'ListTrafficDistributionGroups'),
+        ('connect', 'ListUseCases'),
+        ('connect', 'ListUserHierarchyGroups'),
+        ('connect', 'ListUserProficiencies'),
+        ('connect', 'ListUsers'),
+        ('connect', 'ListViewVersions'),
+        ('connect', 'ListViews'),
+        ('connect-contact-lens', 'ListRealtimeContactAnalysisSegments'),
+        ('cost-optimization-hub', 'GetPreferences'),
+        ('cost-optimization-hub', 'GetRecommendation'),
+        ('cost-optimization-hub', 'ListEnrollmentStatuses'),
+        ('cost-optimization-hub', 'ListRecommendationSummaries'),
+        ('cost-optimization-hub', 'ListRecommendations'),
+        ('cur', 'DescribeReportDefinitions'),
+        ('cur', 'ListTagsForResource'),
+        ('databrew', 'DescribeDataset'),
+        ('databrew', 'DescribeJob'),
+        ('databrew', 'DescribeJobRun'),
+        ('databrew', 'DescribeProject'),
+        ('databrew', 'DescribeRecipe'),
+        ('databrew', 'DescribeRuleset'),
+        ('databrew', 'DescribeSchedule'),
+        ('databrew', 'ListDatasets'),
+        ('databrew', 'ListJobRuns'),
+        ('databrew', 'ListJobs'),
+        ('databrew', 'ListProjects'),
+        ('databrew', 'ListRecipeVersions'),
+        ('databrew', 'ListRecipes'),
+        ('databrew', 'ListRulesets'),
+        ('databrew', 'ListSchedules'),
+        ('databrew', 'ListTagsForResource'),
+        ('dataexchange', 'GetAsset'),
+        ('dataexchange', 'GetDataSet'),
+        ('dataexchange', 'GetEventAction'),
+        ('dataexchange', 'GetJob'),
+        ('dataexchange', 'GetRevision'),
+        ('dataexchange', 'ListDataSetRevisions'),
+        ('dataexchange', 'ListDataSets'),
+        ('dataexchange', 'ListEventActions'),
+        ('dataexchange', 'ListJobs'),
+        ('dataexchange', 'ListRevisionAssets'),
+        ('dataexchange', 'ListTagsForResource'),
+        ('datapipeline', 'DescribeObjects'),
+        ('datapipeline', 'DescribePipelines'),
+        ('datapipeline', 'EvaluateExpression'),
+        ('datapipeline', 'GetPipelineDefinition'),
+        ('datapipeline', 'ListPipelines'),
+        ('datapipeline', 'QueryObjects'),
+        ('datapipeline', 'ValidatePipelineDefinition'),
+        ('datapipeline', 'list-runs'),
+        ('datasync', 'DescribeAgent'),
+        ('datasync', 'DescribeDiscoveryJob'),
+        ('datasync', 'DescribeLocationAzureBlob'),
+        ('datasync', 'DescribeLocationEfs'),
+        ('datasync', 'DescribeLocationFsxLustre'),
+        ('datasync', 'DescribeLocationFsxOntap'),
+        ('datasync', 'DescribeLocationFsxOpenZfs'),
+        ('datasync', 'DescribeLocationFsxWindows'),
+        ('datasync', 'DescribeLocationHdfs'),
+        ('datasync', 'DescribeLocationNfs'),
+        ('datasync', 'DescribeLocationObjectStorage'),
+        ('datasync', 'DescribeLocationS3'),
+        ('datasync', 'DescribeLocationSmb'),
+        ('datasync', 'DescribeStorageSystem'),
+        ('datasync', 'DescribeStorageSystemResourceMetrics'),
+        ('datasync', 'DescribeStorageSystemResources'),
+        ('datasync', 'DescribeTask'),
+        ('datasync', 'DescribeTaskExecution'),
+        ('datasync', 'ListAgents'),
+        ('datasync', 'ListDiscoveryJobs'),
+        ('datasync', 'ListLocations'),
+        ('datasync', 'ListStorageSystems'),
+        ('datasync', 'ListTagsForResource'),
+        ('datasync', 'ListTaskExecutions'),
+        ('datasync', 'ListTasks'),
+        ('dax', 'DescribeClusters'),
+        ('dax', 'DescribeDefaultParameters'),
+        ('dax', 'DescribeEvents'),
+        ('dax', 'DescribeParameterGroups'),
+        ('dax', 'DescribeParameters'),
+        ('dax', 'DescribeSubnetGroups'),
+        ('dax', 'ListTags'),
+        ('detective', 'BatchGetGraphMemberDatasources'),
+        ('detective', 'BatchGetMembershipDatasources'),
+        ('detective', 'GetInvestigation'),
+        ('detective', 'GetMembers'),
+        ('detective', 'ListDatasourcePackages'),
+        ('detective', 'ListGraphs'),
+        ('detective', 'ListIndicators'),
+        ('detective', 'ListInvestigations'),
+        ('detective', 'ListInvitations'),
+        ('detective', 'ListMembers'),
+        ('detective', 'ListOrganizationAdminAccounts'),
+        ('detective', 'ListTagsForResource'),
+        ('devicefarm', 'GetAccountSettings'),
+        ('devicefarm', 'GetDevice'),
+        ('devicefarm', 'GetDeviceInstance'),
+        ('devicefarm', 'GetDevicePool'),
+        ('devicefarm', 'GetDevicePoolCompatibility'),
+        ('devicefarm', 'GetInstanceProfile'),
+        ('devicefarm', 'GetJob'),
+        ('devicefarm', 'GetNetworkProfile'),
+        ('devicefarm', 'GetOfferingStatus'),
+        ('devicefarm', 'GetProject'),
+        ('devicefarm', 'GetRemoteAccessSession'),
+        ('devicefarm', 'GetRun'),
+        ('devicefarm', 'GetSuite'),
+        ('devicefarm', 'GetTest'),
+        ('devicefarm', 'GetTestGridProject'),
+        ('devicefarm', 'GetTestGridSession'),
+        ('devicefarm', 'GetUpload'),
+        ('devicefarm', 'GetVPCEConfiguration'),
+        ('devicefarm', 'ListArtifacts'),
+        ('devicefarm', 'ListDeviceInstances'),
+        ('devicefarm', 'ListDevicePools'),
+        ('devicefarm', 'ListDevices'),
+        ('devicefarm', 'ListInstanceProfiles'),
+        ('devicefarm', 'ListJobs'),
+        ('devicefarm', 'ListNetworkProfiles'),
+        ('devicefarm', 'ListOfferingPromotions'),
+        ('devicefarm', 'ListOfferingTransactions'),
+        ('devicefarm', 'ListOfferings'),
+        ('devicefarm', 'ListProjects'),
+        ('devicefarm', 'ListRemoteAccessSessions'),
+        ('devicefarm', 'ListRuns'),
+        ('devicefarm', 'ListSamples'),
+        ('devicefarm', 'ListSuites'),
+        ('devicefarm', 'ListTagsForResource'),
+        ('devicefarm', 'ListTestGridProjects'),
+        ('devicefarm', 'ListTestGridSessionActions'),
+        ('devicefarm', 'ListTestGridSessionArtifacts'),
+        ('devicefarm', 'ListTestGridSessions'),
+        ('devicefarm', 'ListTests'),
+        ('devicefarm', 'ListUniqueProblems'),
+        ('devicefarm', 'ListUploads'),
+        ('devicefarm', 'ListVPCEConfigurations'),
+        ('devops-guru', 'DescribeAccountHealth'),
+        ('devops-guru', 'DescribeAccountOverview'),
+        ('devops-guru', 'DescribeAnomaly'),
+        ('devops-guru', 'DescribeEventSourcesConfig'),
+        ('devops-guru', 'DescribeFeedback'),
+        ('devops-guru', 'DescribeInsight'),
+        ('devops-guru', 'DescribeOrganizationHealth'),
+        ('devops-guru', 'DescribeOrganizationOverview'),
+        ('devops-guru', 'DescribeOrganizationResourceCollectionHealth'),
+        ('devops-guru', 'DescribeResourceCollectionHealth'),
+        ('devops-guru', 'DescribeServiceIntegration'),
+        ('devops-guru', 'GetCostEstimation'),
+        ('devops-guru', 'GetResourceCollection'),
+        ('devops-guru', 'ListAnomaliesForInsight'),
+        ('devops-guru', 'ListAnomalousLogGroups'),
+        ('devops-guru', 'ListEvents'),
+        ('devops-guru', 'ListInsights'),
+        ('devops-guru', 'ListMonitoredResources'),
+        ('devops-guru', 'ListNotificationChannels'),
+        ('devops-guru', 'ListOrganizationInsights'),
+        ('devops-guru', 'ListRecommendations'),
+        ('devops-guru', 'SearchInsights'),
+        ('devops-guru', 'StartCostEstimation'),
+        ('directconnect', 'DescribeConnectionLoa'),
+        ('directconnect', 'DescribeConnections'),
+        ('directconnect', 'DescribeConnectionsOnInterconnect'),
+        ('directconnect', 'DescribeCustomerMetadata'),
+        ('directconnect', 'DescribeDirectConnectGatewayAssociationProposals'),
+        ('directconnect', 'DescribeDirectConnectGatewayAssociations'),
+        ('directconnect', 'DescribeDirectConnectGatewayAttachments'),
+        ('directconnect', 'DescribeDirectConnectGateways'),
+        ('directconnect', 'DescribeHostedConnections'),
+        ('directconnect', 'DescribeInterconnectLoa'),
+        ('directconnect', 'DescribeInterconnects'),
+        ('directconnect', 'DescribeLags'),
+        ('directconnect', 'DescribeLoa'),
+        ('directconnect', 'DescribeLocations'),
+        ('directconnect', 'DescribeRouterConfiguration'),
+        ('directconnect', 'DescribeTags'),
+        ('directconnect', 'DescribeVirtualGateways'),
+        ('directconnect', 'DescribeVirtualInterfaces'),
+        ('discovery', 'DescribeAgents'),
+        ('discovery', 'DescribeBatchDeleteConfigurationTask'),
+        ('discovery', 'DescribeConfigurations'),
+        ('discovery', 'DescribeContinuousExports'),
+        ('discovery', 'DescribeExportConfigurations'),
+        ('discovery', 'DescribeExportTasks'),
+        ('discovery', 'DescribeImportTasks'),
+        ('discovery', 'DescribeTags'),
+        ('discovery', 'GetDiscoverySummary'),
+        ('discovery', 'ListConfigurations'),
+        ('discovery', 'ListServerNeighbors'),
+        ('dlm', 'GetLifecyclePolicies'),
+        ('dlm', 'GetLifecyclePolicy'),
+        ('dms', 'DescribeAccountAttributes'),
+        ('dms', 'DescribeApplicableIndividualAssessments'),
+        ('dms', 'DescribeCertificates'),
+        ('dms', 'DescribeConnections'),
+        ('dms', 'DescribeConversionConfiguration'),
+        ('dms', 'DescribeDataProviders'),
+        ('dms', 'DescribeEndpointSettings'),
+        ('dms', 'DescribeEndpointTypes'),
+        ('dms', 'DescribeEndpoints'),
+        ('dms', 'DescribeEngineVersions'),
+        ('dms', 'DescribeEventCategories'),
+        ('dms', 'DescribeEventSubscriptions'),
+        ('dms', 'DescribeEvents'),
+        ('dms', 'DescribeExtensionPackAssociations'),
+        ('dms', 'DescribeFleetAdvisorCollectors'),
+        ('dms', 'DescribeFleetAdvisorDatabases'),
+        ('dms', 'DescribeFleetAdvisorLsaAnalysis'),
+        ('dms', 'DescribeFleetAdvisorSchemaObjectSummary'),
+        ('dms', 'DescribeFleetAdvisorSchemas'),
+        ('dms', 'DescribeInstanceProfiles'),
+        ('dms', 'DescribeMetadataModelAssessments'),
+        ('dms', 'DescribeMetadataModelConversions'),
+        ('dms', 'DescribeMetadataModelExportsAsScript'),
+        ('dms', 'DescribeMetadataModelExportsToTarget'),
+        ('dms', 'DescribeMetadataModelImports'),
+        ('dms', 'DescribeMigrationProjects'),
+        ('dms', 'DescribeOrderableReplicationInstances'),
+        ('dms', 'DescribePendingMaintenanceActions'),
+        ('dms', 'DescribeRecommendationLimitations'),
+        ('dms', 'DescribeRecommendations'),
+        ('dms', 'DescribeRefreshSchemasStatus'),
+        ('dms', 'DescribeReplicationConfigs'),
+        ('dms', 'DescribeReplicationInstanceTaskLogs'),
+        ('dms', 'DescribeReplicationInstances'),
+        ('dms', 'DescribeReplicationSubnetGroups'),
+        ('dms', 'DescribeReplicationTableStatistics'),
+        ('dms', 'DescribeReplicationTaskAssessmentResults'),
+        ('dms', 'DescribeReplicationTaskAssessmentRuns'),
+        ('dms', 'DescribeReplicationTaskIndividualAssessments'),
+        ('dms', 'DescribeReplicationTasks'),
+        ('dms', 'DescribeReplications'),
+        ('dms', 'DescribeSchemas'),
+        ('dms', 'DescribeTableStatistics'),
+        ('dms', 'ListTagsForResource'),
+        ('dms', 'TestConnection'),
+        ('docdb', 'DescribeCertificates'),
+        ('docdb', 'DescribeDBClusterParameterGroups'),
+        ('docdb', 'DescribeDBClusterParameters'),
+        ('docdb', 'DescribeDBClusterSnapshotAttributes'),
+        ('docdb', 'DescribeDBClusterSnapshots'),
+        ('docdb', 'DescribeDBClusters'),
+        ('docdb', 'DescribeDBEngineVersions'),
+        ('docdb', 'DescribeDBInstances'),
+        ('docdb', 'DescribeDBSubnetGroups'),
+        ('docdb', 'DescribeEngineDefaultClusterParameters'),
+        ('docdb', 'DescribeEventCategories'),
+        ('docdb', 'DescribeEventSubscriptions'),
+        ('docdb', 'DescribeEvents'),
+        ('docdb', 'DescribeGlobalClusters'),
+        ('docdb', 'DescribeOrderableDBInstanceOptions'),
+        ('docdb', 'DescribePendingMaintenanceActions'),
+        ('docdb', 'ListTagsForResource'),
+        ('drs', 'DescribeJobLogItems'),
+        ('drs', 'DescribeJobs'),
+        ('drs', 'DescribeLaunchConfigurationTemplates'),
+        ('drs', 'DescribeRecoveryInstances'),
+        ('drs', 'DescribeRecoverySnapshots'),
+        ('drs', 'DescribeReplicationConfigurationTemplates'),
+        ('drs', 'DescribeSourceNetworks'),
+        ('drs', 'DescribeSourceServers'),
+        ('drs', 'GetFailbackReplicationConfiguration'),
+        ('drs', 'GetLaunchConfiguration'),
+        ('drs', 'GetReplicationConfiguration'),
+        ('drs', 'ListExtensibleSourceServers'),
+        ('drs', 'ListLaunchActions'),
+        ('drs', 'ListStagingAccounts'),
+        ('drs', 'ListTagsForResource'),
+        ('ds', 'DescribeCertificate'),
+        ('ds', 'DescribeClientAuthenticationSettings'),
+        ('ds', 'DescribeConditionalForwarders'),
+        ('ds', 'DescribeDirectories'),
+        ('ds', 'DescribeDomainControllers'),
+        ('ds', 'DescribeEventTopics'),
+        ('ds', 'DescribeLDAPSSettings'),
+        ('ds', 'DescribeRegions'),
+        ('ds', 'DescribeSettings'),
+        ('ds', 'DescribeSharedDirectories'),
+        ('ds', 'DescribeSnapshots'),
+        ('ds', 'DescribeTrusts'),
+        ('ds', 'DescribeUpdateDirectory'),
+        ('ds', 'GetDirectoryLimits'),
+        ('ds', 'GetSnapshotLimits'),
+        ('ds', 'ListCertificates'),
+        ('ds', 'ListIpRoutes'),
+        ('ds', 'ListLogSubscriptions'),
+        ('ds', 'ListSchemaExtensions'),
+        ('ds', 'ListTagsForResource'),
+        ('ds', 'VerifyTrust'),
+        ('dynamodb', 'BatchGetItem'),
+        ('dynamodb', 'DescribeBackup'),
+        ('dynamodb', 'DescribeContinuousBackups'),
+        ('dynamodb', 'DescribeContributorInsights'),
+        ('dynamodb', 'DescribeEndpoints'),
+        ('dynamodb', 'DescribeExport'),
+        ('dynamodb', 'DescribeGlobalTable'),
+        ('dynamodb', 'DescribeGlobalTableSettings'),
+        ('dynamodb', 'DescribeImport'),
+        ('dynamodb', 'DescribeKinesisStreamingDestination'),
+        ('dynamodb', 'DescribeLimits'),
+        ('dynamodb', 'DescribeTable'),
+        ('dynamodb', 'DescribeTableReplicaAutoScaling'),
+        ('dynamodb', 'DescribeTimeToLive'),
+        ('dynamodb', 'GetItem'),
+        ('dynamodb', 'GetResourcePolicy'),
+        ('dynamodb', 'ListBackups'),
+        ('dynamodb', 'ListContributorInsights'),
+        ('dynamodb', 'ListExports'),
+        ('dynamodb', 'ListGlobalTables'),
+        ('dynamodb', 'ListImports'),
+        ('dynamodb', 'ListTables'),
+        ('dynamodb', 'ListTagsOfResource'),
+        ('dynamodb', 'Query'),
+        ('dynamodb', 'Scan'),
+        ('dynamodbstreams', 'DescribeStream'),
+        ('dynamodbstreams', 'GetRecords'),
+        ('dynamodbstreams', 'GetShardIterator'),
+        ('dynamodbstreams', 'ListStreams'),
+        ('ec2', 'DescribeAccountAttributes'),
+        ('ec2', 'DescribeAddressTransfers'),
+        ('ec2', 'DescribeAddresses'),
+        ('ec2', 'DescribeAddressesAttribute'),
+        ('ec2', 'DescribeAggregateIdFormat'),
+        ('ec2', 'DescribeAvailabilityZones'),
+        ('ec2', 'DescribeAwsNetworkPerformanceMetricSubscriptions'),
+        ('ec2', 'DescribeBundleTasks'),
+        ('ec2', 'DescribeByoipCidrs'),
+        ('ec2', 'DescribeCapacityBlockOfferings'),
+        ('ec2', 'DescribeCapacityReservationFleets'),
+        ('ec2', 'DescribeCapacityReservations'),
+        ('ec2', 'DescribeCarrierGateways'),
+        ('ec2', 'DescribeClassicLinkInstances'),
+        ('ec2', 'DescribeClientVpnAuthorizationRules'),
+        ('ec2', 'DescribeClientVpnConnections'),
+        ('ec2', 'DescribeClientVpnEndpoints'),
+        ('ec2', 'DescribeClientVpnRoutes'),
+        ('ec2', 'DescribeClientVpnTargetNetworks'),
+        ('ec2', 'DescribeCoipPools'),
+        ('ec2', 'DescribeConversionTasks'),
+        ('ec2', 'DescribeCustomerGateways'),
+        ('ec2', 'DescribeDhcpOptions'),
+        ('ec2', 'DescribeEgressOnlyInternetGateways'),
+        ('ec2', 'DescribeElasticGpus'),
+        ('ec2', 'DescribeExportImageTasks'),
+        ('ec2', 'DescribeExportTasks'),
+        ('ec2', 'DescribeFastLaunchImages'),
+        ('ec2', 'DescribeFastSnapshotRestores'),
+        ('ec2', 'DescribeFleetHistory'),
+        ('ec2', 'DescribeFleetInstances'),
+        ('ec2', 'DescribeFleets'),
+        ('ec2', 'DescribeFlowLogs'),
+        ('ec2', 'DescribeFpgaImageAttribute'),
+        ('ec2', 'DescribeFpgaImages'),
+        ('ec2', 'DescribeHostReservationOfferings'),
+        ('ec2', 'DescribeHostReservations'),
+        ('ec2', 'DescribeHosts'),
+        ('ec2', 'DescribeIamInstanceProfileAssociations'),
+        ('ec2', 'DescribeIdFormat'),
+        ('ec2', 'DescribeIdentityIdFormat'),
+        ('ec2', 'DescribeImageAttribute'),
+        ('ec2', 'DescribeImages'),
+        ('ec2', 'DescribeImportImageTasks'),
+        ('ec2', 'DescribeImportSnapshotTasks'),
+        ('ec2', 'DescribeInstanceAttribute'),
+        ('ec2', 'DescribeInstanceConnectEndpoints'),
+        ('ec2', 'DescribeInstanceCreditSpecifications'),
+        ('ec2', 'DescribeInstanceEventNotificationAttributes'),
+        ('ec2', 'DescribeInstanceEventWindows'),
+        ('ec2', 'DescribeInstanceStatus'),
+        ('ec2', 'DescribeInstanceTopology'),
+        ('ec2', 'DescribeInstanceTypeOfferings'),
+        ('ec2', 'DescribeInstanceTypes'),
+        ('ec2', 'DescribeInstances'),
+        ('ec2', 'DescribeInternetGateways'),
+        ('ec2', 'DescribeIpamByoasn'),
+        ('ec2', 'DescribeIpamPools'),
+        ('ec2', 'DescribeIpamResourceDiscoveries'),
+        ('ec2', 'DescribeIpamResourceDiscoveryAssociations'),
+        ('ec2', 'DescribeIpamScopes'),
+        ('ec2', 'DescribeIpams'),
+        ('ec2', 'DescribeIpv6Pools'),
+        ('ec2', 'DescribeKeyPairs'),
+        ('ec2', 'DescribeLaunchTemplateVersions'),
+        ('ec2', 'DescribeLaunchTemplates'),
+        ('ec2', 'DescribeLocalGatewayRouteTableVirtualInterfaceGroupAssociations'),
+        ('ec2', 'DescribeLocalGatewayRouteTableVpcAssociations'),
+        ('ec2', 'DescribeLocalGatewayRouteTables'),
+        ('ec2', 'DescribeLocalGatewayVirtualInterfaceGroups'),
+        ('ec2', 'DescribeLocalGatewayVirtualInterfaces'),
+        ('ec2', 'DescribeLocalGateways'),
+        ('ec2', 'DescribeLockedSnapshots'),
+        ('ec2', 'DescribeMacHosts'),
+        ('ec2', 'DescribeManagedPrefixLists'),
+        ('ec2', 'DescribeMovingAddresses'),
+        ('ec2', 'DescribeNatGateways'),
+        ('ec2', 'DescribeNetworkAcls'),
+        ('ec2', 'DescribeNetworkInsightsAccessScopeAnalyses'),
+        ('ec2', 'DescribeNetworkInsightsAccessScopes'),
+        ('ec2', 'DescribeNetworkInsightsAnalyses'),
+        ('ec2', 'DescribeNetworkInsightsPaths'),
+        ('ec2', 'DescribeNetworkInterfaceAttribute'),
+        ('ec2', 'DescribeNetworkInterfacePermissions'),
+        ('ec2', 'DescribeNetworkInterfaces'),
+        ('ec2', 'DescribePlacementGroups'),
+        ('ec2', 'DescribePrefixLists'),
+        ('ec2', 'DescribePrincipalIdFormat'),
+        ('ec2', 'DescribePublicIpv4Pools'),
+        ('ec2', 'DescribeRegions'),
+        ('ec2', 'DescribeReplaceRootVolumeTasks'),
+        ('ec2', 'DescribeReservedInstances'),
+        ('ec2', 'DescribeReservedInstancesListings'),
+        ('ec2', 'DescribeReservedInstancesModifications'),
+        ('ec2', 'DescribeReservedInstancesOfferings'),
+        ('ec2', 'DescribeRouteTables'),
+        ('ec2', 'DescribeScheduledInstanceAvailability'),
+        ('ec2', 'DescribeScheduledInstances'),
+        ('ec2', 'DescribeSecurityGroupReferences'),
+        ('ec2', 'DescribeSecurityGroupRules'),
+        ('ec2', 'DescribeSecurityGroups'),
+        ('ec2', 'DescribeSnapshotAttribute'),
+        ('ec2', 'DescribeSnapshotTierStatus'),
+        ('ec2', 'DescribeSnapshots'),
+        ('ec2', 'DescribeSpotDatafeedSubscription'),
+        ('ec2', 'DescribeSpotFleetInstances'),
+        ('ec2', 'DescribeSpotFleetRequestHistory'),
+        ('ec2', 'DescribeSpotFleetRequests'),
+        ('ec2', 'DescribeSpotInstanceRequests'),
+        ('ec2', 'DescribeSpotPriceHistory'),
+        ('ec2', 'DescribeStaleSecurityGroups'),
+        ('ec2', 'DescribeStoreImageTasks'),
+        ('ec2', 'DescribeSubnets'),
+        ('ec2', 'DescribeTags'),
+        ('ec2', 'DescribeTrafficMirrorFilters'),
+        ('ec2', 'DescribeTrafficMirrorSessions'),
+        ('ec2', 'DescribeTrafficMirrorTargets'),
+        ('ec2', 'DescribeTransitGatewayAttachments'),
+        ('ec2', 'DescribeTransitGatewayConnectPeers'),
+        ('ec2', 'DescribeTransitGatewayConnects'),
+        ('ec2', 'DescribeTransitGatewayMulticastDomains'),
+        ('ec2', 'DescribeTransitGatewayPeeringAttachments'),
+        ('ec2', 'DescribeTransitGatewayPolicyTables'),
+        ('ec2', 'DescribeTransitGatewayRouteTableAnnouncements'),
+        ('ec2', 'DescribeTransitGatewayRouteTables'),
+        ('ec2', 'DescribeTransitGatewayVpcAttachments'),
+        ('ec2', 'DescribeTransitGateways'),
+        ('ec2', 'DescribeTrunkInterfaceAssociations'),
+        ('ec2', 'DescribeVerifiedAccessEndpoints'),
+        ('ec2', 'DescribeVerifiedAccessGroups'),
+        ('ec2', 'DescribeVerifiedAccessInstanceLoggingConfigurations'),
+        ('ec2', 'DescribeVerifiedAccessInstances'),
+        ('ec2', 'DescribeVerifiedAccessTrustProviders'),
+        ('ec2', 'DescribeVolumeAttribute'),
+        ('ec2', 'DescribeVolumeStatus'),
+        ('ec2', 'DescribeVolumes'),
+        ('ec2', 'DescribeVolumesModifications'),
+        ('ec2', 'DescribeVpcAttribute'),
+        ('ec2', 'DescribeVpcClassicLink'),
+        ('ec2', 'DescribeVpcClassicLinkDnsSupport'),
+        ('ec2', 'DescribeVpcEndpointConnectionNotifications'),
+        ('ec2', 'DescribeVpcEndpointConnections'),
+        ('ec2', 'DescribeVpcEndpointServiceConfigurations'),
+        ('ec2', 'DescribeVpcEndpointServicePermissions'),
+        ('ec2', 'DescribeVpcEndpointServices'),
+        ('ec2', 'DescribeVpcEndpoints'),
+        ('ec2', 'DescribeVpcPeeringConnections'),
+        ('ec2', 'DescribeVpcs'),
+        ('ec2', 'DescribeVpnConnections'),
+        ('ec2', 'DescribeVpnGateways'),
+        ('ec2', 'GetAssociatedEnclaveCertificateIamRoles'),
+        ('ec2', 'GetAssociatedIpv6PoolCidrs'),
+        ('ec2', 'GetAwsNetworkPerformanceData'),
+        ('ec2', 'GetCapacityReservationUsage'),
+        ('ec2', 'GetCoipPoolUsage'),
+        ('ec2', 'GetConsoleOutput'),
+        ('ec2', 'GetConsoleScreenshot'),
+        ('ec2', 'GetDefaultCreditSpecification'),
+        ('ec2', 'GetEbsDefaultKmsKeyId'),
+        ('ec2', 'GetEbsEncryptionByDefault'),
+        ('ec2', 'GetFlowLogsIntegrationTemplate'),
+        ('ec2', 'GetGroupsForCapacityReservation'),
+        ('ec2', 'GetHostReservationPurchasePreview'),
+        ('ec2', 'GetImageBlockPublicAccessState'),
+        ('ec2', 'GetInstanceMetadataDefaults'),
+        ('ec2', 'GetInstanceTypesFromInstanceRequirements'),
+        ('ec2', 'GetInstanceUefiData'),
+        ('ec2', 'GetIpamAddressHistory'),
+        ('ec2', 'GetIpamDiscoveredAccounts'),
+        ('ec2', 'GetIpamDiscoveredPublicAddresses'),
+        ('ec2', 'GetIpamDiscoveredResourceCidrs'),
+        ('ec2', 'GetIpamPoolAllocations'),
+        ('ec2', 'GetIpamPoolCidrs'),
+        ('ec2', 'GetIpamResourceCidrs'),
+        ('ec2', 'GetLaunchTemplateData'),
+        ('ec2', 'GetManagedPrefixListAssociations'),
+        ('ec2', 'GetManagedPrefixListEntries'),
+        ('ec2', 'GetNetworkInsightsAccessScopeAnalysisFindings'),
+        ('ec2', 'GetNetworkInsightsAccessScopeContent'),
+        ('ec2', 'GetPasswordData'),
+        ('ec2', 'GetReservedInstancesExchangeQuote'),
+        ('ec2', 'GetSecurityGroupsForVpc'),
+        ('ec2', 'GetSerialConsoleAccessStatus'),
+        ('ec2', 'GetSnapshotBlockPublicAccessState'),
+        ('ec2', 'GetSpotPlacementScores'),
+        ('ec2', 'GetSubnetCidrReservations'),
+        ('ec2', 'GetTransitGatewayAttachmentPropagations'),
+        ('ec2', 'GetTransitGatewayMulticastDomainAssociations'),
+        ('ec2', 'GetTransitGatewayPolicyTableAssociations'),
+        ('ec2', 'GetTransitGatewayPolicyTableEntries'),
+        ('ec2', 'GetTransitGatewayPrefixListReferences'),
+        ('ec2', 'GetTransitGatewayRouteTableAssociations'),
+        ('ec2', 'GetTransitGatewayRouteTablePropagations'),
+        ('ec2', 'GetVerifiedAccessEndpointPolicy'),
+        ('ec2', 'GetVerifiedAccessGroupPolicy'),
+        ('ec2', 'GetVpnConnectionDeviceSampleConfiguration'),
+        ('ec2', 'GetVpnConnectionDeviceTypes'),
+        ('ec2', 'GetVpnTunnelReplacementStatus'),
+        ('ec2', 'ListImagesInRecycleBin'),
+        ('ec2', 'ListSnapshotsInRecycleBin'),
+        ('ec2', 'SearchLocalGatewayRoutes'),
+        ('ec2', 'SearchTransitGatewayRoutes'),
+        ('ecr', 'BatchCheckLayerAvailability'),
+        ('ecr', 'BatchGetImage'),
+        ('ecr', 'BatchGetRepositoryScanningConfiguration'),
+        ('ecr', 'DescribeImageReplicationStatus'),
+        ('ecr', 'DescribeImageScanFindings'),
+        ('ecr', 'DescribeImages'),
+        ('ecr', 'DescribePullThroughCacheRules'),
+        ('ecr', 'DescribeRegistry'),
+        ('ecr', 'DescribeRepositories'),
+        ('ecr', 'GetAuthorizationToken'),
+        ('ecr', 'GetDownloadUrlForLayer'),
+        ('ecr', 'GetLifecyclePolicy'),
+        ('ecr', 'GetLifecyclePolicyPreview'),
+        ('ecr', 'GetRegistryPolicy'),
+        ('ecr', 'GetRegistryScanningConfiguration'),
+        ('ecr', 'GetRepositoryPolicy'),
+        ('ecr', 'ListImages'),
+        ('ecr', 'ListTagsForResource'),
+        ('ecr', 'get-login'),
+        ('ecr', 'get-login-password'),
+        ('ecr-public', 'BatchCheckLayerAvailability'),
+        ('ecr-public', 'DescribeImageTags'),
+        ('ecr-public', 'DescribeImages'),
+        ('ecr-public', 'DescribeRegistries'),
+        ('ecr-public', 'DescribeRepositories'),
+        ('ecr-public', 'GetAuthorizationToken'),
+        ('ecr-public', 'GetRegistryCatalogData'),
+        ('ecr-public', 'GetRepositoryCatalogData'),
+        ('ecr-public', 'GetRepositoryPolicy'),
+        ('ecr-public', 'ListTagsForResource'),
+        ('ecr-public', 'get-login-password'),
+        ('ecs', 'DescribeCapacityProviders'),
+        ('ecs', 'DescribeClusters'),
+        ('ecs', 'DescribeContainerInstances'),
+        ('ecs', 'DescribeServices'),
+        ('ecs', 'DescribeTaskDefinition'),
+        ('ecs', 'DescribeTaskSets'),
+        ('ecs', 'DescribeTasks'),
+        ('ecs', 'ListAccountSettings'),
+        ('ecs', 'ListAttributes'),
+        ('ecs', 'ListClusters'),
+        ('ecs', 'ListContainerInstances'),
+        ('ecs', 'ListServices'),
+        ('ecs', 'ListServicesByNamespace'),
+        ('ecs', 'ListTagsForResource'),
+        ('ecs', 'ListTaskDefinitionFamilies'),
+        ('ecs', 'ListTaskDefinitions'),
+        ('ecs', 'ListTasks'),
+        ('efs', 'DescribeAccessPoints'),
+        ('efs', 'DescribeAccountPreferences'),
+        ('efs', 'DescribeBackupPolicy'),
+        ('efs', 'DescribeFileSystemPolicy'),
+        ('efs', 'DescribeFileSystems'),
+        ('efs', 'DescribeLifecycleConfiguration'),
+        ('efs', 'DescribeMountTargetSecurityGroups'),
+        ('efs', 'DescribeMountTargets'),
+        ('efs', 'DescribeReplicationConfigurations'),
+        ('efs', 'DescribeTags'),
+        ('efs', 'ListTagsForResource'),
+        ('eks', 'DescribeAccessEntry'),
+        ('eks', 'DescribeAddon'),
+        ('eks', 'DescribeAddonConfiguration'),
+        ('eks', 'DescribeAddonVersions'),
+        ('eks', 'DescribeCluster'),
+        ('eks', 'DescribeEksAnywhereSubscription'),
+        ('eks', 'DescribeFargateProfile'),
+        ('eks', 'DescribeIdentityProviderConfig'),
+        ('eks', 'DescribeInsight'),
+        ('eks', 'DescribeNodegroup'),
+        ('eks', 'DescribePodIdentityAssociation'),
+        ('eks', 'DescribeUpdate'),
+        ('eks', 'ListAccessEntries'),
+        ('eks', 'ListAccessPolicies'),
+        ('eks', 'ListAddons'),
+        ('eks', 'ListAssociatedAccessPolicies'),
+        ('eks', 'ListClusters'),
+        ('eks', 'ListEksAnywhereSubscriptions'),
+        ('eks', 'ListFargateProfiles'),
+        ('eks', 'ListIdentityProviderConfigs'),
+        ('eks', 'ListInsights'),
+        ('eks', 'ListNodegroups'),
+        ('eks', 'ListPodIdentityAssociations'),
+        ('eks', 'ListTagsForResource'),
+        ('eks', 'ListUpdates'),
+        ('eks', 'get-token'),
+        ('elastic-inference', 'DescribeAcceleratorOfferings'),
+        ('elastic-inference', 'DescribeAcceleratorTypes'),
+        ('elastic-inference', 'DescribeAccelerators'),
+        ('elastic-inference', 'ListTagsForResource'),
+        ('elasticache', 'DescribeCacheClusters'),
+        ('elasticache', 'DescribeCacheEngineVersions'),
+        ('elasticache', 'DescribeCacheParameterGroups'),
+        ('elasticache', 'DescribeCacheParameters'),
+        ('elasticache', 'DescribeCacheSecurityGroups'),
+        ('elasticache', 'DescribeCacheSubnetGroups'),
+        ('elasticache', 'DescribeEngineDefaultParameters'),
+        ('elasticache', 'DescribeEvents'),
+        ('elasticache', 'DescribeGlobalReplicationGroups'),
+        ('elasticache', 'DescribeReplicationGroups'),
+        ('elasticache', 'DescribeReservedCacheNodes'),
+        ('elasticache', 'DescribeReservedCacheNodesOfferings'),
+        ('elasticache', 'DescribeServerlessCacheSnapshots'),
+        ('elasticache', 'DescribeServerlessCaches'),
+        ('elasticache', 'DescribeServiceUpdates'),
+        ('elasticache', 'DescribeSnapshots'),
+        ('elasticache', 'DescribeUpdateActions'),
+        ('elasticache', 'DescribeUserGroups'),
+        ('elasticache', 'DescribeUsers'),
+        ('elasticache', 'ListAllowedNodeTypeModifications'),
+        ('elasticache', 'ListTagsForResource'),
+        ('elasticbeanstalk', 'CheckDNSAvailability'),
+        ('elasticbeanstalk', 'DescribeAccountAttributes'),
+        ('elasticbeanstalk', 'DescribeApplicationVersions'),
+        ('elasticbeanstalk', 'DescribeApplications'),
+        ('elasticbeanstalk', 'DescribeConfigurationOptions'),
+        ('elasticbeanstalk', 'DescribeConfigurationSettings'),
+        ('elasticbeanstalk', 'DescribeEnvironmentHealth'),
+        ('elasticbeanstalk', 'DescribeEnvironmentManagedActionHistory'),
+        ('elasticbeanstalk', 'DescribeEnvironmentManagedActions'),
+        ('elasticbeanstalk', 'DescribeEnvironmentResources'),
+        ('elasticbeanstalk', 'DescribeEnvironments'),
+        ('elasticbeanstalk', 'DescribeEvents'),
+        ('elasticbeanstalk', 'DescribeInstancesHealth'),
+        ('elasticbeanstalk', 'DescribePlatformVersion'),
+        ('elasticbeanstalk', 'ListAvailableSolutionStacks'),
+        ('elasticbeanstalk', 'ListPlatformBranches'),
+        ('elasticbeanstalk', 'ListPlatformVersions'),
+        ('elasticbeanstalk', 'ListTagsForResource'),
+        ('elasticbeanstalk', 'RequestEnvironmentInfo'),
+        ('elasticbeanstalk', 'RetrieveEnvironmentInfo'),
+        ('elasticbeanstalk', 'ValidateConfigurationSettings'),
+        ('elastictranscoder', 'ListJobsByPipeline'),
+        ('elastictranscoder', 'ListJobsByStatus'),
+        ('elastictranscoder', 'ListPipelines'),
+        ('elastictranscoder', 'ListPresets'),
+        ('elastictranscoder', 'ReadJob'),
+        ('elastictranscoder', 'ReadPipeline'),
+        ('elastictranscoder', 'ReadPreset'),
+        ('elb', 'DescribeAccountLimits'),
+        ('elb', 'DescribeInstanceHealth'),
+        ('elb', 'DescribeLoadBalancerAttributes'),
+        ('elb', 'DescribeLoadBalancerPolicies'),
+        ('elb', 'DescribeLoadBalancerPolicyTypes'),
+        ('elb', 'DescribeLoadBalancers'),
+        ('elb', 'DescribeTags'),
+        ('elbv2', 'DescribeAccountLimits'),
+        ('elbv2', 'DescribeListenerCertificates'),
+        ('elbv2', 'DescribeListeners'),
+        ('elbv2', 'DescribeLoadBalancerAttributes'),
+        ('elbv2', 'DescribeLoadBalancers'),
+        ('elbv2', 'DescribeRules'),
+        ('elbv2', 'DescribeSSLPolicies'),
+        ('elbv2', 'DescribeTags'),
+        ('elbv2', 'DescribeTargetGroupAttributes'),
+        ('elbv2', 'DescribeTargetGroups'),
+        ('elbv2', 'DescribeTargetHealth'),
+        ('elbv2', 'DescribeTrustStoreAssociations'),
+        ('elbv2', 'DescribeTrustStoreRevocations'),
+        ('elbv2', 'DescribeTrustStores'),
+        ('emr', 'DescribeCluster'),
+        ('emr', 'DescribeJobFlows'),
+        ('emr', 'DescribeNotebookExecution'),
+        ('emr', 'DescribeReleaseLabel'),
+        ('emr', 'DescribeSecurityConfiguration'),
+        ('emr', 'DescribeStep'),
+        ('emr', 'DescribeStudio'),
+        ('emr', 'GetBlockPublicAccessConfiguration'),
+        ('emr', 'ListBootstrapActions'),
+        ('emr', 'ListClusters'),
+        ('emr', 'ListInstanceFleets'),
+        ('emr', 'ListInstanceGroups'),
+        ('emr', 'ListInstances'),
+        ('emr', 'ListNotebookExecutions'),
+        ('emr', 'ListReleaseLabels'),
+        ('emr', 'ListSecurityConfigurations'),
+        ('emr', 'ListSteps'),
+        ('emr', 'ListStudioSessionMappings'),
+        ('emr', 'ListStudios'),
+        ('emr', 'ListSupportedInstanceTypes'),
+        ('emr', 'describe-cluster'),
+        ('emr-containers', 'DescribeJobRun'),
+        ('emr-containers', 'DescribeJobTemplate'),
+        ('emr-containers', 'DescribeManagedEndpoint'),
+        ('emr-containers', 'DescribeVirtualCluster'),
+        ('emr-containers', 'GetManagedEndpointSessionCredentials'),
+        ('emr-containers', 'ListJobRuns'),
+        ('emr-containers', 'ListJobTemplates'),
+        ('emr-containers', 'ListManagedEndpoints'),
+        ('emr-containers', 'ListTagsForResource'),
+        ('emr-containers', 'ListVirtualClusters'),
+        ('emr-serverless', 'GetApplication'),
+        ('emr-serverless', 'GetDashboardForJobRun'),
+        ('emr-serverless', 'GetJobRun'),
+        ('emr-serverless', 'ListApplications'),
+        ('emr-serverless', 'ListJobRuns'),
+        ('emr-serverless', 'ListTagsForResource'),
+        ('es', 'DescribeDomainAutoTunes'),
+        ('es', 'DescribeDomainChangeProgress'),
+        ('es', 'DescribeElasticsearchDomain'),
+        ('es', 'DescribeElasticsearchDomainConfig'),
+        ('es', 'DescribeElasticsearchDomains'),
+        ('es', 'DescribeElasticsearchInstanceTypeLimits'),
+        ('es', 'DescribeInboundCrossClusterSearchConnections'),
+        ('es', 'DescribeOutboundCrossClusterSearchConnections'),
+        ('es', 'DescribePackages'),
+        ('es', 'DescribeReservedElasticsearchInstanceOfferings'),
+        ('es', 'DescribeReservedElasticsearchInstances'),
+        ('es', 'DescribeVpcEndpoints'),
+        ('es', 'GetCompatibleElasticsearchVersions'),
+        ('es', 'GetPackageVersionHistory'),
+        ('es', 'GetUpgradeHistory'),
+        ('es', 'GetUpgradeStatus'),
+        ('es', 'ListDomainNames'),
+        ('es', 'ListDomainsForPackage'),
+        ('es', 'ListElasticsearchInstanceTypes'),
+        ('es', 'ListElasticsearchVersions'),
+        ('es', 'ListPackagesForDomain'),
+        ('es', 'ListTags'),
+        ('es', 'ListVpcEndpointAccess'),
+        ('es', 'ListVpcEndpoints'),
+        ('es', 'ListVpcEndpointsForDomain'),
+        ('events', 'DescribeApiDestination'),
+        ('events', 'DescribeArchive'),
+        ('events', 'DescribeConnection'),
+        ('events', 'DescribeEndpoint'),
+        ('events', 'DescribeEventBus'),
+        ('events', 'DescribeEventSource'),
+        ('events', 'DescribePartnerEventSource'),
+        ('events', 'DescribeReplay'),
+        ('events', 'DescribeRule'),
+        ('events', 'ListApiDestinations'),
+        ('events', 'ListArchives'),
+        ('events', 'ListConnections'),
+        ('events', 'ListEndpoints'),
+        ('events', 'ListEventBuses'),
+        ('events', 'ListEventSources'),
+        ('events', 'ListPartnerEventSourceAccounts'),
+        ('events', 'ListPartnerEventSources'),
+        ('events', 'ListReplays'),
+        ('events', 'ListRuleNamesByTarget'),
+        ('events', 'ListRules'),
+        ('events', 'ListTagsForResource'),
+        ('events', 'ListTargetsByRule'),
+        ('events', 'TestEventPattern'),
+        ('evidently', 'GetExperiment'),
+        ('evidently', 'GetExperimentResults'),
+        ('evidently', 'GetFeature'),
+        ('evidently', 'GetLaunch'),
+        ('evidently', 'GetProject'),
+        ('evidently', 'GetSegment'),
+        ('evidently', 'ListExperiments'),
+        ('evidently', 'ListFeatures'),
+        ('evidently', 'ListLaunches'),
+        ('evidently', 'ListProjects'),
+        ('evidently', 'ListSegmentReferences'),
+        ('evidently', 'ListSegments'),
+        ('evidently', 'ListTagsForResource'),
+        ('evidently', 'TestSegmentPattern'),
+        ('firehose', 'DescribeDeliveryStream'),
+        ('firehose', 'ListDeliveryStreams'),
+        ('firehose', 'ListTagsForDeliveryStream'),
+        ('fis', 'GetAction'),
+        ('fis', 'GetExperiment'),
+        ('fis', 'GetExperimentTargetAccountConfiguration'),
+        ('fis', 'GetExperimentTemplate'),
+        ('fis', 'GetTargetAccountConfiguration'),
+        ('fis', 'GetTargetResourceType'),
+        ('fis', 'ListActions'),
+        ('fis', 'ListExperimentResolvedTargets'),
+        ('fis', 'ListExperimentTargetAccountConfigurations'),
+        ('fis', 'ListExperimentTemplates'),
+        ('fis', 'ListExperiments'),
+        ('fis', 'ListTagsForResource'),
+        ('fis', 'ListTargetAccountConfigurations'),
+        ('fis', 'ListTargetResourceTypes'),
+        ('fms', 'GetAdminAccount'),
+        ('fms', 'GetAdminScope'),
+        ('fms', 'GetAppsList'),
+        ('fms', 'GetComplianceDetail'),
+        ('fms', 'GetNotificationChannel'),
+        ('fms', 'GetPolicy'),
+        ('fms', 'GetProtectionStatus'),
+        ('fms', 'GetProtocolsList'),
+        ('fms', 'GetResourceSet'),
+        ('fms', 'GetThirdPartyFirewallAssociationStatus'),
+        ('fms', 'GetViolationDetails'),
+        ('fms', 'ListAdminAccountsForOrganization'),
+        ('fms', 'ListAdminsManagingAccount'),
+        ('fms', 'ListAppsLists'),
+        ('fms', 'ListComplianceStatus'),
+        ('fms', 'ListDiscoveredResources'),
+        ('fms', 'ListMemberAccounts'),
+        ('fms', 'ListPolicies'),
+        ('fms', 'ListProtocolsLists'),
+        ('fms', 'ListResourceSetResources'),
+        ('fms', 'ListResourceSets'),
+        ('fms', 'ListTagsForResource'),
+        ('fms', 'ListThirdPartyFirewallFirewallPolicies'),
+        ('forecast', 'DescribeAutoPredictor'),
+        ('forecast', 'DescribeDataset'),
+        ('forecast', 'DescribeDatasetGroup'),
+        ('forecast', 'DescribeDatasetImportJob'),
+        ('forecast', 'DescribeExplainability'),
+        ('forecast', 'DescribeExplainabilityExport'),
+        ('forecast', 'DescribeForecast'),
+        ('forecast', 'DescribeForecastExportJob'),
+        ('forecast', 'DescribeMonitor'),
+        ('forecast', 'DescribePredictor'),
+        ('forecast', 'DescribePredictorBacktestExportJob'),
+        ('forecast', 'DescribeWhatIfAnalysis'),
+        ('forecast', 'DescribeWhatIfForecast'),
+        ('forecast', 'DescribeWhatIfForecastExport'),
+        ('forecast', 'GetAccuracyMetrics'),
+        ('forecast', 'ListDatasetGroups'),
+        ('forecast', 'ListDatasetImportJobs'),
+        ('forecast', 'ListDatasets'),
+        ('forecast', 'ListExplainabilities'),
+        ('forecast', 'ListExplainabilityExports'),
+        ('forecast', 'ListForecastExportJobs'),
+        ('forecast', 'ListForecasts'),
+        ('forecast', 'ListMonitorEvaluations'),
+        ('forecast', 'ListMonitors'),
+        ('forecast', 'ListPredictorBacktestExportJobs'),
+        ('forecast', 'ListPredictors'),
+        ('forecast', 'ListTagsForResource'),
+        ('forecast', 'ListWhatIfAnalyses'),
+        ('forecast', 'ListWhatIfForecastExports'),
+        ('forecast', 'ListWhatIfForecasts'),
+        ('forecastquery', 'QueryForecast'),
+        ('forecastquery', 'QueryWhatIfForecast'),
+        ('frauddetector', 'BatchGetVariable'),
+        ('frauddetector', 'DescribeDetector'),
+        ('frauddetector', 'DescribeModelVersions'),
+        ('frauddetector', 'GetBatchImportJobs'),
+        ('frauddetector', 'GetBatchPredictionJobs'),
+        ('frauddetector', 'GetDeleteEventsByEventTypeStatus'),
+        ('frauddetector', 'GetDetectorVersion'),
+        ('frauddetector', 'GetDetectors'),
+        ('frauddetector', 'GetEntityTypes'),
+        ('frauddetector', 'GetEvent'),
+        ('frauddetector', 'GetEventPrediction'),
+        ('frauddetector', 'GetEventPredictionMetadata'),
+        ('frauddetector', 'GetEventTypes'),
+        ('frauddetector', 'GetExternalModels'),
+        ('frauddetector', 'GetKMSEncryptionKey'),
+        ('frauddetector', 'GetLabels'),
+        ('frauddetector', 'GetListElements'),
+        ('frauddetector', 'GetListsMetadata'),
+        ('frauddetector', 'GetModelVersion'),
+        ('frauddetector', 'GetModels'),
+        ('frauddetector', 'GetOutcomes'),
+        ('frauddetector', 'GetRules'),
+        ('frauddetector', 'GetVariables'),
+        ('frauddetector', 'ListEventPredictions'),
+        ('frauddetector', 'ListTagsForResource'),
+        ('freetier', 'GetFreeTierUsage'),
+        ('fsx', 'DescribeBackups'),
+        ('fsx', 'DescribeDataRepositoryAssociations'),
+        ('fsx', 'DescribeDataRepositoryTasks'),
+        ('fsx', 'DescribeFileCaches'),
+        ('fsx', 'DescribeFileSystemAliases'),
+        ('fsx', 'DescribeFileSystems'),
+        ('fsx', 'DescribeSharedVpcConfiguration'),
+        ('fsx', 'DescribeSnapshots'),
+        ('fsx', 'DescribeStorageVirtualMachines'),
+        ('fsx', 'DescribeVolumes'),
+        ('fsx', 'ListTagsForResource'),
+        ('gamelift', 'DescribeAlias'),
+        ('gamelift', 'DescribeBuild'),
+        ('gamelift', 'DescribeCompute'),
+        ('gamelift', 'DescribeEC2InstanceLimits'),
+        ('gamelift', 'DescribeFleetAttributes'),
+        ('gamelift', 'DescribeFleetCapacity'),
+        ('gamelift', 'DescribeFleetEvents'),
+        ('gamelift', 'DescribeFleetLocationAttributes'),
+        ('gamelift', 'DescribeFleetLocationCapacity'),
+        ('gamelift', 'DescribeFleetLocationUtilization'),
+        ('gamelift', 'DescribeFleetPortSettings'),
+        ('gamelift', 'DescribeFleetUtilization'),
+        ('gamelift', 'DescribeGameServer'),
+        ('gamelift', 'DescribeGameServerGroup'),
+        ('gamelift', 'DescribeGameServerInstances'),
+        ('gamelift', 'DescribeGameSessionDetails'),
+        ('gamelift', 'DescribeGameSessionPlacement'),
+        ('gamelift', 'DescribeGameSessionQueues'),
+        ('gamelift', 'DescribeGameSessions'),
+        ('gamelift', 'DescribeInstances'),
+        ('gamelift', 'DescribeMatchmaking'),
+        ('gamelift', 'DescribeMatchmakingConfigurations'),
+        ('gamelift', 'DescribeMatchmakingRuleSets'),
+        ('gamelift', 'DescribePlayerSessions'),
+        ('gamelift', 'DescribeRuntimeConfiguration'),
+        ('gamelift', 'DescribeScalingPolicies'),
+        ('gamelift', 'DescribeScript'),
+        ('gamelift', 'DescribeVpcPeeringAuthorizations'),
+        ('gamelift', 'DescribeVpcPeeringConnections'),
+        ('gamelift', 'GetComputeAccess'),
+        ('gamelift', 'GetComputeAuthToken'),
+        ('gamelift', 'GetGameSessionLogUrl'),
+        ('gamelift', 'GetInstanceAccess'),
+        ('gamelift', 'ListAliases'),
+        ('gamelift', 'ListBuilds'),
+        ('gamelift', 'ListCompute'),
+        ('gamelift', 'ListFleets'),
+        ('gamelift', 'ListGameServerGroups'),
+        ('gamelift', 'ListGameServers'),
+        ('gamelift', 'ListLocations'),
+        ('gamelift', 'ListScripts'),
+        ('gamelift', 'ListTagsForResource'),
+        ('gamelift', 'ResolveAlias'),
+        ('gamelift', 'SearchGameSessions'),
+        ('gamelift', 'get-game-session-log'),
+        ('glacier', 'DescribeJob'),
+        ('glacier', 'DescribeVault'),
+        ('glacier', 'GetDataRetrievalPolicy'),
+        ('glacier', 'GetJobOutput'),
+        ('glacier', 'GetVaultAccessPolicy'),
+        ('glacier', 'GetVaultLock'),
+        ('glacier', 'GetVaultNotifications'),
+        ('glacier', 'ListJobs'),
+        ('glacier', 'ListMultipartUploads'),
+        ('glacier', 'ListParts'),
+        ('glacier', 'ListProvisionedCapacity'),
+        ('glacier', 'ListTagsForVault'),
+        ('glacier', 'ListVaults'),
+        ('globalaccelerator', 'DescribeAccelerator'),
+        ('globalaccelerator', 'DescribeAcceleratorAttributes'),
+        ('globalaccelerator', 'DescribeCrossAccountAttachment'),
+        ('globalaccelerator', 'DescribeCustomRoutingAccelerator'),
+        ('globalaccelerator', 'DescribeCustomRoutingAcceleratorAttributes'),
+        ('globalaccelerator', 'DescribeCustomRoutingEndpointGroup'),
+        ('globalaccelerator', 'DescribeCustomRoutingListener'),
+        ('globalaccelerator', 'DescribeEndpointGroup'),
+        ('globalaccelerator', 'DescribeListener'),
+        ('globalaccelerator', 'ListAccelerators'),
+        ('globalaccelerator', 'ListByoipCidrs'),
+        ('globalaccelerator', 'ListCrossAccountAttachments'),
+        ('globalaccelerator', 'ListCrossAccountResourceAccounts'),
+        ('globalaccelerator', 'ListCrossAccountResources'),
+        ('globalaccelerator', 'ListCustomRoutingAccelerators'),
+        ('globalaccelerator', 'ListCustomRoutingEndpointGroups'),
+        ('globalaccelerator', 'ListCustomRoutingListeners'),
+        ('globalaccelerator', 'ListCustomRoutingPortMappings'),
+        ('globalaccelerator', 'ListCustomRoutingPortMappingsByDestination'),
+        ('globalaccelerator', 'ListEndpointGroups'),
+        ('globalaccelerator', 'ListListeners'),
+        ('globalaccelerator', 'ListTagsForResource'),
+        ('glue', 'BatchGetCrawlers'),
+        ('glue', 'BatchGetDevEndpoints'),
+        ('glue', 'BatchGetJobs'),
+        ('glue', 'BatchGetPartition'),
+        ('glue', 'BatchGetTriggers'),
+        ('glue', 'BatchGetWorkflows'),
+        ('glue', 'CheckSchemaVersionValidity'),
+        ('glue', 'GetBlueprint'),
+        ('glue', 'GetBlueprintRun'),
+        ('glue', 'GetBlueprintRuns'),
+        ('glue', 'GetCatalogImportStatus'),
+        ('glue', 'GetClassifier'),
+        ('glue', 'GetClassifiers'),
+        ('glue', 'GetColumnStatisticsForPartition'),
+        ('glue', 'GetColumnStatisticsForTable'),
+        ('glue', 'GetColumnStatisticsTaskRun'),
+        ('glue', 'GetColumnStatisticsTaskRuns'),
+        ('glue', 'GetConnection'),
+        ('glue', 'GetConnections'),
+        ('glue', 'GetCrawler'),
+        ('glue', 'GetCrawlerMetrics'),
+        ('glue', 'GetCrawlers'),
+        ('glue', 'GetCustomEntityType'),
+        ('glue', 'GetDataCatalogEncryptionSettings'),
+        ('glue', 'GetDataQualityResult'),
+        ('glue', 'GetDataQualityRuleRecommendationRun'),
+        ('glue', 'GetDataQualityRuleset'),
+        ('glue', 'GetDataQualityRulesetEvaluationRun'),
+        ('glue', 'GetDatabase'),
+        ('glue', 'GetDatabases'),
+        ('glue', 'GetDataflowGraph'),
+        ('glue', 'GetDevEndpoint'),
+        ('glue', 'GetDevEndpoints'),
+        ('glue', 'GetJob'),
+        ('glue', 'GetJobBookmark'),
+        ('glue', 'GetJobRun'),
+        ('glue', 'GetJobRuns'),
+        ('glue', 'GetJobs'),
+        ('glue', 'GetMLTaskRun'),
+        ('glue', 'GetMLTaskRuns'),
+        ('glue', 'GetMLTransform'),
+        ('glue', 'GetMLTransforms'),
+        ('glue', 'GetMapping'),
+        ('glue', 'GetPartition'),
+        ('glue', 'GetPartitionIndexes'),
+        ('glue', 'GetPartitions'),
+        ('glue', 'GetPlan'),
+        ('glue', 'GetRegistry'),
+        ('glue', 'GetResourcePolicies'),
+        ('glue', 'GetResourcePolicy'),
+        ('glue', 'GetSchema'),
+        ('glue', 'GetSchemaByDefinition'),
+        ('glue', 'GetSchemaVersion'),
+        ('glue', 'GetSchemaVersionsDiff'),
+        ('glue', 'GetSecurityConfiguration'),
+        ('glue', 'GetSecurityConfigurations'),
+        ('glue', 'GetSession'),
+        ('glue', 'GetStatement'),
+        ('glue', 'GetTable'),
+        ('glue', 'GetTableOptimizer'),
+        ('glue', 'GetTableVersion'),
+        ('glue', 'GetTableVersions'),
+        ('glue', 'GetTables'),
+        ('glue', 'GetTags'),
+        ('glue', 'GetTrigger'),
+        ('glue', 'GetTriggers'),
+        ('glue', 'GetUnfilteredPartitionMetadata'),
+        ('glue', 'GetUnfilteredPartitionsMetadata'),
+        ('glue', 'GetUnfilteredTableMetadata'),
+        ('glue', 'GetUserDefinedFunction'),
+        ('glue', 'GetUserDefinedFunctions'),
+        ('glue', 'GetWorkflow'),
+        ('glue', 'GetWorkflowRun'),
+        ('glue', 'GetWorkflowRunProperties'),
+        ('glue', 'GetWorkflowRuns'),
+        ('glue', 'ListBlueprints'),
+        ('glue', 'ListColumnStatisticsTaskRuns'),
+        ('glue', 'ListCrawlers'),
+        ('glue', 'ListCrawls'),
+        ('glue', 'ListCustomEntityTypes'),
+        ('glue', 'ListDataQualityResults'),
+        ('glue', 'ListDataQualityRuleRecommendationRuns'),
+        ('glue', 'ListDataQualityRulesetEvaluationRuns'),
+        ('glue', 'ListDataQualityRulesets'),
+        ('glue', 'ListDevEndpoints'),
+        ('glue', 'ListJobs'),
+        ('glue', 'ListMLTransforms'),
+        ('glue', 'ListRegistries'),
+        ('glue', 'ListSchemaVersions'),
+        ('glue', 'ListSchemas'),
+        ('glue', 'ListSessions'),
+        ('glue', 'ListStatements'),
+        ('glue', 'ListTableOptimizerRuns'),
+        ('glue', 'ListTriggers'),
+        ('glue', 'ListWorkflows'),
+        ('glue', 'QuerySchemaVersionMetadata'),
+        ('glue', 'SearchTables'),
+        ('grafana', 'DescribeWorkspace'),
+        ('grafana', 'DescribeWorkspaceAuthentication'),
+        ('grafana', 'DescribeWorkspaceConfiguration'),
+        ('grafana', 'ListPermissions'),
+        ('grafana', 'ListTagsForResource'),
+        ('grafana', 'ListVersions'),
+        ('grafana', 'ListWorkspaces'),
+        ('greengrass', 'GetAssociatedRole'),
+        ('greengrass', 'GetBulkDeploymentStatus'),
+        ('greengrass', 'GetConnectivityInfo'),
+        ('greengrass', 'GetConnectorDefinition'),
+        ('greengrass', 'GetConnectorDefinitionVersion'),
+        ('greengrass', 'GetCoreDefinition'),
+        ('greengrass', 'GetCoreDefinitionVersion'),
+        ('greengrass', 'GetDeploymentStatus'),
+        ('greengrass', 'GetDeviceDefinition'),
+        ('greengrass', 'GetDeviceDefinitionVersion'),
+        ('greengrass', 'GetFunctionDefinition'),
+        ('greengrass', 'GetFunctionDefinitionVersion'),
+        ('greengrass', 'GetGroup'),
+        ('greengrass', 'GetGroupCertificateAuthority'),
+        ('greengrass', 'GetGroupCertificateConfiguration'),
+        ('greengrass', 'GetGroupVersion'),
+        ('greengrass', 'GetLoggerDefinition'),
+        ('greengrass', 'GetLoggerDefinitionVersion'),
+        ('greengrass', 'GetResourceDefinition'),
+        ('greengrass', 'GetResourceDefinitionVersion'),
+        ('greengrass', 'GetServiceRoleForAccount'),
+        ('greengrass', 'GetSubscriptionDefinition'),
+        ('greengrass', 'GetSubscriptionDefinitionVersion'),
+        ('greengrass', 'GetThingRuntimeConfiguration'),
+        ('greengrass', 'ListBulkDeploymentDetailedReports'),
+        ('greengrass', 'ListBulkDeployments'),
+        ('greengrass', 'ListConnectorDefinitionVersions'),
+        ('greengrass', 'ListConnectorDefinitions'),
+        ('greengrass', 'ListCoreDefinitionVersions'),
+        ('greengrass', 'ListCoreDefinitions'),
+        ('greengrass', 'ListDeployments'),
+        ('greengrass', 'ListDeviceDefinitionVersions'),
+        ('greengrass', 'ListDeviceDefinitions'),
+        ('greengrass', 'ListFunctionDefinitionVersions'),
+        ('greengrass', 'ListFunctionDefinitions'),
+        ('greengrass', 'ListGroupCertificateAuthorities'),
+        ('greengrass', 'ListGroupVersions'),
+        ('greengrass', 'ListGroups'),
+        ('greengrass', 'ListLoggerDefinitionVersions'),
+        ('greengrass', 'ListLoggerDefinitions'),
+        ('greengrass', 'ListResourceDefinitionVersions'),
+        ('greengrass', 'ListResourceDefinitions'),
+        ('greengrass', 'ListSubscriptionDefinitionVersions'),
+        ('greengrass', 'ListSubscriptionDefinitions'),
+        ('greengrass', 'ListTagsForResource'),
+        ('greengrassv2', 'DescribeComponent'),
+        ('greengrassv2', 'GetComponent'),
+        ('greengrassv2', 'GetComponentVersionArtifact'),
+        ('greengrassv2', 'GetConnectivityInfo'),
+        ('greengrassv2', 'GetCoreDevice'),
+        ('greengrassv2', 'GetDeployment'),
+        ('greengrassv2', 'GetServiceRoleForAccount'),
+        ('greengrassv2', 'ListClientDevicesAssociatedWithCoreDevice'),
+        ('greengrassv2', 'ListComponentVersions'),
+        ('greengrassv2', 'ListComponents'),
+        ('greengrassv2', 'ListCoreDevices'),
+        ('greengrassv2', 'ListDeployments'),
+        ('greengrassv2', 'ListEffectiveDeployments'),
+        ('greengrassv2', 'ListInstalledComponents'),
+        ('greengrassv2', 'ListTagsForResource'),
+        ('groundstation', 'DescribeContact'),
+        ('groundstation', 'DescribeEphemeris'),
+        ('groundstation', 'GetAgentConfiguration'),
+        ('groundstation', 'GetConfig'),
+        ('groundstation', 'GetDataflowEndpointGroup'),
+        ('groundstation', 'GetMinuteUsage'),
+        ('groundstation', 'GetMissionProfile'),
+        ('groundstation', 'GetSatellite'),
+        ('groundstation', 'ListConfigs'),
+        ('groundstation', 'ListContacts'),
+        ('groundstation', 'ListDataflowEndpointGroups'),
+        ('groundstation', 'ListEphemerides'),
+        ('groundstation', 'ListGroundStations'),
+        ('groundstation', 'ListMissionProfiles'),
+        ('groundstation', 'ListSatellites'),
+        ('groundstation', 'ListTagsForResource'),
+        ('guardduty', 'DescribeMalwareScans'),
+        ('guardduty', 'DescribeOrganizationConfiguration'),
+        ('guardduty', 'DescribePublishingDestination'),
+        ('guardduty', 'GetAdministratorAccount'),
+        ('guardduty', 'GetCoverageStatistics'),
+        ('guardduty', 'GetDetector'),
+        ('guardduty', 'GetFilter'),
+        ('guardduty', 'GetFindings'),
+        ('guardduty', 'GetFindingsStatistics'),
+        ('guardduty', 'GetIPSet'),
+        ('guardduty', 'GetInvitationsCount'),
+        ('guardduty', 'GetMalwareScanSettings'),
+        ('guardduty', 'GetMasterAccount'),
+        ('guardduty', 'GetMemberDetectors'),
+        ('guardduty', 'GetMembers'),
+        ('guardduty', 'GetOrganizationStatistics'),
+        ('guardduty', 'GetRemainingFreeTrialDays'),
+        ('guardduty', 'GetThreatIntelSet'),
+        ('guardduty', 'GetUsageStatistics'),
+        ('guardduty', 'ListCoverage'),
+        ('guardduty', 'ListDetectors'),
+        ('guardduty', 'ListFilters'),
+        ('guardduty', 'ListFindings'),
+        ('guardduty', 'ListIPSets'),
+        ('guardduty', 'ListInvitations'),
+        ('guardduty', 'ListMembers'),
+        ('guardduty', 'ListOrganizationAdminAccounts'),
+        ('guardduty', 'ListPublishingDestinations'),
+        ('guardduty', 'ListTagsForResource'),
+        ('guardduty', 'ListThreatIntelSets'),
+        ('health', 'DescribeAffectedAccountsForOrganization'),
+        ('health', 'DescribeAffectedEntities'),
+        ('health', 'DescribeAffectedEntitiesForOrganization'),
+        ('health', 'DescribeEntityAggregates'),
+        ('health', 'DescribeEntityAggregatesForOrganization'),
+        ('health', 'DescribeEventAggregates'),
+        ('health', 'DescribeEventDetails'),
+        ('health', 'DescribeEventDetailsForOrganization'),
+        ('health', 'DescribeEventTypes'),
+        ('health', 'DescribeEvents'),
+        ('health', 'DescribeEventsForOrganization'),
+        ('health', 'DescribeHealthServiceStatusForOrganization'),
+        ('healthlake', 'DescribeFHIRDatastore'),
+        ('healthlake', 'DescribeFHIRExportJob'),
+        ('healthlake', 'DescribeFHIRImportJob'),
+        ('healthlake', 'ListFHIRDatastores'),
+        ('healthlake', 'ListFHIRExportJobs'),
+        ('healthlake', 'ListFHIRImportJobs'),
+        ('healthlake', 'ListTagsForResource'),
+        ('iam', 'GenerateCredentialReport'),
+        ('iam', 'GenerateOrganizationsAccessReport'),
+        ('iam', 'GenerateServiceLastAccessedDetails'),
+        ('iam', 'GetAccessKeyLastUsed'),
+        ('iam', 'GetAccountAuthorizationDetails'),
+        ('iam', 'GetAccountPasswordPolicy'),
+        ('iam', 'GetAccountSummary'),
+        ('iam', 'GetContextKeysForCustomPolicy'),
+        ('iam', 'GetContextKeysForPrincipalPolicy'),
+        ('iam', 'GetCredentialReport'),
+        ('iam', 'GetGroup'),
+        ('iam', 'GetGroupPolicy'),
+        ('iam', 'GetInstanceProfile'),
+        ('iam', 'GetLoginProfile'),
+        ('iam', 'GetMFADevice'),
+        ('iam', 'GetOpenIDConnectProvider'),
+        ('iam', 'GetOrganizationsAccessReport'),
+        ('iam', 'GetPolicy'),
+        ('iam', 'GetPolicyVersion'),
+        ('iam', 'GetRole'),
+        ('iam', 'GetRolePolicy'),
+        ('iam', 'GetSAMLProvider'),
+        ('iam', 'GetSSHPublicKey'),
+        ('iam', 'GetServerCertificate'),
+        ('iam', 'GetServiceLastAccessedDetails'),
+        ('iam', 'GetServiceLastAccessedDetailsWithEntities'),
+        ('iam', 'GetServiceLinkedRoleDeletionStatus'),
+        ('iam', 'GetUser'),
+        ('iam', 'GetUserPolicy'),
+        ('iam', 'ListAccessKeys'),
+        ('iam', 'ListAccountAliases'),
+        ('iam', 'ListAttachedGroupPolicies'),
+        ('iam', 'ListAttachedRolePolicies'),
+        ('iam', 'ListAttachedUserPolicies'),
+        ('iam', 'ListEntitiesForPolicy'),
+        ('iam', 'ListGroupPolicies'),
+        ('iam', 'ListGroups'),
+        ('iam', 'ListGroupsForUser'),
+        ('iam', 'ListInstanceProfileTags'),
+        ('iam', 'ListInstanceProfiles'),
+        ('iam', 'ListInstanceProfilesForRole'),
+        ('iam', 'ListMFADeviceTags'),
+        ('iam', 'ListMFADevices'),
+        ('iam', 'ListOpenIDConnectProviderTags'),
+        ('iam', 'ListOpenIDConnectProviders'),
+        ('iam', 'ListPolicies'),
+        ('iam', 'ListPoliciesGrantingServiceAccess'),
+        ('iam', 'ListPolicyTags'),
+        ('iam', 'ListPolicyVersions'),
+        ('iam', 'ListRolePolicies'),
+        ('iam', 'ListRoleTags'),
+        ('iam', 'ListRoles'),
+        ('iam', 'ListSAMLProviderTags'),
+        ('iam', 'ListSAMLProviders'),
+        ('iam', 'ListSSHPublicKeys'),
+        ('iam', 'ListServerCertificateTags'),
+        ('iam', 'ListServerCertificates'),
+        ('iam', 'ListServiceSpecificCredentials'),
+        ('iam', 'ListSigningCertificates'),
+        ('iam', 'ListUserPolicies'),
+        ('iam', 'ListUserTags'),
+        ('iam', 'ListUsers'),
+        ('iam', 'ListVirtualMFADevices'),
+        ('iam', 'SimulateCustomPolicy'),
+        ('iam', 'SimulatePrincipalPolicy'),
+        ('identitystore', 'DescribeGroup'),
+        ('identitystore', 'DescribeGroupMembership'),
+        ('identitystore', 'DescribeUser'),
+        ('identitystore', 'GetGroupId'),
+        ('identitystore', 'GetGroupMembershipId'),
+        ('identitystore', 'GetUserId'),
+        ('identitystore', 'IsMemberInGroups'),
+        ('identitystore', 'ListGroupMemberships'),
+        ('identitystore', 'ListGroupMembershipsForMember'),
+        ('identitystore', 'ListGroups'),
+        ('identitystore', 'ListUsers'),
+        ('imagebuilder', 'GetComponent'),
+        ('imagebuilder', 'GetComponentPolicy'),
+        ('imagebuilder', 'GetContainerRecipe'),
+        ('imagebuilder', 'GetContainerRecipePolicy'),
+        ('imagebuilder', 'GetDistributionConfiguration'),
+        ('imagebuilder', 'GetImage'),
+        ('imagebuilder', 'GetImagePipeline'),
+        ('imagebuilder', 'GetImagePolicy'),
+        ('imagebuilder', 'GetImageRecipe'),
+        ('imagebuilder', 'GetImageRecipePolicy'),
+        ('imagebuilder', 'GetInfrastructureConfiguration'),
+        ('imagebuilder', 'GetLifecycleExecution'),
+        ('imagebuilder', 'GetLifecyclePolicy'),
+        ('imagebuilder', 'GetWorkflow'),
+        ('imagebuilder', 'GetWorkflowExecution'),
+        ('imagebuilder', 'GetWorkflowStepExecution'),
+        ('imagebuilder', 'ListComponentBuildVersions'),
+        ('imagebuilder', 'ListComponents'),
+        ('imagebuilder', 'ListContainerRecipes'),
+        ('imagebuilder', 'ListDistributionConfigurations'),
+        ('imagebuilder', 'ListImageBuildVersions'),
+        ('imagebuilder', 'ListImagePackages'),
+        ('imagebuilder', 'ListImagePipelineImages'),
+        ('imagebuilder', 'ListImagePipelines'),
+        ('imagebuilder', 'ListImageRecipes'),
+        ('imagebuilder', 'ListImageScanFindingAggregations'),
+        ('imagebuilder', 'ListImageScanFindings'),
+        ('imagebuilder', 'ListImages'),
+        ('imagebuilder', 'ListInfrastructureConfigurations'),
+        ('imagebuilder', 'ListLifecycleExecutionResources'),
+        ('imagebuilder', 'ListLifecycleExecutions'),
+        ('imagebuilder', 'ListLifecyclePolicies'),
+        ('imagebuilder', 'ListTagsForResource'),
+        ('imagebuilder', 'ListWaitingWorkflowSteps'),
+        ('imagebuilder', 'ListWorkflowBuildVersions'),
+        ('imagebuilder', 'ListWorkflowExecutions'),
+        ('imagebuilder', 'ListWorkflowStepExecutions'),
+        ('imagebuilder', 'ListWorkflows'),
+        ('importexport', 'GetShippingLabel'),
+        ('importexport', 'GetStatus'),
+        ('importexport', 'ListJobs'),
+        ('inspector', 'DescribeAssessmentRuns'),
+        ('inspector', 'DescribeAssessmentTargets'),
+        ('inspector', 'DescribeAssessmentTemplates'),
+        ('inspector', 'DescribeCrossAccountAccessRole'),
+        ('inspector', 'DescribeExclusions'),
+        ('inspector', 'DescribeFindings'),
+        ('inspector', 'DescribeResourceGroups'),
+        ('inspector', 'DescribeRulesPackages'),
+        ('inspector', 'GetAssessmentReport'),
+        ('inspector', 'GetExclusionsPreview'),
+        ('inspector', 'GetTelemetryMetadata'),
+        ('inspector', 'ListAssessmentRunAgents'),
+        ('inspector', 'ListAssessmentRuns'),
+        ('inspector', 'ListAssessmentTargets'),
+        ('inspector', 'ListAssessmentTemplates'),
+        ('inspector', 'ListEventSubscriptions'),
+        ('inspector', 'ListExclusions'),
+        ('inspector', 'ListFindings'),
+        ('inspector', 'ListRulesPackages'),
+        ('inspector', 'ListTagsForResource'),
+        ('inspector', 'PreviewAgents'),
+        ('inspector2', 'BatchGetAccountStatus'),
+        ('inspector2', 'BatchGetFreeTrialInfo'),
+        ('inspector2', 'DescribeOrganizationConfiguration'),
+        ('inspector2', 'GetCisScanReport'),
+        ('inspector2', 'GetCisScanResultDetails'),
+        ('inspector2', 'GetConfiguration'),
+        ('inspector2', 'GetDelegatedAdminAccount'),
+        ('inspector2', 'GetEc2DeepInspectionConfiguration'),
+        ('inspector2', 'GetEncryptionKey'),
+        ('inspector2', 'GetFindingsReportStatus'),
+        ('inspector2', 'GetMember'),
+        ('inspector2', 'GetSbomExport'),
+        ('inspector2', 'ListAccountPermissions'),
+        ('inspector2', 'ListCisScanConfigurations'),
+        ('inspector2', 'ListCisScanResultsAggregatedByChecks'),
+        ('inspector2', 'ListCisScanResultsAggregatedByTargetResource'),
+        ('inspector2', 'ListCisScans'),
+        ('inspector2', 'ListCoverage'),
+        ('inspector2', 'ListCoverageStatistics'),
+        ('inspector2', 'ListDelegatedAdminAccounts'),
+        ('inspector2', 'ListFilters'),
+        ('inspector2', 'ListFindingAggregations'),
+        ('inspector2', 'ListFindings'),
+        ('inspector2', 'ListMembers'),
+        ('inspector2', 'ListTagsForResource'),
+        ('inspector2', 'ListUsageTotals'),
+        ('internetmonitor', 'GetHealthEvent'),
+        ('internetmonitor', 'GetMonitor'),
+        ('internetmonitor', 'GetQueryResults'),
+        ('internetmonitor', 'GetQueryStatus'),
+        ('internetmonitor', 'ListHealthEvents'),
+        ('internetmonitor', 'ListMonitors'),
+        ('internetmonitor', 'ListTagsForResource'),
+        ('iot', 'DescribeAccountAuditConfiguration'),
+        ('iot', 'DescribeAuditFinding'),
+        ('iot', 'DescribeAuditMitigationActionsTask'),
+        ('iot', 'DescribeAuditSuppression'),
+        ('iot', 'DescribeAuditTask'),
+        ('iot', 'DescribeAuthorizer'),
+        ('iot', 'DescribeBillingGroup'),
+        ('iot', 'DescribeCACertificate'),
+        ('iot', 'DescribeCertificate'),
+        ('iot', 'DescribeCertificateProvider'),
+        ('iot', 'DescribeCustomMetric'),
+        ('iot', 'DescribeDefaultAuthorizer'),
+        ('iot', 'DescribeDetectMitigationActionsTask'),
+        ('iot', 'DescribeDimension'),
+        ('iot', 'DescribeDomainConfiguration'),
+        ('iot', 'DescribeEndpoint'),
+        ('iot', 'DescribeEventConfigurations'),
+        ('iot', 'DescribeFleetMetric'),
+        ('iot', 'DescribeIndex'),
+        ('iot', 'DescribeJob'),
+        ('iot', 'DescribeJobExecution'),
+        ('iot', 'DescribeJobTemplate'),
+        ('iot', 'DescribeManagedJobTemplate'),
+        ('iot', 'DescribeMitigationAction'),
+        ('iot', 'DescribeProvisioningTemplate'),
+        ('iot', 'DescribeProvisioningTemplateVersion'),
+        ('iot', 'DescribeRoleAlias'),
+        ('iot', 'DescribeScheduledAudit'),
+        ('iot', 'DescribeSecurityProfile'),
+        ('iot', 'DescribeStream'),
+        ('iot', 'DescribeThing'),
+        ('iot', 'DescribeThingGroup'),
+        ('iot', 'DescribeThingRegistrationTask'),
+        ('iot', 'DescribeThingType'),
+        ('iot', 'GetBehaviorModelTrainingSummaries'),
+        ('iot', 'GetBucketsAggregation'),
+        ('iot', 'GetCardinality'),
+        ('iot', 'GetEffectivePolicies'),
+        ('iot', 'GetIndexingConfiguration'),
+        ('iot', 'GetJobDocument'),
+        ('iot', 'GetLoggingOptions'),
+        ('iot', 'GetOTAUpdate'),
+        ('iot', 'GetPackage'),
+        ('iot', 'GetPackageConfiguration'),
+        ('iot', 'GetPackageVersion'),
+        ('iot', 'GetPercentiles'),
+        ('iot', 'GetPolicy'),
+        ('iot', 'GetPolicyVersion'),
+        ('iot', 'GetRegistrationCode'),
+        ('iot', 'GetStatistics'),
+        ('iot', 'GetTopicRule'),
+        ('iot', 'GetTopicRuleDestination'),
+        ('iot', 'GetV2LoggingOptions'),
+        ('iot', 'ListActiveViolations'),
+        ('iot', 'ListAttachedPolicies'),
+        ('iot', 'ListAuditFindings'),
+        ('iot', 'ListAuditMitigationActionsExecutions'),
+        ('iot', 'ListAuditMitigationActionsTasks'),
+        ('iot', 'ListAuditSuppressions'),
+        ('iot', 'ListAuditTasks'),
+        ('iot', 'ListAuthorizers'),
+        ('iot', 'ListBillingGroups'),
+        ('iot', 'ListCACertificates'),
+        ('iot', 'ListCertificateProviders'),
+        ('iot', 'ListCertificates'),
+        ('iot', 'ListCertificatesByCA'),
+        ('iot', 'ListCustomMetrics'),
+        ('iot', 'ListDetectMitigationActionsExecutions'),
+        ('iot', 'ListDetectMitigationActionsTasks'),
+        ('iot', 'ListDimensions'),
+        ('iot', 'ListDomainConfigurations'),
+        ('iot', 'ListFleetMetrics'),
+        ('iot', 'ListIndices'),
+        ('iot', 'ListJobExecutionsForJob'),
+        ('iot', 'ListJobExecutionsForThing'),
+        ('iot', 'ListJobTemplates'),
+        ('iot', 'ListJobs'),
+        ('iot', 'ListManagedJobTemplates'),
+        ('iot', 'ListMetricValues'),
+        ('iot', 'ListMitigationActions'),
+        ('iot', 'ListOTAUpdates'),
+        ('iot', 'ListOutgoingCertificates'),
+        ('iot', 'ListPackageVersions'),
+        ('iot', 'ListPackages'),
+        ('iot', 'ListPolicies'),
+        ('iot', 'ListPolicyPrincipals'),
+        ('iot', 'ListPolicyVersions'),
+        ('iot', 'ListPrincipalPolicies'),
+        ('iot', 'ListPrincipalThings'),
+        ('iot', 'ListProvisioningTemplateVersions'),
+        ('iot', 'ListProvisioningTemplates'),
+        ('iot', 'ListRelatedResourcesForAuditFinding'),
+        ('iot', 'ListRoleAliases'),
+        ('iot', 'ListScheduledAudits'),
+        ('iot', 'ListSecurityProfiles'),
+        ('iot', 'ListSecurityProfilesForTarget'),
+        ('iot', 'ListStreams'),
+        ('iot', 'ListTagsForResource'),
+        ('iot', 'ListTargetsForPolicy'),
+        ('iot', 'ListTargetsForSecurityProfile'),
+        ('iot', 'ListThingGroups'),
+        ('iot', 'ListThingGroupsForThing'),
+        ('iot', 'ListThingPrincipals'),
+        ('iot', 'ListThingRegistrationTaskReports'),
+        ('iot', 'ListThingRegistrationTasks'),
+        ('iot', 'ListThingTypes'),
+        ('iot', 'ListThings'),
+        ('iot', 'ListThingsInBillingGroup'),
+        ('iot', 'ListThingsInThingGroup'),
+        ('iot', 'ListTopicRuleDestinations'),
+        ('iot', 'ListTopicRules'),
+        ('iot', 'ListV2LoggingLevels'),
+        ('iot', 'ListViolationEvents'),
+        ('iot-data', 'GetRetainedMessage'),
+        ('iot-data', 'GetThingShadow'),
+        ('iot-data', 'ListNamedShadowsForThing'),
+        ('iot-data', 'ListRetainedMessages'),
+        ('iot1click-devices', 'DescribeDevice'),
+        ('iot1click-devices', 'GetDeviceMethods'),
+        ('iot1click-devices', 'ListDeviceEvents'),
+        ('iot1click-devices', 'ListDevices'),
+        ('iot1click-devices', 'ListTagsForResource'),
+        ('iot1click-projects', 'DescribePlacement'),
+        ('iot1click-projects', 'DescribeProject'),
+        ('iot1click-projects', 'GetDevicesInPlacement'),
+        ('iot1click-projects', 'ListPlacements'),
+        ('iot1click-projects', 'ListProjects'),
+        ('iot1click-projects', 'ListTagsForResource'),
+        ('iotanalytics', 'DescribeChannel'),
+        ('iotanalytics', 'DescribeDataset'),
+        ('iotanalytics', 'DescribeDatastore'),
+        ('iotanalytics', 'DescribeLoggingOptions'),
+        ('iotanalytics', 'DescribePipeline'),
+        ('iotanalytics', 'GetDatasetContent'),
+        ('iotanalytics', 'ListChannels'),
+        ('iotanalytics', 'ListDatasetContents'),
+        ('iotanalytics', 'ListDatasets'),
+        ('iotanalytics', 'ListDatastores'),
+        ('iotanalytics', 'ListPipelines'),
+        ('iotanalytics', 'ListTagsForResource'),
+        ('iotanalytics', 'SampleChannelData'),
+        ('iotevents', 'DescribeAlarmModel'),
+        ('iotevents', 'DescribeDetectorModel'),
+        ('iotevents', 'DescribeDetectorModelAnalysis'),
+        ('iotevents', 'DescribeInput'),
+        ('iotevents', 'DescribeLoggingOptions'),
+        ('iotevents', 'GetDetectorModelAnalysisResults'),
+        ('iotevents', 'ListAlarmModelVersions'),
+        ('iotevents', 'ListAlarmModels'),
+        ('iotevents', 'ListDetectorModelVersions'),
+        ('iotevents', 'ListDetectorModels'),
+        ('iotevents', 'ListInputRoutings'),
+        ('iotevents', 'ListInputs'),
+        ('iotevents', 'ListTagsForResource'),
+        ('iotevents-data', 'DescribeAlarm'),
+        ('iotevents-data', 'DescribeDetector'),
+        ('iotevents-data', 'ListAlarms'),
+        ('iotevents-data', 'ListDetectors'),
+        ('iotfleethub', 'DescribeApplication'),
+        ('iotfleethub', 'ListApplications'),
+        ('iotfleethub', 'ListTagsForResource'),
+        ('iotfleetwise', 'GetCampaign'),
+        ('iotfleetwise', 'GetDecoderManifest'),
+        ('iotfleetwise', 'GetEncryptionConfiguration'),
+        ('iotfleetwise', 'GetFleet'),
+        ('iotfleetwise', 'GetLoggingOptions'),
+        ('iotfleetwise', 'GetModelManifest'),
+        ('iotfleetwise', 'GetRegisterAccountStatus'),
+        ('iotfleetwise', 'GetSignalCatalog'),
+        ('iotfleetwise', 'GetVehicle'),
+        ('iotfleetwise', 'GetVehicleStatus'),
+        ('iotfleetwise', 'ListCampaigns'),
+        ('iotfleetwise', 'ListDecoderManifestNetworkInterfaces'),
+        ('iotfleetwise', 'ListDecoderManifestSignals'),
+        ('iotfleetwise', 'ListDecoderManifests'),
+        ('iotfleetwise', 'ListFleets'),
+        ('iotfleetwise', 'ListFleetsForVehicle'),
+        ('iotfleetwise', 'ListModelManifestNodes'),
+        ('iotfleetwise', 'ListModelManifests'),
+        ('iotfleetwise', 'ListSignalCatalogNodes'),
+        ('iotfleetwise', 'ListSignalCatalogs'),
+        ('iotfleetwise', 'ListTagsForResource'),
+        ('iotfleetwise', 'ListVehicles'),
+        ('iotfleetwise', 'ListVehiclesInFleet'),
+        ('iotsecuretunneling', 'DescribeTunnel'),
+        ('iotsecuretunneling', 'ListTagsForResource'),
+        ('iotsecuretunneling', 'ListTunnels'),
+        ('iotsitewise', 'DescribeAccessPolicy'),
+        ('iotsitewise', 'DescribeAction'),
+        ('iotsitewise', 'DescribeAsset'),
+        ('iotsitewise', 'DescribeAssetCompositeModel'),
+        ('iotsitewise', 'DescribeAssetModel'),
+        ('iotsitewise', 'DescribeAssetModelCompositeModel'),
+        ('iotsitewise', 'DescribeAssetProperty'),
+        ('iotsitewise', 'DescribeBulkImportJob'),
+        ('iotsitewise', 'DescribeDashboard'),
+        ('iotsitewise', 'DescribeDefaultEncryptionConfiguration'),
+        ('iotsitewise', 'DescribeGateway'),
+        ('iotsitewise', 'DescribeGatewayCapabilityConfiguration'),
+        ('iotsitewise', 'DescribeLoggingOptions'),
+        ('iotsitewise', 'DescribePortal'),
+        ('iotsitewise', 'DescribeProject'),
+        ('iotsitewise', 'DescribeStorageConfiguration'),
+        ('iotsitewise', 'DescribeTimeSeries'),
+        ('iotsitewise', 'GetAssetPropertyAggregates'),
+        ('iotsitewise', 'GetAssetPropertyValue'),
+        ('iotsitewise', 'GetAssetPropertyValueHistory'),
+        ('iotsitewise', 'GetInterpolatedAssetPropertyValues'),
+        ('iotsitewise', 'ListAccessPolicies'),
+        ('iotsitewise', 'ListActions'),
+        ('iotsitewise', 'ListAssetModelCompositeModels'),
+        ('iotsitewise', 'ListAssetModelProperties'),
+        ('iotsitewise', 'ListAssetModels'),
+        ('iotsitewise', 'ListAssetProperties'),
+        ('iotsitewise', 'ListAssetRelationships'),
+        ('iotsitewise', 'ListAssets'),
+        ('iotsitewise', 'ListAssociatedAssets'),
+        ('iotsitewise', 'ListBulkImportJobs'),
+        ('iotsitewise', 'ListCompositionRelationships'),
+        ('iotsitewise', 'ListDashboards'),
+        ('iotsitewise', 'ListGateways'),
+        ('iotsitewise', 'ListPortals'),
+        ('iotsitewise', 'ListProjectAssets'),
+        ('iotsitewise', 'ListProjects'),
+        ('iotsitewise', 'ListTagsForResource'),
+        ('iotsitewise', 'ListTimeSeries'),
+        ('iotwireless', 'GetDestination'),
+        ('iotwireless', 'GetDeviceProfile'),
+        ('iotwireless', 'GetEventConfigurationByResourceTypes'),
+        ('iotwireless', 'GetFuotaTask'),
+        ('iotwireless', 'GetLogLevelsByResourceTypes'),
+        ('iotwireless', 'GetMetricConfiguration'),
+        ('iotwireless', 'GetMetrics'),
+        ('iotwireless', 'GetMulticastGroup'),
+        ('iotwireless', 'GetMulticastGroupSession'),
+        ('iotwireless', 'GetNetworkAnalyzerConfiguration'),
+        ('iotwireless', 'GetPartnerAccount'),
+        ('iotwireless', 'GetPosition'),
+        ('iotwireless', 'GetPositionConfiguration'),
+        ('iotwireless', 'GetPositionEstimate'),
+        ('iotwireless', 'GetResourceEventConfiguration'),
+        ('iotwireless', 'GetResourceLogLevel'),
+        ('iotwireless', 'GetResourcePosition'),
+        ('iotwireless', 'GetServiceEndpoint'),
+        ('iotwireless', 'GetServiceProfile'),
+        ('iotwireless', 'GetWirelessDevice'),
+        ('iotwireless', 'GetWirelessDeviceImportTask'),
+        ('iotwireless', 'GetWirelessDeviceStatistics'),
+        ('iotwireless', 'GetWirelessGateway'),
+        ('iotwireless', 'GetWirelessGatewayCertificate'),
+        ('iotwireless', 'GetWirelessGatewayFirmwareInformation'),
+        ('iotwireless', 'GetWirelessGatewayStatistics'),
+        ('iotwireless', 'GetWirelessGatewayTask'),
+        ('iotwireless', 'GetWirelessGatewayTaskDefinition'),
+        ('iotwireless', 'ListDestinations'),
+        ('iotwireless', 'ListDeviceProfiles'),
+        ('iotwireless', 'ListDevicesForWirelessDeviceImportTask'),
+        ('iotwireless', 'ListEventConfigurations'),
+        ('iotwireless', 'ListFuotaTasks'),
+        ('iotwireless', 'ListMulticastGroups'),
+        ('iotwireless', 'ListMulticastGroupsByFuotaTask'),
+        ('iotwireless', 'ListNetworkAnalyzerConfigurations'),
+        ('iotwireless', 'ListPartnerAccounts'),
+        ('iotwireless', 'ListPositionConfigurations'),
+        ('iotwireless', 'ListQueuedMessages'),
+        ('iotwireless', 'ListServiceProfiles'),
+        ('iotwireless', 'ListTagsForResource'),
+        ('iotwireless', 'ListWirelessDeviceImportTasks'),
+        ('iotwireless', 'ListWirelessDevices'),
+        ('iotwireless', 'ListWirelessGatewayTaskDefinitions'),
+        ('iotwireless', 'ListWirelessGateways'),
+        ('ivs', 'BatchGetChannel'),
+        ('ivs', 'GetChannel'),
+        ('ivs', 'GetPlaybackKeyPair'),
+        ('ivs', 'GetPlaybackRestrictionPolicy'),
+        ('ivs', 'GetRecordingConfiguration'),
+        ('ivs', 'GetStream'),
+        ('ivs', 'GetStreamKey'),
+        ('ivs', 'GetStreamSession'),
+        ('ivs', 'ListChannels'),
+        ('ivs', 'ListPlaybackKeyPairs'),
+        ('ivs', 'ListPlaybackRestrictionPolicies'),
+        ('ivs', 'ListRecordingConfigurations'),
+        ('ivs', 'ListStreamKeys'),
+        ('ivs', 'ListStreamSessions'),
+        ('ivs', 'ListStreams'),
+        ('ivs', 'ListTagsForResource'),
+        ('ivs-realtime', 'GetComposition'),
+        ('ivs-realtime', 'GetEncoderConfiguration'),
+        ('ivs-realtime', 'GetParticipant'),
+        ('ivs-realtime', 'GetStage'),
+        ('ivs-realtime', 'GetStageSession'),
+        ('ivs-realtime', 'GetStorageConfiguration'),
+        ('ivs-realtime', 'ListCompositions'),
+        ('ivs-realtime', 'ListEncoderConfigurations'),
+        ('ivs-realtime', 'ListParticipantEvents'),
+        ('ivs-realtime', 'ListParticipants'),
+        ('ivs-realtime', 'ListStageSessions'),
+        ('ivs-realtime', 'ListStages'),
+        ('ivs-realtime', 'ListStorageConfigurations'),
+        ('ivs-realtime', 'ListTagsForResource'),
+        ('ivschat', 'GetLoggingConfiguration'),
+        ('ivschat', 'GetRoom'),
+        ('ivschat', 'ListLoggingConfigurations'),
+        ('ivschat', 'ListRooms'),
+        ('ivschat', 'ListTagsForResource'),
+        ('kafka', 'DescribeCluster'),
+        ('kafka', 'DescribeClusterOperation'),
+        ('kafka', 'DescribeClusterOperationV2'),
+        ('kafka', 'DescribeClusterV2'),
+        ('kafka', 'DescribeConfiguration'),
+        ('kafka', 'DescribeConfigurationRevision'),
+        ('kafka', 'DescribeReplicator'),
+        ('kafka', 'DescribeVpcConnection'),
+        ('kafka', 'GetBootstrapBrokers'),
+        ('kafka', 'GetClusterPolicy'),
+        ('kafka', 'GetCompatibleKafkaVersions'),
+        ('kafka', 'ListClientVpcConnections'),
+        ('kafka', 'ListClusterOperations'),
+        ('kafka', 'ListClusterOperationsV2'),
+        ('kafka', 'ListClusters'),
+        ('kafka', 'ListClustersV2'),
+        ('kafka', 'ListConfigurationRevisions'),
+        ('kafka', 'ListConfigurations'),
+        ('kafka', 'ListKafkaVersions'),
+        ('kafka', 'ListNodes'),
+        ('kafka', 'ListReplicators'),
+        ('kafka', 'ListScramSecrets'),
+        ('kafka', 'ListTagsForResource'),
+        ('kafka', 'ListVpcConnections'),
+        ('kafkaconnect', 'DescribeConnector'),
+        ('kafkaconnect', 'DescribeCustomPlugin'),
+        ('kafkaconnect', 'DescribeWorkerConfiguration'),
+        ('kafkaconnect', 'ListConnectors'),
+        ('kafkaconnect', 'ListCustomPlugins'),
+        ('kafkaconnect', 'ListTagsForResource'),
+        ('kafkaconnect', 'ListWorkerConfigurations'),
+        ('kendra', 'BatchGetDocumentStatus'),
+        ('kendra', 'DescribeAccessControlConfiguration'),
+        ('kendra', 'DescribeDataSource'),
+        ('kendra', 'DescribeExperience'),
+        ('kendra', 'DescribeFaq'),
+        ('kendra', 'DescribeFeaturedResultsSet'),
+        ('kendra', 'DescribeIndex'),
+        ('kendra', 'DescribePrincipalMapping'),
+        ('kendra', 'DescribeQuerySuggestionsBlockList'),
+        ('kendra', 'DescribeQuerySuggestionsConfig'),
+        ('kendra', 'DescribeThesaurus'),
+        ('kendra', 'GetQuerySuggestions'),
+        ('kendra', 'GetSnapshots'),
+        ('kendra', 'ListAccessControlConfigurations'),
+        ('kendra', 'ListDataSourceSyncJobs'),
+        ('kendra', 'ListDataSources'),
+        ('kendra', 'ListEntityPersonas'),
+        ('kendra', 'ListExperienceEntities'),
+        ('kendra', 'ListExperiences'),
+        ('kendra', 'ListFaqs'),
+        ('kendra', 'ListFeaturedResultsSets'),
+        ('kendra', 'ListGroupsOlderThanOrderingId'),
+        ('kendra', 'ListIndices'),
+        ('kendra', 'ListQuerySuggestionsBlockLists'),
+        ('kendra', 'ListTagsForResource'),
+        ('kendra', 'ListThesauri'),
+        ('kendra', 'Query'),
+        ('keyspaces', 'GetKeyspace'),
+        ('keyspaces', 'GetTable'),
+        ('keyspaces', 'GetTableAutoScalingSettings'),
+        ('keyspaces', 'ListKeyspaces'),
+        ('keyspaces', 'ListTables'),
+        ('keyspaces', 'ListTagsForResource'),
+        ('kinesis', 'DescribeLimits'),
+        ('kinesis', 'DescribeStream'),
+        ('kinesis', 'DescribeStreamConsumer'),
+        ('kinesis', 'DescribeStreamSummary'),
+        ('kinesis', 'GetRecords'),
+        ('kinesis', 'GetResourcePolicy'),
+        ('kinesis', 'GetShardIterator'),
+        ('kinesis', 'ListShards'),
+        ('kinesis', 'ListStreamConsumers'),
+        ('kinesis', 'ListStreams'),
+        ('kinesis', 'ListTagsForStream'),
+        ('kinesis-video-archived-media', 'GetClip'),
+        ('kinesis-video-archived-media', 'GetDASHStreamingSessionURL'),
+        ('kinesis-video-archived-media', 'GetHLSStreamingSessionURL'),
+        ('kinesis-video-archived-media', 'GetImages'),
+        ('kinesis-video-archived-media', 'GetMediaForFragmentList'),
+        ('kinesis-video-archived-media', 'ListFragments'),
+        ('kinesis-video-media', 'GetMedia'),
+        ('kinesis-video-signaling', 'GetIceServerConfig'),
+        ('kinesisanalytics', 'DescribeApplication'),
+        ('kinesisanalytics', 'DiscoverInputSchema'),
+        ('kinesisanalytics', 'ListApplications'),
+        ('kinesisanalytics', 'ListTagsForResource'),
+        ('kinesisanalyticsv2', 'DescribeApplication'),
+        ('kinesisanalyticsv2', 'DescribeApplicationSnapshot'),
+        ('kinesisanalyticsv2', 'DescribeApplicationVersion'),
+        ('kinesisanalyticsv2', 'DiscoverInputSchema'),
+        ('kinesisanalyticsv2', 'ListApplicationSnapshots'),
+        ('kinesisanalyticsv2', 'ListApplicationVersions'),
+        ('kinesisanalyticsv2', 'ListApplications'),
+        ('kinesisanalyticsv2', 'ListTagsForResource'),
+        ('kinesisvideo', 'DescribeEdgeConfiguration'),
+        ('kinesisvideo', 'DescribeImageGenerationConfiguration'),
+        ('kinesisvideo', 'DescribeMappedResourceConfiguration'),
+        ('kinesisvideo', 'DescribeMediaStorageConfiguration'),
+        ('kinesisvideo', 'DescribeNotificationConfiguration'),
+        ('kinesisvideo', 'DescribeSignalingChannel'),
+        ('kinesisvideo', 'DescribeStream'),
+        ('kinesisvideo', 'GetDataEndpoint'),
+        ('kinesisvideo', 'GetSignalingChannelEndpoint'),
+        ('kinesisvideo', 'ListEdgeAgentConfigurations'),
+        ('kinesisvideo', 'ListSignalingChannels'),
+        ('kinesisvideo', 'ListStreams'),
+        ('kinesisvideo', 'ListTagsForResource'),
+        ('kinesisvideo', 'ListTagsForStream'),
+        ('kms', 'DescribeCustomKeyStores'),
+        ('kms', 'DescribeKey'),
+        ('kms', 'GetKeyPolicy'),
+        ('kms', 'GetKeyRotationStatus'),
+        ('kms', 'GetParametersForImport'),
+        ('kms', 'GetPublicKey'),
+        ('kms', 'ListAliases'),
+        ('kms', 'ListGrants'),
+        ('kms', 'ListKeyPolicies'),
+        ('kms', 'ListKeyRotations'),
+        ('kms', 'ListKeys'),
+        ('kms', 'ListResourceTags'),
+        ('kms', 'ListRetirableGrants'),
+        ('lakeformation', 'DescribeLakeFormationIdentityCenterConfiguration'),
+        ('lakeformation', 'DescribeResource'),
+        ('lakeformation', 'DescribeTransaction'),
+        ('lakeformation', 'GetDataCellsFilter'),
+        ('lakeformation', 'GetDataLakeSettings'),
+        ('lakeformation', 'GetEffectivePermissionsForPath'),
+        ('lakeformation', 'GetLFTag'),
+        ('lakeformation', 'GetQueryState'),
+        ('lakeformation', 'GetQueryStatistics'),
+        ('lakeformation', 'GetResourceLFTags'),
+        ('lakeformation', 'GetTableObjects'),
+        ('lakeformation', 'GetTemporaryGluePartitionCredentials'),
+        ('lakeformation', 'GetTemporaryGlueTableCredentials'),
+        ('lakeformation', 'GetWorkUnitResults'),
+        ('lakeformation', 'GetWorkUnits'),
+        ('lakeformation', 'ListDataCellsFilter'),
+        ('lakeformation', 'ListLFTags'),
+        ('lakeformation', 'ListLakeFormationOptIns'),
+        ('lakeformation', 'ListPermissions'),
+        ('lakeformation', 'ListResources'),
+        ('lakeformation', 'ListTableStorageOptimizers'),
+        ('lakeformation', 'ListTransactions'),
+        ('lambda', 'GetAccountSettings'),
+        ('lambda', 'GetAlias'),
+        ('lambda', 'GetCodeSigningConfig'),
+        ('lambda', 'GetEventSourceMapping'),
+        ('lambda', 'GetFunction'),
+        ('lambda', 'GetFunctionCodeSigningConfig'),
+        ('lambda', 'GetFunctionConcurrency'),
+        ('lambda', 'GetFunctionConfiguration'),
+        ('lambda', 'GetFunctionEventInvokeConfig'),
+        ('lambda', 'GetFunctionUrlConfig'),
+        ('lambda', 'GetLayerVersion'),
+        ('lambda', 'GetLayerVersionByArn'),
+        ('lambda', 'GetLayerVersionPolicy'),
+        ('lambda', 'GetPolicy'),
+        ('lambda', 'GetProvisionedConcurrencyConfig'),
+        ('lambda', 'GetRuntimeManagementConfig'),
+        ('lambda', 'ListAliases'),
+        ('lambda', 'ListCodeSigningConfigs'),
+        ('lambda', 'ListEventSourceMappings'),
+        ('lambda', 'ListFunctionEventInvokeConfigs'),
+        ('lambda', 'ListFunctionUrlConfigs'),
+        ('lambda', 'ListFunctions'),
+        ('lambda', 'ListFunctionsByCodeSigningConfig'),
+        ('lambda', 'ListLayerVersions'),
+        ('lambda', 'ListLayers'),
+        ('lambda', 'ListProvisionedConcurrencyConfigs'),
+        ('lambda', 'ListTags'),
+        ('lambda', 'ListVersionsByFunction'),
+        ('launch-wizard', 'GetDeployment'),
+        ('launch-wizard', 'GetWorkload'),
+        ('launch-wizard', 'ListDeploymentEvents'),
+        ('launch-wizard', 'ListDeployments'),
+        ('launch-wizard', 'ListWorkloadDeploymentPatterns'),
+        ('launch-wizard', 'ListWorkloads'),
+        ('lex-models', 'GetBot'),
+        ('lex-models', 'GetBotAlias'),
+        ('lex-models', 'GetBotAliases'),
+        ('lex-models', 'GetBotChannelAssociation'),
+        ('lex-models', 'GetBotChannelAssociations'),
+        ('lex-models', 'GetBotVersions'),
+        ('lex-models', 'GetBots'),
+        ('lex-models', 'GetBuiltinIntent'),
+        ('lex-models', 'GetBuiltinIntents'),
+        ('lex-models', 'GetBuiltinSlotTypes'),
+        ('lex-models', 'GetExport'),
+        ('lex-models', 'GetImport'),
+        ('lex-models', 'GetIntent'),
+        ('lex-models', 'GetIntentVersions'),
+        ('lex-models', 'GetIntents'),
+        ('lex-models', 'GetMigration'),
+        ('lex-models', 'GetMigrations'),
+        ('lex-models', 'GetSlotType'),
+        ('lex-models', 'GetSlotTypeVersions'),
+        ('lex-models', 'GetSlotTypes'),
+        ('lex-models', 'GetUtterancesView'),
+        ('lex-models', 'ListTagsForResource'),
+        ('lexv2-models', 'DescribeBot'),
+        ('lexv2-models', 'DescribeBotAlias'),
+        ('lexv2-models', 'DescribeBotLocale'),
+        ('lexv2-models', 'DescribeBotVersion'),
+        ('lexv2-models', 'DescribeExport'),
+        ('lexv2-models', 'DescribeImport'),
+        ('lexv2-models', 'DescribeIntent'),
+        ('lexv2-models', 'DescribeResourcePolicy'),
+        ('lexv2-models', 'DescribeSlot'),
+        ('lexv2-models', 'DescribeSlotType'),
+        ('lexv2-models', 'GetTestExecutionArtifactsUrl'),
+        ('lexv2-models', 'ListBotAliases'),
+        ('lexv2-models', 'ListBotLocales'),
+        ('lexv2-models', 'ListBotVersions'),
+        ('lexv2-models', 'ListBots'),
+        ('lexv2-models', 'ListBuiltInIntents'),
+        ('lexv2-models', 'ListBuiltInSlotTypes'),
+        ('lexv2-models', 'ListExports'),
+        ('lexv2-models', 'ListImports'),
+        ('lexv2-models', 'ListIntents'),
+        ('lexv2-models', 'ListSlotTypes'),
+        ('lexv2-models', 'ListSlots'),
+        ('lexv2-models', 'ListTagsForResource'),
+        ('license-manager', 'GetAccessToken'),
+        ('license-manager', 'GetGrant'),
+        ('license-manager', 'GetLicense'),
+        ('license-manager', 'GetLicenseConfiguration'),
+        ('license-manager', 'GetLicenseConversionTask'),
+        ('license-manager', 'GetLicenseManagerReportGenerator'),
+        ('license-manager', 'GetLicenseUsage'),
+        ('license-manager', 'GetServiceSettings'),
+        ('license-manager', 'ListAssociationsForLicenseConfiguration'),
+        ('license-manager', 'ListDistributedGrants'),
+        ('license-manager', 'ListFailuresForLicenseConfigurationOperations'),
+        ('license-manager', 'ListLicenseConfigurations'),
+        ('license-manager', 'ListLicenseConversionTasks'),
+        ('license-manager', 'ListLicenseManagerReportGenerators'),
+        ('license-manager', 'ListLicenseSpecificationsForResource'),
+        ('license-manager', 'ListLicenseVersions'),
+        ('license-manager', 'ListLicenses'),
+        ('license-manager', 'ListReceivedGrants'),
+        ('license-manager', 'ListReceivedGrantsForOrganization'),
+        ('license-manager', 'ListReceivedLicenses'),
+        ('license-manager', 'ListReceivedLicensesForOrganization'),
+        ('license-manager', 'ListResourceInventory'),
+        ('license-manager', 'ListTagsForResource'),
+        ('license-manager', 'ListTokens'),
+        ('license-manager', 'ListUsageForLicenseConfiguration'),
+        ('lightsail', 'GetActiveNames'),
+        ('lightsail', 'GetAlarms'),
+        ('lightsail', 'GetAutoSnapshots'),
+        ('lightsail', 'GetBlueprints'),
+        ('lightsail', 'GetBucketAccessKeys'),
+        ('lightsail', 'GetBucketBundles'),
+        ('lightsail', 'GetBucketMetricData'),
+        ('lightsail', 'GetBuckets'),
+        ('lightsail', 'GetBundles'),
+        ('lightsail', 'GetCertificates'),
+        ('lightsail', 'GetCloudFormationStackRecords'),
+        ('lightsail', 'GetContainerAPIMetadata'),
+        ('lightsail', 'GetContainerImages'),
+        ('lightsail', 'GetContainerServiceDeployments'),
+        ('lightsail', 'GetContainerServiceMetricData'),
+        ('lightsail', 'GetContainerServicePowers'),
+        ('lightsail', 'GetContainerServices'),
+        ('lightsail', 'GetDisk'),
+        ('lightsail', 'GetDiskSnapshot'),
+        ('lightsail', 'GetDiskSnapshots'),
+        ('lightsail', 'GetDisks'),
+        ('lightsail', 'GetDistributionBundles'),
+        ('lightsail', 'GetDistributionLatestCacheReset'),
+        ('lightsail', 'GetDistributionMetricData'),
+        ('lightsail', 'GetDistributions'),
+        ('lightsail', 'GetDomain'),
+        ('lightsail', 'GetDomains'),
+        ('lightsail', 'GetExportSnapshotRecords'),
+        ('lightsail', 'GetInstance'),
+        ('lightsail', 'GetInstanceMetricData'),
+        ('lightsail', 'GetInstancePortStates'),
+        ('lightsail', 'GetInstanceSnapshot'),
+        ('lightsail', 'GetInstanceSnapshots'),
+        ('lightsail', 'GetInstanceState'),
+        ('lightsail', 'GetInstances'),
+        ('lightsail', 'GetKeyPair'),
+        ('lightsail', 'GetKeyPairs'),
+        ('lightsail', 'GetLoadBalancer'),
+        ('lightsail', 'GetLoadBalancerMetricData'),
+        ('lightsail', 'GetLoadBalancerTlsCertificates'),
+        ('lightsail', 'GetLoadBalancers'),
+        ('lightsail', 'GetOperation'),
+        ('lightsail', 'GetOperations'),
+        ('lightsail', 'GetOperationsForResource'),
+        ('lightsail', 'GetRegions'),
+        ('lightsail', 'GetRelationalDatabase'),
+        ('lightsail', 'GetRelationalDatabaseBlueprints'),
+        ('lightsail', 'GetRelationalDatabaseBundles'),
+        ('lightsail', 'GetRelationalDatabaseEvents'),
+        ('lightsail', 'GetRelationalDatabaseLogEvents'),
+        ('lightsail', 'GetRelationalDatabaseLogStreams'),
+        ('lightsail', 'GetRelationalDatabaseMetricData'),
+        ('lightsail', 'GetRelationalDatabaseParameters'),
+        ('lightsail', 'GetRelationalDatabaseSnapshot'),
+        ('lightsail', 'GetRelationalDatabaseSnapshots'),
+        ('lightsail', 'GetRelationalDatabases'),
+        ('lightsail', 'GetStaticIp'),
+        ('lightsail', 'GetStaticIps'),
+        ('lightsail', 'IsVpcPeered'),
+        ('logs', 'DescribeAccountPolicies'),
+        ('logs', 'DescribeDeliveries'),
+        ('logs', 'DescribeDeliveryDestinations'),
+        ('logs', 'DescribeDeliverySources'),
+        ('logs', 'DescribeDestinations'),
+        ('logs', 'DescribeExportTasks'),
+        ('logs', 'DescribeLogGroups'),
+        ('logs', 'DescribeLogStreams'),
+        ('logs', 'DescribeMetricFilters'),
+        ('logs', 'DescribeQueries'),
+        ('logs', 'DescribeQueryDefinitions'),
+        ('logs', 'DescribeResourcePolicies'),
+        ('logs', 'DescribeSubscriptionFilters'),
+        ('logs', 'FilterLogEvents'),
+        ('logs', 'GetDataProtectionPolicy'),
+        ('logs', 'GetDelivery'),
+        ('logs', 'GetDeliveryDestination'),
+        ('logs', 'GetDeliveryDestinationPolicy'),
+        ('logs', 'GetDeliverySource'),
+        ('logs', 'GetLogAnomalyDetector'),
+        ('logs', 'GetLogEvents'),
+        ('logs', 'GetLogGroupFields'),
+        ('logs', 'GetLogRecord'),
+        ('logs', 'GetQueryResults'),
+        ('logs', 'ListAnomalies'),
+        ('logs', 'ListLogAnomalyDetectors'),
+        ('logs', 'ListTagsForResource'),
+        ('logs', 'ListTagsLogGroup'),
+        ('logs', 'StartLiveTail'),
+        ('logs', 'StartQuery'),
+        ('logs', 'StopQuery'),
+        ('logs', 'TestMetricFilter'),
+        ('logs', 'TestTransformer'),
+        ('logs', 'start-live-tail'),
+        ('lookoutequipment', 'DescribeDataIngestionJob'),
+        ('lookoutequipment', 'DescribeDataset'),
+        ('lookoutequipment', 'DescribeInferenceScheduler'),
+        ('lookoutequipment', 'DescribeLabel'),
+        ('lookoutequipment', 'DescribeLabelGroup'),
+        ('lookoutequipment', 'DescribeModel'),
+        ('lookoutequipment', 'DescribeModelVersion'),
+        ('lookoutequipment', 'DescribeResourcePolicy'),
+        ('lookoutequipment', 'DescribeRetrainingScheduler'),
+        ('lookoutequipment', 'ListDataIngestionJobs'),
+        ('lookoutequipment', 'ListDatasets'),
+        ('lookoutequipment', 'ListInferenceEvents'),
+        ('lookoutequipment', 'ListInferenceExecutions'),
+        ('lookoutequipment', 'ListInferenceSchedulers'),
+        ('lookoutequipment', 'ListLabelGroups'),
+        ('lookoutequipment', 'ListLabels'),
+        ('lookoutequipment', 'ListModelVersions'),
+        ('lookoutequipment', 'ListModels'),
+        ('lookoutequipment', 'ListRetrainingSchedulers'),
+        ('lookoutequipment', 'ListSensorStatistics'),
+        ('lookoutequipment', 'ListTagsForResource'),
+        ('lookoutmetrics', 'DescribeAlert'),
+        ('lookoutmetrics', 'DescribeAnomalyDetectionExecutions'),
+        ('lookoutmetrics', 'DescribeAnomalyDetector'),
+        ('lookoutmetrics', 'DescribeMetricSet'),
+        ('lookoutmetrics', 'GetAnomalyGroup'),
+        ('lookoutmetrics', 'GetDataQualityMetrics'),
+        ('lookoutmetrics', 'GetFeedback'),
+        ('lookoutmetrics', 'GetSampleData'),
+        ('lookoutmetrics', 'ListAlerts'),
+        ('lookoutmetrics', 'ListAnomalyDetectors'),
+        ('lookoutmetrics', 'ListAnomalyGroupRelatedMetrics'),
+        ('lookoutmetrics', 'ListAnomalyGroupSummaries'),
+        ('lookoutmetrics', 'ListAnomalyGroupTimeSeries'),
+        ('lookoutmetrics', 'ListMetricSets'),
+        ('lookoutmetrics', 'ListTagsForResource'),
+        ('lookoutvision', 'DescribeDataset'),
+        ('lookoutvision', 'DescribeModel'),
+        ('lookoutvision', 'DescribeModelPackagingJob'),
+        ('lookoutvision', 'DescribeProject'),
+        ('lookoutvision', 'ListDatasetEntries'),
+        ('lookoutvision', 'ListModelPackagingJobs'),
+        ('lookoutvision', 'ListModels'),
+        ('lookoutvision', 'ListProjects'),
+        ('lookoutvision', 'ListTagsForResource'),
+        ('m2', 'GetApplication'),
+        ('m2', 'GetApplicationVersion'),
+        ('m2', 'GetBatchJobExecution'),
+        ('m2', 'GetDataSetDetails'),
+        ('m2', 'GetDataSetImportTask'),
+        ('m2', 'GetDeployment'),
+        ('m2', 'GetEnvironment'),
+        ('m2', 'GetSignedBluinsightsUrl'),
+        ('m2', 'ListApplicationVersions'),
+        ('m2', 'ListApplications'),
+        ('m2', 'ListBatchJobDefinitions'),
+        ('m2', 'ListBatchJobExecutions'),
+        ('m2', 'ListDataSetImportHistory'),
+        ('m2', 'ListDataSets'),
+        ('m2', 'ListDeployments'),
+        ('m2', 'ListEngineVersions'),
+        ('m2', 'ListEnvironments'),
+        ('m2', 'ListTagsForResource'),
+        ('machinelearning', 'DescribeBatchPredictions'),
+        ('machinelearning', 'DescribeDataSources'),
+        ('machinelearning', 'DescribeEvaluations'),
+        ('machinelearning', 'DescribeMLModels'),
+        ('machinelearning', 'DescribeTags'),
+        ('machinelearning', 'GetBatchPrediction'),
+        ('machinelearning', 'GetDataSource'),
+        ('machinelearning', 'GetEvaluation'),
+        ('machinelearning', 'GetMLModel'),
+        ('macie2', 'BatchGetCustomDataIdentifiers'),
+        ('macie2', 'DescribeBuckets'),
+        ('macie2', 'DescribeClassificationJob'),
+        ('macie2', 'DescribeOrganizationConfiguration'),
+        ('macie2', 'GetAdministratorAccount'),
+        ('macie2', 'GetAllowList'),
+        ('macie2', 'GetAutomatedDiscoveryConfiguration'),
+        ('macie2', 'GetBucketStatistics'),
+        ('macie2', 'GetClassificationExportConfiguration'),
+        ('macie2', 'GetClassificationScope'),
+        ('macie2', 'GetCustomDataIdentifier'),
+        ('macie2', 'GetFindingStatistics'),
+        ('macie2', 'GetFindings'),
+        ('macie2', 'GetFindingsFilter'),
+        ('macie2', 'GetFindingsPublicationConfiguration'),
+        ('macie2', 'GetInvitationsCount'),
+        ('macie2', 'GetMacieSession'),
+        ('macie2', 'GetMasterAccount'),
+        ('macie2', 'GetMember'),
+        ('macie2', 'GetResourceProfile'),
+        ('macie2', 'GetRevealConfiguration'),
+        ('macie2', 'GetSensitiveDataOccurrences'),
+        ('macie2', 'GetSensitiveDataOccurrencesAvailability'),
+        ('macie2', 'GetSensitivityInspectionTemplate'),
+        ('macie2', 'GetUsageStatistics'),
+        ('macie2', 'GetUsageTotals'),
+        ('macie2', 'ListAllowLists'),
+        ('macie2', 'ListClassificationJobs'),
+        ('macie2', 'ListClassificationScopes'),
+        ('macie2', 'ListCustomDataIdentifiers'),
+        ('macie2', 'ListFindings'),
+        ('macie2', 'ListFindingsFilters'),
+        ('macie2', 'ListInvitations'),
+        ('macie2', 'ListManagedDataIdentifiers'),
+        ('macie2', 'ListMembers'),
+        ('macie2', 'ListOrganizationAdminAccounts'),
+        ('macie2', 'ListResourceProfileArtifacts'),
+        ('macie2', 'ListResourceProfileDetections'),
+        ('macie2', 'ListSensitivityInspectionTemplates'),
+        ('macie2', 'ListTagsForResource'),
+        ('macie2', 'SearchResources'),
+        ('managedblockchain', 'GetAccessor'),
+        ('managedblockchain', 'GetMember'),
+        ('managedblockchain', 'GetNetwork'),
+        ('managedblockchain', 'GetNode'),
+        ('managedblockchain', 'GetProposal'),
+        ('managedblockchain', 'ListAccessors'),
+        ('managedblockchain', 'ListInvitations'),
+        ('managedblockchain', 'ListMembers'),
+        ('managedblockchain', 'ListNetworks'),
+        ('managedblockchain', 'ListNodes'),
+        ('managedblockchain', 'ListProposalVotes'),
+        ('managedblockchain', 'ListProposals'),
+        ('managedblockchain', 'ListTagsForResource'),
+        ('mediaconnect', 'DescribeBridge'),
+        ('mediaconnect', 'DescribeFlow'),
+        ('mediaconnect', 'DescribeFlowSourceMetadata'),
+        ('mediaconnect', 'DescribeGateway'),
+        ('mediaconnect', 'DescribeGatewayInstance'),
+        ('mediaconnect', 'DescribeOffering'),
+        ('mediaconnect', 'DescribeReservation'),
+        ('mediaconnect', 'ListBridges'),
+        ('mediaconnect', 'ListEntitlements'),
+        ('mediaconnect', 'ListFlows'),
+        ('mediaconnect', 'ListGatewayInstances'),
+        ('mediaconnect', 'ListGateways'),
+        ('mediaconnect', 'ListOfferings'),
+        ('mediaconnect', 'ListReservations'),
+        ('mediaconnect', 'ListTagsForResource'),
+        ('mediaconvert', 'DescribeEndpoints'),
+        ('mediaconvert', 'GetJob'),
+        ('mediaconvert', 'GetJobTemplate'),
+        ('mediaconvert', 'GetPolicy'),
+        ('mediaconvert', 'GetPreset'),
+        ('mediaconvert', 'GetQueue'),
+        ('mediaconvert', 'ListJobTemplates'),
+        ('mediaconvert', 'ListJobs'),
+        ('mediaconvert', 'ListPresets'),
+        ('mediaconvert', 'ListQueues'),
+        ('mediaconvert', 'ListTagsForResource'),
+        ('medialive', 'DescribeAccountConfiguration'),
+        ('medialive', 'DescribeChannel'),
+        ('medialive', 'DescribeInput'),
+        ('medialive', 'DescribeInputDevice'),
+        ('medialive', 'DescribeInputDeviceThumbnail'),
+        ('medialive', 'DescribeInputSecurityGroup'),
+        ('medialive', 'DescribeMultiplex'),
+        ('medialive', 'DescribeMultiplexProgram'),
+        ('medialive', 'DescribeOffering'),
+        ('medialive', 'DescribeReservation'),
+        ('medialive', 'DescribeSchedule'),
+        ('medialive', 'DescribeThumbnails'),
+        ('medialive', 'GetCloudWatchAlarmTemplate'),
+        ('medialive', 'GetCloudWatchAlarmTemplateGroup'),
+        ('medialive', 'GetEventBridgeRuleTemplate'),
+        ('medialive', 'GetEventBridgeRuleTemplateGroup'),
+        ('medialive', 'GetSignalMap'),
+        ('medialive', 'ListChannels'),
+        ('medialive', 'ListCloudWatchAlarmTemplateGroups'),
+        ('medialive', 'ListCloudWatchAlarmTemplates'),
+        ('medialive', 'ListEventBridgeRuleTemplateGroups'),
+        ('medialive', 'ListEventBridgeRuleTemplates'),
+        ('medialive', 'ListInputDeviceTransfers'),
+        ('medialive', 'ListInputDevices'),
+        ('medialive', 'ListInputSecurityGroups'),
+        ('medialive', 'ListInputs'),
+        ('medialive', 'ListMultiplexPrograms'),
+        ('medialive', 'ListMultiplexes'),
+        ('medialive', 'ListOfferings'),
+        ('medialive', 'ListReservations'),
+        ('medialive', 'ListSignalMaps'),
+        ('medialive', 'ListTagsForResource'),
+        ('mediapackage', 'DescribeChannel'),
+        ('mediapackage', 'DescribeHarvestJob'),
+        ('mediapackage', 'DescribeOriginEndpoint'),
+        ('mediapackage', 'ListChannels'),
+        ('mediapackage', 'ListHarvestJobs'),
+        ('mediapackage', 'ListOriginEndpoints'),
+        ('mediapackage', 'ListTagsForResource'),
+        ('mediapackage-vod', 'DescribeAsset'),
+        ('mediapackage-vod', 'DescribePackagingConfiguration'),
+        ('mediapackage-vod', 'DescribePackagingGroup'),
+        ('mediapackage-vod', 'ListAssets'),
+        ('mediapackage-vod', 'ListPackagingConfigurations'),
+        ('mediapackage-vod', 'ListPackagingGroups'),
+        ('mediapackage-vod', 'ListTagsForResource'),
+        ('mediapackagev2', 'GetChannel'),
+        ('mediapackagev2', 'GetChannelGroup'),
+        ('mediapackagev2', 'GetChannelPolicy'),
+        ('mediapackagev2', 'GetOriginEndpoint'),
+        ('mediapackagev2', 'GetOriginEndpointPolicy'),
+        ('mediapackagev2', 'ListChannelGroups'),
+        ('mediapackagev2', 'ListChannels'),
+        ('mediapackagev2', 'ListOriginEndpoints'),
+        ('mediapackagev2', 'ListTagsForResource'),
+        ('mediastore', 'DescribeContainer'),
+        ('mediastore', 'GetContainerPolicy'),
+        ('mediastore', 'GetCorsPolicy'),
+        ('mediastore', 'GetLifecyclePolicy'),
+        ('mediastore', 'GetMetricPolicy'),
+        ('mediastore', 'ListContainers'),
+        ('mediastore', 'ListTagsForResource'),
+        ('mediastore-data', 'DescribeObject'),
+        ('mediastore-data', 'GetObject'),
+        ('mediastore-data', 'ListItems'),
+        ('memorydb', 'DescribeACLs'),
+        ('memorydb', 'DescribeClusters'),
+        ('memorydb', 'DescribeEngineVersions'),
+        ('memorydb', 'DescribeEvents'),
+        ('memorydb', 'DescribeParameterGroups'),
+        ('memorydb', 'DescribeParameters'),
+        ('memorydb', 'DescribeReservedNodes'),
+        ('memorydb', 'DescribeReservedNodesOfferings'),
+        ('memorydb', 'DescribeServiceUpdates'),
+        ('memorydb', 'DescribeSnapshots'),
+        ('memorydb', 'DescribeSubnetGroups'),
+        ('memorydb', 'DescribeUsers'),
+        ('memorydb', 'ListAllowedNodeTypeUpdates'),
+        ('memorydb', 'ListTags'),
+        ('mgh', 'DescribeApplicationState'),
+        ('mgh', 'DescribeMigrationTask'),
+        ('mgh', 'ListApplicationStates'),
+        ('mgh', 'ListCreatedArtifacts'),
+        ('mgh', 'ListDiscoveredResources'),
+        ('mgh', 'ListMigrationTasks'),
+        ('mgh', 'ListProgressUpdateStreams'),
+        ('mgn', 'DescribeJobLogItems'),
+        ('mgn', 'DescribeJobs'),
+        ('mgn', 'DescribeLaunchConfigurationTemplates'),
+        ('mgn', 'DescribeReplicationConfigurationTemplates'),
+        ('mgn', 'DescribeSourceServers'),
+        ('mgn', 'DescribeVcenterClients'),
+        ('mgn', 'GetLaunchConfiguration'),
+        ('mgn', 'GetReplicationConfiguration'),
+        ('mgn', 'ListApplications'),
+        ('mgn', 'ListConnectors'),
+        ('mgn', 'ListExportErrors'),
+        ('mgn', 'ListExports'),
+        ('mgn', 'ListImportErrors'),
+        ('mgn', 'ListImports'),
+        ('mgn', 'ListManagedAccounts'),
+        ('mgn', 'ListSourceServerActions'),
+        ('mgn', 'ListTagsForResource'),
+        ('mgn', 'ListTemplateActions'),
+        ('mgn', 'ListWaves'),
+        ('migration-hub-refactor-spaces', 'GetApplication'),
+        ('migration-hub-refactor-spaces', 'GetEnvironment'),
+        ('migration-hub-refactor-spaces', 'GetResourcePolicy'),
+        ('migration-hub-refactor-spaces', 'GetRoute'),
+        ('migration-hub-refactor-spaces', 'GetService'),
+        ('migration-hub-refactor-spaces', 'ListApplications'),
+        ('migration-hub-refactor-spaces', 'ListEnvironmentVpcs'),
+        ('migration-hub-refactor-spaces', 'ListEnvironments'),
+        ('migration-hub-refactor-spaces', 'ListRoutes'),
+        ('migration-hub-refactor-spaces', 'ListServices'),
+        ('migration-hub-refactor-spaces', 'ListTagsForResource'),
+        ('migrationhub-config', 'DescribeHomeRegionControls'),
+        ('migrationhub-config', 'GetHomeRegion'),
+        ('mq', 'DescribeBroker'),
+        ('mq', 'DescribeBrokerEngineTypes'),
+        ('mq', 'DescribeBrokerInstanceOptions'),
+        ('mq', 'DescribeConfiguration'),
+        ('mq', 'DescribeConfigurationRevision'),
+        ('mq', 'DescribeUser'),
+        ('mq', 'ListBrokers'),
+        ('mq', 'ListConfigurationRevisions'),
+        ('mq', 'ListConfigurations'),
+        ('mq', 'ListTags'),
+        ('mq', 'ListUsers'),
+        ('mwaa', 'GetEnvironment'),
+        ('mwaa', 'ListEnvironments'),
+        ('mwaa', 'ListTagsForResource'),
+        ('neptune', 'DescribeDBClusterEndpoints'),
+        ('neptune', 'DescribeDBClusterParameterGroups'),
+        ('neptune', 'DescribeDBClusterParameters'),
+        ('neptune', 'DescribeDBClusterSnapshotAttributes'),
+        ('neptune', 'DescribeDBClusterSnapshots'),
+        ('neptune', 'DescribeDBClusters'),
+        ('neptune', 'DescribeDBEngineVersions'),
+        ('neptune', 'DescribeDBInstances'),
+        ('neptune', 'DescribeDBParameterGroups'),
+        ('neptune', 'DescribeDBParameters'),
+        ('neptune', 'DescribeDBSubnetGroups'),
+        ('neptune', 'DescribeEngineDefaultClusterParameters'),
+        ('neptune', 'DescribeEngineDefaultParameters'),
+        ('neptune', 'DescribeEventCategories'),
+        ('neptune', 'DescribeEventSubscriptions'),
+        ('neptune', 'DescribeEvents'),
+        ('neptune', 'DescribeGlobalClusters'),
+        ('neptune', 'DescribeOrderableDBInstanceOptions'),
+        ('neptune', 'DescribePendingMaintenanceActions'),
+        ('neptune', 'DescribeValidDBInstanceModifications'),
+        ('neptune', 'ListTagsForResource'),
+        ('network-firewall', 'DescribeFirewall'),
+        ('network-firewall', 'DescribeFirewallPolicy'),
+        ('network-firewall', 'DescribeLoggingConfiguration'),
+        ('network-firewall', 'DescribeResourcePolicy'),
+        ('network-firewall', 'DescribeRuleGroup'),
+        ('network-firewall', 'DescribeRuleGroupMetadata'),
+        ('network-firewall', 'DescribeTLSInspectionConfiguration'),
+        ('network-firewall', 'ListFirewallPolicies'),
+        ('network-firewall', 'ListFirewalls'),
+        ('network-firewall', 'ListRuleGroups'),
+        ('network-firewall', 'ListTLSInspectionConfigurations'),
+        ('network-firewall', 'ListTagsForResource'),
+        ('networkmanager', 'DescribeGlobalNetworks'),
+        ('networkmanager', 'GetConnectAttachment'),
+        ('networkmanager', 'GetConnectPeer'),
+        ('networkmanager', 'GetConnectPeerAssociations'),
+        ('networkmanager', 'GetConnections'),
+        ('networkmanager', 'GetCoreNetwork'),
+        ('networkmanager', 'GetCoreNetworkChangeEvents'),
+        ('networkmanager', 'GetCoreNetworkChangeSet'),
+        ('networkmanager', 'GetCoreNetworkPolicy'),
+        ('networkmanager', 'GetCustomerGatewayAssociations'),
+        ('networkmanager', 'GetDevices'),
+        ('networkmanager', 'GetLinkAssociations'),
+        ('networkmanager', 'GetLinks'),
+        ('networkmanager', 'GetNetworkResourceCounts'),
+        ('networkmanager', 'GetNetworkResourceRelationships'),
+        ('networkmanager', 'GetNetworkResources'),
+        ('networkmanager', 'GetNetworkRoutes'),
+        ('networkmanager', 'GetNetworkTelemetry'),
+        ('networkmanager', 'GetResourcePolicy'),
+        ('networkmanager', 'GetRouteAnalysis'),
+        ('networkmanager', 'GetSiteToSiteVpnAttachment'),
+        ('networkmanager', 'GetSites'),
+        ('networkmanager', 'GetTransitGatewayConnectPeerAssociations'),
+        ('networkmanager', 'GetTransitGatewayPeering'),
+        ('networkmanager', 'GetTransitGatewayRegistrations'),
+        ('networkmanager', 'GetTransitGatewayRouteTableAttachment'),
+        ('networkmanager', 'GetVpcAttachment'),
+        ('networkmanager', 'ListAttachments'),
+        ('networkmanager', 'ListConnectPeers'),
+        ('networkmanager', 'ListCoreNetworkPolicyVersions'),
+        ('networkmanager', 'ListCoreNetworks'),
+        ('networkmanager', 'ListOrganizationServiceAccessStatus'),
+        ('networkmanager', 'ListPeerings'),
+        ('networkmanager', 'ListTagsForResource'),
+        ('nimble', 'GetEula'),
+        ('nimble', 'GetLaunchProfile'),
+        ('nimble', 'GetLaunchProfileDetails'),
+        ('nimble', 'GetLaunchProfileInitialization'),
+        ('nimble', 'GetLaunchProfileMember'),
+        ('nimble', 'GetStreamingImage'),
+        ('nimble', 'GetStreamingSession'),
+        ('nimble', 'GetStreamingSessionBackup'),
+        ('nimble', 'GetStreamingSessionStream'),
+        ('nimble', 'GetStudio'),
+        ('nimble', 'GetStudioComponent'),
+        ('nimble', 'GetStudioMember'),
+        ('nimble', 'ListEulaAcceptances'),
+        ('nimble', 'ListEulas'),
+        ('nimble', 'ListLaunchProfileMembers'),
+        ('nimble', 'ListLaunchProfiles'),
+        ('nimble', 'ListStreamingImages'),
+        ('nimble', 'ListStreamingSessionBackups'),
+        ('nimble', 'ListStreamingSessions'),
+        ('nimble', 'ListStudioComponents'),
+        ('nimble', 'ListStudioMembers'),
+        ('nimble', 'ListStudios'),
+        ('nimble', 'ListTagsForResource'),
+        ('oam', 'GetLink'),
+        ('oam', 'GetSink'),
+        ('oam', 'GetSinkPolicy'),
+        ('oam', 'ListAttachedLinks'),
+        ('oam', 'ListLinks'),
+        ('oam', 'ListSinks'),
+        ('oam', 'ListTagsForResource'),
+        ('omics', 'GetAnnotationImportJob'),
+        ('omics', 'GetAnnotationStore'),
+        ('omics', 'GetAnnotationStoreVersion'),
+        ('omics', 'GetReadSet'),
+        ('omics', 'GetReadSetActivationJob'),
+        ('omics', 'GetReadSetExportJob'),
+        ('omics', 'GetReadSetImportJob'),
+        ('omics', 'GetReadSetMetadata'),
+        ('omics', 'GetReference'),
+        ('omics', 'GetReferenceImportJob'),
+        ('omics', 'GetReferenceMetadata'),
+        ('omics', 'GetReferenceStore'),
+        ('omics', 'GetRun'),
+        ('omics', 'GetRunGroup'),
+        ('omics', 'GetRunTask'),
+        ('omics', 'GetSequenceStore'),
+        ('omics', 'GetShare'),
+        ('omics', 'GetVariantImportJob'),
+        ('omics', 'GetVariantStore'),
+        ('omics', 'GetWorkflow'),
+        ('omics', 'ListAnnotationImportJobs'),
+        ('omics', 'ListAnnotationStoreVersions'),
+        ('omics', 'ListAnnotationStores'),
+        ('omics', 'ListMultipartReadSetUploads'),
+        ('omics', 'ListReadSetActivationJobs'),
+        ('omics', 'ListReadSetExportJobs'),
+        ('omics', 'ListReadSetImportJobs'),
+        ('omics', 'ListReadSetUploadParts'),
+        ('omics', 'ListReadSets'),
+        ('omics', 'ListReferenceImportJobs'),
+        ('omics', 'ListReferenceStores'),
+        ('omics', 'ListReferences'),
+        ('omics', 'ListRunGroups'),
+        ('omics', 'ListRunTasks'),
+        ('omics', 'ListRuns'),
+        ('omics', 'ListSequenceStores'),
+        ('omics', 'ListShares'),
+        ('omics', 'ListTagsForResource'),
+        ('omics', 'ListVariantImportJobs'),
+        ('omics', 'ListVariantStores'),
+        ('omics', 'ListWorkflows'),
+        ('opensearch', 'DescribeDomain'),
+        ('opensearch', 'DescribeDomainAutoTunes'),
+        ('opensearch', 'DescribeDomainChangeProgress'),
+        ('opensearch', 'DescribeDomainConfig'),
+        ('opensearch', 'DescribeDomainHealth'),
+        ('opensearch', 'DescribeDomainNodes'),
+        ('opensearch', 'DescribeDomains'),
+        ('opensearch', 'DescribeDryRunProgress'),
+        ('opensearch', 'DescribeInboundConnections'),
+        ('opensearch', 'DescribeInstanceTypeLimits'),
+        ('opensearch', 'DescribeOutboundConnections'),
+        ('opensearch', 'DescribePackages'),
+        ('opensearch', 'DescribeReservedInstanceOfferings'),
+        ('opensearch', 'DescribeReservedInstances'),
+        ('opensearch', 'DescribeVpcEndpoints'),
+        ('opensearch', 'GetCompatibleVersions'),
+        ('opensearch', 'GetDataSource'),
+        ('opensearch', 'GetDomainMaintenanceStatus'),
+        ('opensearch', 'GetPackageVersionHistory'),
+        ('opensearch', 'GetUpgradeHistory'),
+        ('opensearch', 'GetUpgradeStatus'),
+        ('opensearch', 'ListDataSources'),
+        ('opensearch', 'ListDomainMaintenances'),
+        ('opensearch', 'ListDomainNames'),
+        ('opensearch', 'ListDomainsForPackage'),
+        ('opensearch', 'ListInstanceTypeDetails'),
+        ('opensearch', 'ListPackagesForDomain'),
+        ('opensearch', 'ListScheduledActions'),
+        ('opensearch', 'ListTags'),
+        ('opensearch', 'ListVersions'),
+        ('opensearch', 'ListVpcEndpointAccess'),
+        ('opensearch', 'ListVpcEndpoints'),
+        ('opensearch', 'ListVpcEndpointsForDomain'),
+        ('opensearchserverless', 'BatchGetCollection'),
+        ('opensearchserverless', 'BatchGetVpcEndpoint'),
+        ('opensearchserverless', 'GetAccessPolicy'),
+        ('opensearchserverless', 'GetAccountSettings'),
+        ('opensearchserverless', 'GetPoliciesStats'),
+        ('opensearchserverless', 'GetSecurityConfig'),
+        ('opensearchserverless', 'GetSecurityPolicy'),
+        ('opensearchserverless', 'ListAccessPolicies'),
+        ('opensearchserverless', 'ListCollections'),
+        ('opensearchserverless', 'ListLifecyclePolicies'),
+        ('opensearchserverless', 'ListSecurityConfigs'),
+        ('opensearchserverless', 'ListSecurityPolicies'),
+        ('opensearchserverless', 'ListTagsForResource'),
+        ('opensearchserverless', 'ListVpcEndpoints'),
+        ('organizations', 'DescribeAccount'),
+        ('organizations', 'DescribeCreateAccountStatus'),
+        ('organizations', 'DescribeEffectivePolicy'),
+        ('organizations', 'DescribeHandshake'),
+        ('organizations', 'DescribeOrganization'),
+        ('organizations', 'DescribeOrganizationalUnit'),
+        ('organizations', 'DescribePolicy'),
+        ('organizations', 'DescribeResourcePolicy'),
+        ('organizations', 'ListAWSServiceAccessForOrganization'),
+        ('organizations', 'ListAccounts'),
+        ('organizations', 'ListAccountsForParent'),
+        ('organizations', 'ListChildren'),
+        ('organizations', 'ListCreateAccountStatus'),
+        ('organizations', 'ListDelegatedAdministrators'),
+        ('organizations', 'ListDelegatedServicesForAccount'),
+        ('organizations', 'ListHandshakesForAccount'),
+        ('organizations', 'ListHandshakesForOrganization'),
+        ('organizations', 'ListOrganizationalUnitsForParent'),
+        ('organizations', 'ListParents'),
+        ('organizations', 'ListPolicies'),
+        ('organizations', 'ListPoliciesForTarget'),
+        ('organizations', 'ListRoots'),
+        ('organizations', 'ListTagsForResource'),
+        ('organizations', 'ListTargetsForPolicy'),
+        ('osis', 'GetPipeline'),
+        ('osis', 'GetPipelineBlueprint'),
+        ('osis', 'GetPipelineChangeProgress'),
+        ('osis', 'ListPipelineBlueprints'),
+        ('osis', 'ListPipelines'),
+        ('osis', 'ListTagsForResource'),
+        ('outposts', 'GetCatalogItem'),
+        ('outposts', 'GetConnection'),
+        ('outposts', 'GetOrder'),
+        ('outposts', 'GetOutpost'),
+        ('outposts', 'GetOutpostInstanceTypes'),
+        ('outposts', 'GetSite'),
+        ('outposts', 'GetSiteAddress'),
+        ('outposts', 'ListAssets'),
+        ('outposts', 'ListCatalogItems'),
+        ('outposts', 'ListOrders'),
+        ('outposts', 'ListOutposts'),
+        ('outposts', 'ListSites'),
+        ('outposts', 'ListTagsForResource'),
+        ('payment-cryptography', 'GetAlias'),
+        ('payment-cryptography', 'GetKey'),
+        ('payment-cryptography', 'GetParametersForExport'),
+        ('payment-cryptography', 'GetParametersForImport'),
+        ('payment-cryptography', 'GetPublicKeyCertificate'),
+        ('payment-cryptography', 'ListAliases'),
+        ('payment-cryptography', 'ListKeys'),
+        ('payment-cryptography', 'ListTagsForResource'),
+        ('pca-connector-ad', 'GetConnector'),
+        ('pca-connector-ad', 'GetDirectoryRegistration'),
+        ('pca-connector-ad', 'GetServicePrincipalName'),
+        ('pca-connector-ad', 'GetTemplate'),
+        ('pca-connector-ad', 'GetTemplateGroupAccessControlEntry'),
+        ('pca-connector-ad', 'ListConnectors'),
+        ('pca-connector-ad', 'ListDirectoryRegistrations'),
+        ('pca-connector-ad', 'ListServicePrincipalNames'),
+        ('pca-connector-ad', 'ListTagsForResource'),
+        ('pca-connector-ad', 'ListTemplateGroupAccessControlEntries'),
+        ('pca-connector-ad', 'ListTemplates'),
+        ('personalize', 'DescribeAlgorithm'),
+        ('personalize', 'DescribeBatchInferenceJob'),
+        ('personalize', 'DescribeBatchSegmentJob'),
+        ('personalize', 'DescribeCampaign'),
+        ('personalize', 'DescribeDataset'),
+        ('personalize', 'DescribeDatasetExportJob'),
+        ('personalize', 'DescribeDatasetGroup'),
+        ('personalize', 'DescribeDatasetImportJob'),
+        ('personalize', 'DescribeEventTracker'),
+        ('personalize', 'DescribeFeatureTransformation'),
+        ('personalize', 'DescribeFilter'),
+        ('personalize', 'DescribeMetricAttribution'),
+        ('personalize', 'DescribeRecipe'),
+        ('personalize', 'DescribeRecommender'),
+        ('personalize', 'DescribeSchema'),
+        ('personalize', 'DescribeSolution'),
+        ('personalize', 'DescribeSolutionVersion'),
+        ('personalize', 'GetSolutionMetrics'),
+        ('personalize', 'ListBatchInferenceJobs'),
+        ('personalize', 'ListBatchSegmentJobs'),
+        ('personalize', 'ListCampaigns'),
+        ('personalize', 'ListDatasetExportJobs'),
+        ('personalize', 'ListDatasetGroups'),
+        ('personalize', 'ListDatasetImportJobs'),
+        ('personalize', 'ListDatasets'),
+        ('personalize', 'ListEventTrackers'),
+        ('personalize', 'ListFilters'),
+        ('personalize', 'ListMetricAttributionMetrics'),
+        ('personalize', 'ListMetricAttributions'),
+        ('personalize', 'ListRecipes'),
+        ('personalize', 'ListRecommenders'),
+        ('personalize', 'ListSchemas'),
+        ('personalize', 'ListSolutionVersions'),
+        ('personalize', 'ListSolutions'),
+        ('personalize', 'ListTagsForResource'),
+        ('personalize-runtime', 'GetActionRecommendations'),
+        ('personalize-runtime', 'GetPersonalizedRanking'),
+        ('personalize-runtime', 'GetRecommendations'),
+        ('pi', 'DescribeDimensionKeys'),
+        ('pi', 'GetDimensionKeyDetails'),
+        ('pi', 'GetPerformanceAnalysisReport'),
+        ('pi', 'GetResourceMetadata'),
+        ('pi', 'GetResourceMetrics'),
+        ('pi', 'ListAvailableResourceDimensions'),
+        ('pi', 'ListAvailableResourceMetrics'),
+        ('pi', 'ListPerformanceAnalysisReports'),
+        ('pi', 'ListTagsForResource'),
+        ('pinpoint', 'GetAdmChannel'),
+        ('pinpoint', 'GetApnsChannel'),
+        ('pinpoint', 'GetApnsSandboxChannel'),
+        ('pinpoint', 'GetApnsVoipChannel'),
+        ('pinpoint', 'GetApnsVoipSandboxChannel'),
+        ('pinpoint', 'GetApp'),
+        ('pinpoint', 'GetApplicationDateRangeKpi'),
+        ('pinpoint', 'GetApplicationSettings'),
+        ('pinpoint', 'GetApps'),
+        ('pinpoint', 'GetBaiduChannel'),
+        ('pinpoint', 'GetCampaign'),
+        ('pinpoint', 'GetCampaignActivities'),
+        ('pinpoint', 'GetCampaignDateRangeKpi'),
+        ('pinpoint', 'GetCampaignVersion'),
+        ('pinpoint', 'GetCampaignVersions'),
+        ('pinpoint', 'GetCampaigns'),
+        ('pinpoint', 'GetChannels'),
+        ('pinpoint', 'GetEmailChannel'),
+        ('pinpoint', 'GetEmailTemplate'),
+        ('pinpoint', 'GetEndpoint'),
+        ('pinpoint', 'GetEventStream'),
+        ('pinpoint', 'GetExportJob'),
+        ('pinpoint', 'GetExportJobs'),
+        ('pinpoint', 'GetGcmChannel'),
+        ('pinpoint', 'GetImportJob'),
+        ('pinpoint', 'GetImportJobs'),
+        ('pinpoint', 'GetInAppMessages'),
+        ('pinpoint', 'GetInAppTemplate'),
+        ('pinpoint', 'GetJourney'),
+        ('pinpoint', 'GetJourneyDateRangeKpi'),
+        ('pinpoint', 'GetJourneyExecutionActivityMetrics'),
+        ('pinpoint', 'GetJourneyExecutionMetrics'),
+        ('pinpoint', 'GetJourneyRunExecutionActivityMetrics'),
+        ('pinpoint', 'GetJourneyRunExecutionMetrics'),
+        ('pinpoint', 'GetJourneyRuns'),
+        ('pinpoint', 'GetPushTemplate'),
+        ('pinpoint', 'GetRecommenderConfiguration'),
+        ('pinpoint', 'GetRecommenderConfigurations'),
+        ('pinpoint', 'GetSegment'),
+        ('pinpoint', 'GetSegmentExportJobs'),
+        ('pinpoint', 'GetSegmentImportJobs'),
+        ('pinpoint', 'GetSegmentVersion'),
+        ('pinpoint', 'GetSegmentVersions'),
+        ('pinpoint', 'GetSegments'),
+        ('pinpoint', 'GetSmsChannel'),
+        ('pinpoint', 'GetSmsTemplate'),
+        ('pinpoint', 'GetUserEndpoints'),
+        ('pinpoint', 'GetVoiceChannel'),
+        ('pinpoint', 'GetVoiceTemplate'),
+        ('pinpoint', 'ListJourneys'),
+        ('pinpoint', 'ListTagsForResource'),
+        ('pinpoint', 'ListTemplateVersions'),
+        ('pinpoint', 'ListTemplates'),
+        ('pinpoint-email', 'GetAccount'),
+        ('pinpoint-email', 'GetBlacklistReports'),
+        ('pinpoint-email', 'GetConfigurationSet'),
+        ('pinpoint-email', 'GetConfigurationSetEventDestinations'),
+        ('pinpoint-email', 'GetDedicatedIp'),
+        ('pinpoint-email', 'GetDedicatedIps'),
+        ('pinpoint-email', 'GetDeliverabilityDashboardOptions'),
+        ('pinpoint-email', 'GetDeliverabilityTestReport'),
+        ('pinpoint-email', 'GetDomainDeliverabilityCampaign'),
+        ('pinpoint-email', 'GetDomainStatisticsReport'),
+        ('pinpoint-email', 'GetEmailIdentity'),
+        ('pinpoint-email', 'ListConfigurationSets'),
+        ('pinpoint-email', 'ListDedicatedIpPools'),
+        ('pinpoint-email', 'ListDeliverabilityTestReports'),
+        ('pinpoint-email', 'ListDomainDeliverabilityCampaigns'),
+        ('pinpoint-email', 'ListEmailIdentities'),
+        ('pinpoint-email', 'ListTagsForResource'),
+        ('pinpoint-sms-voice', 'GetConfigurationSetEventDestinations'),
+        ('pinpoint-sms-voice-v2', 'DescribeAccountAttributes'),
+        ('pinpoint-sms-voice-v2', 'DescribeAccountLimits'),
+        ('pinpoint-sms-voice-v2', 'DescribeConfigurationSets'),
+        ('pinpoint-sms-voice-v2', 'DescribeKeywords'),
+        ('pinpoint-sms-voice-v2', 'DescribeOptOutLists'),
+        ('pinpoint-sms-voice-v2', 'DescribeOptedOutNumbers'),
+        ('pinpoint-sms-voice-v2', 'DescribePhoneNumbers'),
+        ('pinpoint-sms-voice-v2', 'DescribePools'),
+        ('pinpoint-sms-voice-v2', 'DescribeRegistrationAttachments'),
+        ('pinpoint-sms-voice-v2', 'DescribeRegistrationFieldDefinitions'),
+        ('pinpoint-sms-voice-v2', 'DescribeRegistrationFieldValues'),
+        ('pinpoint-sms-voice-v2', 'DescribeRegistrationSectionDefinitions'),
+        ('pinpoint-sms-voice-v2', 'DescribeRegistrationTypeDefinitions'),
+        ('pinpoint-sms-voice-v2', 'DescribeRegistrationVersions'),
+        ('pinpoint-sms-voice-v2', 'DescribeRegistrations'),
+        ('pinpoint-sms-voice-v2', 'DescribeSenderIds'),
+        ('pinpoint-sms-voice-v2', 'DescribeSpendLimits'),
+        ('pinpoint-sms-voice-v2', 'DescribeVerifiedDestinationNumbers'),
+        ('pinpoint-sms-voice-v2', 'ListPoolOriginationIdentities'),
+        ('pinpoint-sms-voice-v2', 'ListRegistrationAssociations'),
+        ('pinpoint-sms-voice-v2', 'ListTagsForResource'),
+        ('pipes', 'DescribePipe'),
+        ('pipes', 'ListPipes'),
+        ('pipes', 'ListTagsForResource'),
+        ('polly', 'DescribeVoices'),
+        ('polly', 'GetLexicon'),
+        ('polly', 'GetSpeechSynthesisTask'),
+        ('polly', 'ListLexicons'),
+        ('polly', 'ListSpeechSynthesisTasks'),
+        ('polly', 'SynthesizeSpeech'),
+        ('pricing', 'DescribeServices'),
+        ('pricing', 'GetAttributeValues'),
+        ('pricing', 'GetPriceListFileUrl'),
+        ('pricing', 'GetProducts'),
+        ('pricing', 'ListPriceLists'),
+        ('proton', 'GetAccountSettings'),
+        ('proton', 'GetComponent'),
+        ('proton', 'GetDeployment'),
+        ('proton', 'GetEnvironment'),
+        ('proton', 'GetEnvironmentAccountConnection'),
+        ('proton', 'GetEnvironmentTemplate'),
+        ('proton', 'GetEnvironmentTemplateVersion'),
+        ('proton', 'GetRepository'),
+        ('proton', 'GetRepositorySyncStatus'),
+        ('proton', 'GetResourcesSummary'),
+        ('proton', 'GetService'),
+        ('proton', 'GetServiceInstance'),
+        ('proton', 'GetServiceInstanceSyncStatus'),
+        ('proton', 'GetServiceSyncBlockerSummary'),
+        ('proton', 'GetServiceSyncConfig'),
+        ('proton', 'GetServiceTemplate'),
+        ('proton', 'GetServiceTemplateVersion'),
+        ('proton', 'GetTemplateSyncConfig'),
+        ('proton', 'GetTemplateSyncStatus'),
+        ('proton', 'ListComponentOutputs'),
+        ('proton', 'ListComponentProvisionedResources'),
+        ('proton', 'ListComponents'),
+        ('proton', 'ListDeployments'),
+        ('proton', 'ListEnvironmentAccountConnections'),
+        ('proton', 'ListEnvironmentOutputs'),
+        ('proton', 'ListEnvironmentProvisionedResources'),
+        ('proton', 'ListEnvironmentTemplateVersions'),
+        ('proton', 'ListEnvironmentTemplates'),
+        ('proton', 'ListEnvironments'),
+        ('proton', 'ListRepositories'),
+        ('proton', 'ListRepositorySyncDefinitions'),
+        ('proton', 'ListServiceInstanceOutputs'),
+        ('proton', 'ListServiceInstanceProvisionedResources'),
+        ('proton', 'ListServiceInstances'),
+        ('proton', 'ListServicePipelineOutputs'),
+        ('proton', 'ListServicePipelineProvisionedResources'),
+        ('proton', 'ListServiceTemplateVersions'),
+        ('proton', 'ListServiceTemplates'),
+        ('proton', 'ListServices'),
+        ('proton', 'ListTagsForResource'),
+        ('qldb', 'DescribeJournalKinesisStream'),
+        ('qldb', 'DescribeJournalS3Export'),
+        ('qldb', 'DescribeLedger'),
+        ('qldb', 'GetBlock'),
+        ('qldb', 'GetDigest'),
+        ('qldb', 'GetRevision'),
+        ('qldb', 'ListJournalKinesisStreamsForLedger'),
+        ('qldb', 'ListJournalS3Exports'),
+        ('qldb', 'ListJournalS3ExportsForLedger'),
+        ('qldb', 'ListLedgers'),
+        ('qldb', 'ListTagsForResource'),
+        ('ram', 'GetPermission'),
+        ('ram', 'GetResourcePolicies'),
+        ('ram', 'GetResourceShareAssociations'),
+        ('ram', 'GetResourceShareInvitations'),
+        ('ram', 'GetResourceShares'),
+        ('ram', 'ListPendingInvitationResources'),
+        ('ram', 'ListPermissionAssociations'),
+        ('ram', 'ListPermissionVersions'),
+        ('ram', 'ListPermissions'),
+        ('ram', 'ListPrincipals'),
+        ('ram', 'ListReplacePermissionAssociationsWork'),
+        ('ram', 'ListResourceSharePermissions'),
+        ('ram', 'ListResourceTypes'),
+        ('ram', 'ListResources'),
+        ('rbin', 'GetRule'),
+        ('rbin', 'ListRules'),
+        ('rbin', 'ListTagsForResource'),
+        ('rds', 'DescribeAccountAttributes'),
+        ('rds', 'DescribeBlueGreenDeployments'),
+        ('rds', 'DescribeCertificates'),
+        ('rds', 'DescribeDBClusterAutomatedBackups'),
+        ('rds', 'DescribeDBClusterBacktracks'),
+        ('rds', 'DescribeDBClusterEndpoints'),
+        ('rds', 'DescribeDBClusterParameterGroups'),
+        ('rds', 'DescribeDBClusterParameters'),
+        ('rds', 'DescribeDBClusterSnapshotAttributes'),
+        ('rds', 'DescribeDBClusterSnapshots'),
+        ('rds', 'DescribeDBClusters'),
+        ('rds', 'DescribeDBEngineVersions'),
+        ('rds', 'DescribeDBInstanceAutomatedBackups'),
+        ('rds', 'DescribeDBInstances'),
+        ('rds', 'DescribeDBLogFiles'),
+        ('rds', 'DescribeDBParameterGroups'),
+        ('rds', 'DescribeDBParameters'),
+        ('rds', 'DescribeDBProxies'),
+        ('rds', 'DescribeDBProxyEndpoints'),
+        ('rds', 'DescribeDBProxyTargetGroups'),
+        ('rds', 'DescribeDBProxyTargets'),
+        ('rds', 'DescribeDBRecommendations'),
+        ('rds', 'DescribeDBSecurityGroups'),
+        ('rds', 'DescribeDBShardGroups'),
+        ('rds', 'DescribeDBSnapshotAttributes'),
+        ('rds', 'DescribeDBSnapshotTenantDatabases'),
+        ('rds', 'DescribeDBSnapshots'),
+        ('rds', 'DescribeDBSubnetGroups'),
+        ('rds', 'DescribeEngineDefaultClusterParameters'),
+        ('rds', 'DescribeEngineDefaultParameters'),
+        ('rds', 'DescribeEventCategories'),
+        ('rds', 'DescribeEventSubscriptions'),
+        ('rds', 'DescribeEvents'),
+        ('rds', 'DescribeExportTasks'),
+        ('rds', 'DescribeGlobalClusters'),
+        ('rds', 'DescribeIntegrations'),
+        ('rds', 'DescribeOptionGroupOptions'),
+        ('rds', 'DescribeOptionGroups'),
+        ('rds', 'DescribeOrderableDBInstanceOptions'),
+        ('rds', 'DescribePendingMaintenanceActions'),
+        ('rds', 'DescribeReservedDBInstances'),
+        ('rds', 'DescribeReservedDBInstancesOfferings'),
+        ('rds', 'DescribeSourceRegions'),
+        ('rds', 'DescribeTenantDatabases'),
+        ('rds', 'DescribeValidDBInstanceModifications'),
+        ('rds', 'DownloadDBLogFilePortion'),
+        ('rds', 'ListTagsForResource'),
+        ('rds', 'generate-db-auth-token'),
+        ('redshift', 'DescribeAccountAttributes'),
+        ('redshift', 'DescribeAuthenticationProfiles'),
+        ('redshift', 'DescribeClusterDbRevisions'),
+        ('redshift', 'DescribeClusterParameterGroups'),
+        ('redshift', 'DescribeClusterParameters'),
+        ('redshift', 'DescribeClusterSecurityGroups'),
+        ('redshift', 'DescribeClusterSnapshots'),
+        ('redshift', 'DescribeClusterSubnetGroups'),
+        ('redshift', 'DescribeClusterTracks'),
+        ('redshift', 'DescribeClusterVersions'),
+        ('redshift', 'DescribeClusters'),
+        ('redshift', 'DescribeCustomDomainAssociations'),
+        ('redshift', 'DescribeDataShares'),
+        ('redshift', 'DescribeDataSharesForConsumer'),
+        ('redshift', 'DescribeDataSharesForProducer'),
+        ('redshift', 'DescribeDefaultClusterParameters'),
+        ('redshift', 'DescribeEndpointAccess'),
+        ('redshift', 'DescribeEndpointAuthorization'),
+        ('redshift', 'DescribeEventCategories'),
+        ('redshift', 'DescribeEventSubscriptions'),
+        ('redshift', 'DescribeEvents'),
+        ('redshift', 'DescribeHsmClientCertificates'),
+        ('redshift', 'DescribeHsmConfigurations'),
+        ('redshift', 'DescribeInboundIntegrations'),
+        ('redshift', 'DescribeLoggingStatus'),
+        ('redshift', 'DescribeNodeConfigurationOptions'),
+        ('redshift', 'DescribeOrderableClusterOptions'),
+        ('redshift', 'DescribePartners'),
+        ('redshift', 'DescribeRedshiftIdcApplications'),
+        ('redshift', 'DescribeReservedNodeExchangeStatus'),
+        ('redshift', 'DescribeReservedNodeOfferings'),
+        ('redshift', 'DescribeReservedNodes'),
+        ('redshift', 'DescribeResize'),
+        ('redshift', 'DescribeScheduledActions'),
+        ('redshift', 'DescribeSnapshotCopyGrants'),
+        ('redshift', 'DescribeSnapshotSchedules'),
+        ('redshift', 'DescribeStorage'),
+        ('redshift', 'DescribeTableRestoreStatus'),
+        ('redshift', 'DescribeTags'),
+        ('redshift', 'DescribeUsageLimits'),
+        ('redshift', 'GetReservedNodeExchangeOfferings'),
+        ('rekognition', 'CompareFaces'),
+        ('rekognition', 'DescribeDataset'),
+        ('rekognition', 'DescribeProjectVersions'),
+        ('rekognition', 'DescribeProjects'),
+        ('rekognition', 'DescribeStreamProcessor'),
+        ('rekognition', 'DetectCustomLabels'),
+        ('rekognition', 'DetectFaces'),
+        ('rekognition', 'DetectLabels'),
+        ('rekognition', 'DetectModerationLabels'),
+        ('rekognition', 'DetectProtectiveEquipment'),
+        ('rekognition', 'DetectText'),
+        ('rekognition', 'GetCelebrityInfo'),
+        ('rekognition', 'GetCelebrityRecognition'),
+        ('rekognition', 'GetContentModeration'),
+        ('rekognition', 'GetFaceDetection'),
+        ('rekognition', 'GetFaceSearch'),
+        ('rekognition', 'GetLabelDetection'),
+        ('rekognition', 'GetPersonTracking'),
+        ('rekognition', 'GetSegmentDetection'),
+        ('rekognition', 'GetTextDetection'),
+        ('rekognition', 'ListCollections'),
+        ('rekognition', 'ListDatasetEntries'),
+        ('rekognition', 'ListDatasetLabels'),
+        ('rekognition', 'ListFaces'),
+        ('rekognition', 'ListMediaAnalysisJobs'),
+        ('rekognition', 'ListProjectPolicies'),
+        ('rekognition', 'ListStreamProcessors'),
+        ('rekognition', 'ListTagsForResource'),
+        ('rekognition', 'ListUsers'),
+        ('rekognition', 'RecognizeCelebrities'),
+        ('rekognition', 'SearchFaces'),
+        ('rekognition', 'SearchFacesByImage'),
+        ('rekognition', 'SearchUsers'),
+        ('rekognition', 'SearchUsersByImage'),
+        ('resiliencehub', 'DescribeApp'),
+        ('resiliencehub', 'DescribeAppAssessment'),
+        ('resiliencehub', 'DescribeAppVersion'),
+        ('resiliencehub', 'DescribeAppVersionAppComponent'),
+        ('resiliencehub', 'DescribeAppVersionResource'),
+        ('resiliencehub', 'DescribeAppVersionResourcesResolutionStatus'),
+        ('resiliencehub', 'DescribeAppVersionTemplate'),
+        ('resiliencehub', 'DescribeDraftAppVersionResourcesImportStatus'),
+        ('resiliencehub', 'DescribeResiliencyPolicy'),
+        ('resiliencehub', 'ListAlarmRecommendations'),
+        ('resiliencehub', 'ListAppAssessmentComplianceDrifts'),
+        ('resiliencehub', 'ListAppAssessments'),
+        ('resiliencehub', 'ListAppComponentCompliances'),
+        ('resiliencehub', 'ListAppComponentRecommendations'),
+        ('resiliencehub', 'ListAppInputSources'),
+        ('resiliencehub', 'ListAppVersionAppComponents'),
+        ('resiliencehub', 'ListAppVersionResourceMappings'),
+        ('resiliencehub', 'ListAppVersionResources'),
+        ('resiliencehub', 'ListAppVersions'),
+        ('resiliencehub', 'ListApps'),
+        ('resiliencehub', 'ListRecommendationTemplates'),
+        ('resiliencehub', 'ListResiliencyPolicies'),
+        ('resiliencehub', 'ListSopRecommendations'),
+        ('resiliencehub', 'ListSuggestedResiliencyPolicies'),
+        ('resiliencehub', 'ListTagsForResource'),
+        ('resiliencehub', 'ListTestRecommendations'),
+        ('resiliencehub', 'ListUnsupportedAppVersionResources'),
+        ('resource-explorer-2', 'BatchGetView'),
+        ('resource-explorer-2', 'GetAccountLevelServiceConfiguration'),
+        ('resource-explorer-2', 'GetDefaultView'),
+        ('resource-explorer-2', 'GetIndex'),
+        ('resource-explorer-2', 'GetView'),
+        ('resource-explorer-2', 'ListIndexes'),
+        ('resource-explorer-2', 'ListIndexesForMembers'),
+        ('resource-explorer-2', 'ListSupportedResourceTypes'),
+        ('resource-explorer-2', 'ListTagsForResource'),
+        ('resource-explorer-2', 'ListViews'),
+        ('resource-explorer-2', 'Search'),
+        ('resource-groups', 'GetAccountSettings'),
+        ('resource-groups', 'GetGroup'),
+        ('resource-groups', 'GetGroupConfiguration'),
+        ('resource-groups', 'GetGroupQuery'),
+        ('resource-groups', 'GetTags'),
+        ('resource-groups', 'ListGroupResources'),
+        ('resource-groups', 'ListGroups'),
+        ('resource-groups', 'SearchResources'),
+        ('resourcegroupstaggingapi', 'DescribeReportCreation'),
+        ('resourcegroupstaggingapi', 'GetComplianceSummary'),
+        ('resourcegroupstaggingapi', 'GetResources'),
+        ('resourcegroupstaggingapi', 'GetTagKeys'),
+        ('resourcegroupstaggingapi', 'GetTagValues'),
+        ('robomaker', 'BatchDescribeSimulationJob'),
+        ('robomaker', 'DescribeDeploymentJob'),
+        ('robomaker', 'DescribeFleet'),
+        ('robomaker', 'DescribeRobot'),
+        ('robomaker', 'DescribeRobotApplication'),
+        ('robomaker', 'DescribeSimulationApplication'),
+        ('robomaker', 'DescribeSimulationJob'),
+        ('robomaker', 'DescribeSimulationJobBatch'),
+        ('robomaker', 'DescribeWorld'),
+        ('robomaker', 'DescribeWorldExportJob'),
+        ('robomaker', 'DescribeWorldGenerationJob'),
+        ('robomaker', 'DescribeWorldTemplate'),
+        ('robomaker', 'GetWorldTemplateBody'),
+        ('robomaker', 'ListDeploymentJobs'),
+        ('robomaker', 'ListFleets'),
+        ('robomaker', 'ListRobotApplications'),
+        ('robomaker', 'ListRobots'),
+        ('robomaker', 'ListSimulationApplications'),
+        ('robomaker', 'ListSimulationJobBatches'),
+        ('robomaker', 'ListSimulationJobs'),
+        ('robomaker', 'ListTagsForResource'),
+        ('robomaker', 'ListWorldExportJobs'),
+        ('robomaker', 'ListWorldGenerationJobs'),
+        ('robomaker', 'ListWorldTemplates'),
+        ('robomaker', 'ListWorlds'),
+        ('route53', 'GetAccountLimit'),
+        ('route53', 'GetChange'),
+        ('route53', 'GetCheckerIpRanges'),
+        ('route53', 'GetDNSSEC'),
+        ('route53', 'GetGeoLocation'),
+        ('route53', 'GetHealthCheck'),
+        ('route53', 'GetHealthCheckCount'),
+        ('route53', 'GetHealthCheckLastFailureReason'),
+        ('route53', 'GetHealthCheckStatus'),
+        ('route53', 'GetHostedZone'),
+        ('route53', 'GetHostedZoneCount'),
+        ('route53', 'GetHostedZoneLimit'),
+        ('route53', 'GetQueryLoggingConfig'),
+        ('route53', 'GetReusableDelegationSet'),
+        ('route53', 'GetReusableDelegationSetLimit'),
+        ('route53', 'GetTrafficPolicy'),
+        ('route53', 'GetTrafficPolicyInstance'),
+        ('route53', 'GetTrafficPolicyInstanceCount'),
+        ('route53', 'ListCidrBlocks'),
+        ('route53', 'ListCidrCollections'),
+        ('route53', 'ListCidrLocations'),
+        ('route53', 'ListGeoLocations'),
+        ('route53', 'ListHealthChecks'),
+        ('route53', 'ListHostedZones'),
+        ('route53', 'ListHostedZonesByName'),
+        ('route53', 'ListHostedZonesByVPC'),
+        ('route53', 'ListQueryLoggingConfigs'),
+        ('route53', 'ListResourceRecordSets'),
+        ('route53', 'ListReusableDelegationSets'),
+        ('route53', 'ListTagsForResource'),
+        ('route53', 'ListTagsForResources'),
+        ('route53', 'ListTrafficPolicies'),
+        ('route53', 'ListTrafficPolicyInstances'),
+        ('route53', 'ListTrafficPolicyInstancesByHostedZone'),
+        ('route53', 'ListTrafficPolicyInstancesByPolicy'),
+        ('route53', 'ListTrafficPolicyVersions'),
+        ('route53', 'ListVPCAssociationAuthorizations'),
+        ('route53', 'TestDNSAnswer'),
+        ('route53-recovery-cluster', 'GetRoutingControlState'),
+        ('route53-recovery-cluster', 'ListRoutingControls'),
+        ('route53-recovery-control-config', 'DescribeCluster'),
+        ('route53-recovery-control-config', 'DescribeControlPanel'),
+        ('route53-recovery-control-config', 'DescribeRoutingControl'),
+        ('route53-recovery-control-config', 'DescribeSafetyRule'),
+        ('route53-recovery-control-config', 'GetResourcePolicy'),
+        ('route53-recovery-control-config', 'ListAssociatedRoute53HealthChecks'),
+        ('route53-recovery-control-config', 'ListClusters'),
+        ('route53-recovery-control-config', 'ListControlPanels'),
+        ('route53-recovery-control-config', 'ListRoutingControls'),
+        ('route53-recovery-control-config', 'ListSafetyRules'),
+        ('route53-recovery-control-config', 'ListTagsForResource'),
+        ('route53-recovery-readiness', 'GetArchitectureRecommendations'),
+        ('route53-recovery-readiness', 'GetCell'),
+        ('route53-recovery-readiness', 'GetCellReadinessSummary'),
+        ('route53-recovery-readiness', 'GetReadinessCheck'),
+        ('route53-recovery-readiness', 'GetReadinessCheckResourceStatus'),
+        ('route53-recovery-readiness', 'GetReadinessCheckStatus'),
+        ('route53-recovery-readiness', 'GetRecoveryGroup'),
+        ('route53-recovery-readiness', 'GetRecoveryGroupReadinessSummary'),
+        ('route53-recovery-readiness', 'GetResourceSet'),
+        ('route53-recovery-readiness', 'ListCells'),
+        ('route53-recovery-readiness', 'ListCrossAccountAuthorizations'),
+        ('route53-recovery-readiness', 'ListReadinessChecks'),
+        ('route53-recovery-readiness', 'ListRecoveryGroups'),
+        ('route53-recovery-readiness', 'ListResourceSets'),
+        ('route53-recovery-readiness', 'ListRules'),
+        ('route53-recovery-readiness', 'ListTagsForResources'),
+        ('route53domains', 'CheckDomainAvailability'),
+        ('route53domains', 'CheckDomainTransferability'),
+        ('route53domains', 'GetContactReachabilityStatus'),
+        ('route53domains', 'GetDomainDetail'),
+        ('route53domains', 'GetDomainSuggestions'),
+        ('route53domains', 'GetOperationDetail'),
+        ('route53domains', 'ListDomains'),
+        ('route53domains', 'ListOperations'),
+        ('route53domains', 'ListPrices'),
+        ('route53domains', 'ListTagsForDomain'),
+        ('route53domains', 'ViewBilling'),
+        ('route53resolver', 'GetFirewallConfig'),
+        ('route53resolver', 'GetFirewallDomainList'),
+        ('route53resolver', 'GetFirewallRuleGroup'),
+        ('route53resolver', 'GetFirewallRuleGroupAssociation'),
+        ('route53resolver', 'GetFirewallRuleGroupPolicy'),
+        ('route53resolver', 'GetOutpostResolver'),
+        ('route53resolver', 'GetResolverConfig'),
+        ('route53resolver', 'GetResolverDnssecConfig'),
+        ('route53resolver', 'GetResolverEndpoint'),
+        ('route53resolver', 'GetResolverQueryLogConfig'),
+        ('route53resolver', 'GetResolverQueryLogConfigAssociation'),
+        ('route53resolver', 'GetResolverQueryLogConfigPolicy'),
+        ('route53resolver', 'GetResolverRule'),
+        ('route53resolver', 'GetResolverRuleAssociation'),
+        ('route53resolver', 'GetResolverRulePolicy'),
+        ('route53resolver', 'ListFirewallConfigs'),
+        ('route53resolver', 'ListFirewallDomainLists'),
+        ('route53resolver', 'ListFirewallDomains'),
+        ('route53resolver', 'ListFirewallRuleGroupAssociations'),
+        ('route53resolver', 'ListFirewallRuleGroups'),
+        ('route53resolver', 'ListFirewallRules'),
+        ('route53resolver', 'ListOutpostResolvers'),
+        ('route53resolver', 'ListResolverConfigs'),
+        ('route53resolver', 'ListResolverDnssecConfigs'),
+        ('route53resolver', 'ListResolverEndpointIpAddresses'),
+        ('route53resolver', 'ListResolverEndpoints'),
+        ('route53resolver', 'ListResolverQueryLogConfigAssociations'),
+        ('route53resolver', 'ListResolverQueryLogConfigs'),
+        ('route53resolver', 'ListResolverRuleAssociations'),
+        ('route53resolver', 'ListResolverRules'),
+        ('route53resolver', 'ListTagsForResource'),
+        ('rum', 'GetAppMonitor'),
+        ('rum', 'GetAppMonitorData'),
+        ('rum', 'ListAppMonitors'),
+        ('rum', 'ListRumMetricsDestinations'),
+        ('rum', 'ListTagsForResource'),
+        ('s3', 'GetBucketAccelerateConfiguration'),
+        ('s3', 'GetBucketAcl'),
+        ('s3', 'GetBucketAnalyticsConfiguration'),
+        ('s3', 'GetBucketCors'),
+        ('s3', 'GetBucketEncryption'),
+        ('s3', 'GetBucketIntelligentTieringConfiguration'),
+        ('s3', 'GetBucketInventoryConfiguration'),
+        ('s3', 'GetBucketLifecycle'),
+        ('s3', 'GetBucketLifecycleConfiguration'),
+        ('s3', 'GetBucketLocation'),
+        ('s3', 'GetBucketLogging'),
+        ('s3', 'GetBucketMetricsConfiguration'),
+        ('s3', 'GetBucketNotification'),
+        ('s3', 'GetBucketNotificationConfiguration'),
+        ('s3', 'GetBucketOwnershipControls'),
+        ('s3', 'GetBucketPolicy'),
+        ('s3', 'GetBucketPolicyStatus'),
+        ('s3', 'GetBucketReplication'),
+        ('s3', 'GetBucketRequestPayment'),
+        ('s3', 'GetBucketTagging'),
+        ('s3', 'GetBucketVersioning'),
+        ('s3', 'GetBucketWebsite'),
+        ('s3', 'GetObject'),
+        ('s3', 'GetObjectAcl'),
+        ('s3', 'GetObjectAttributes'),
+        ('s3', 'GetObjectLegalHold'),
+        ('s3', 'GetObjectLockConfiguration'),
+        ('s3', 'GetObjectRetention'),
+        ('s3', 'GetObjectTagging'),
+        ('s3', 'GetObjectTorrent'),
+        ('s3', 'GetPublicAccessBlock'),
+        ('s3', 'ListBucketAnalyticsConfigurations'),
+        ('s3', 'ListBucketIntelligentTieringConfigurations'),
+        ('s3', 'ListBucketInventoryConfigurations'),
+        ('s3', 'ListBucketMetricsConfigurations'),
+        ('s3', 'ListBuckets'),
+        ('s3', 'ListDirectoryBuckets'),
+        ('s3', 'ListMultipartUploads'),
+        ('s3', 'ListObjectVersions'),
+        ('s3', 'ListObjects'),
+        ('s3', 'ListObjectsV2'),
+        ('s3', 'ListParts'),
+        ('s3', 'ls'),
+        ('s3', 'presign'),
+        ('s3control', 'DescribeJob'),
+        ('s3control', 'GetAccessGrant'),
+        ('s3control', 'GetAccessGrantsInstance'),
+        ('s3control', 'GetAccessGrantsInstanceForPrefix'),
+        ('s3control', 'GetAccessGrantsInstanceResourcePolicy'),
+        ('s3control', 'GetAccessGrantsLocation'),
+        ('s3control', 'GetAccessPoint'),
+        ('s3control', 'GetAccessPointConfigurationForObjectLambda'),
+        ('s3control', 'GetAccessPointForObjectLambda'),
+        ('s3control', 'GetAccessPointPolicy'),
+        ('s3control', 'GetAccessPointPolicyForObjectLambda'),
+        ('s3control', 'GetAccessPointPolicyStatus'),
+        ('s3control', 'GetAccessPointPolicyStatusForObjectLambda'),
+        ('s3control', 'GetBucket'),
+        ('s3control', 'GetBucketLifecycleConfiguration'),
+        ('s3control', 'GetBucketPolicy'),
+        ('s3control', 'GetBucketReplication'),
+        ('s3control', 'GetBucketTagging'),
+        ('s3control', 'GetBucketVersioning'),
+        ('s3control', 'GetDataAccess'),
+        ('s3control', 'GetJobTagging'),
+        ('s3control', 'GetMultiRegionAccessPoint'),
+        ('s3control', 'GetMultiRegionAccessPointPolicy'),
+        ('s3control', 'GetMultiRegionAccessPointPolicyStatus'),
+        ('s3control', 'GetMultiRegionAccessPointRoutes'),
+        ('s3control', 'GetPublicAccessBlock'),
+        ('s3control', 'GetStorageLensConfiguration'),
+        ('s3control', 'GetStorageLensConfigurationTagging'),
+        ('s3control', 'GetStorageLensGroup'),
+        ('s3control', 'ListAccessGrants'),
+        ('s3control', 'ListAccessGrantsInstances'),
+        ('s3control', 'ListAccessGrantsLocations'),
+        ('s3control', 'ListAccessPoints'),
+        ('s3control', 'ListAccessPointsForObjectLambda'),
+        ('s3control', 'ListJobs'),
+        ('s3control', 'ListMultiRegionAccessPoints'),
+        ('s3control', 'ListRegionalBuckets'),
+        ('s3control', 'ListStorageLensConfigurations'),
+        ('s3control', 'ListStorageLensGroups'),
+        ('s3control', 'ListTagsForResource'),
+        ('sagemaker', 'DescribeAction'),
+        ('sagemaker', 'DescribeAlgorithm'),
+        ('sagemaker', 'DescribeApp'),
+        ('sagemaker', 'DescribeAppImageConfig'),
+        ('sagemaker', 'DescribeArtifact'),
+        ('sagemaker', 'DescribeAutoMLJob'),
+        ('sagemaker', 'DescribeAutoMLJobV2'),
+        ('sagemaker', 'DescribeCluster'),
+        ('sagemaker', 'DescribeClusterNode'),
+        ('sagemaker', 'DescribeCodeRepository'),
+        ('sagemaker', 'DescribeCompilationJob'),
+        ('sagemaker', 'DescribeContext'),
+        ('sagemaker', 'DescribeDataQualityJobDefinition'),
+        ('sagemaker', 'DescribeDevice'),
+        ('sagemaker', 'DescribeDeviceFleet'),
+        ('sagemaker', 'DescribeDomain'),
+        ('sagemaker', 'DescribeEdgeDeploymentPlan'),
+        ('sagemaker', 'DescribeEdgePackagingJob'),
+        ('sagemaker', 'DescribeEndpoint'),
+        ('sagemaker', 'DescribeEndpointConfig'),
+        ('sagemaker', 'DescribeExperiment'),
+        ('sagemaker', 'DescribeFeatureGroup'),
+        ('sagemaker', 'DescribeFeatureMetadata'),
+        ('sagemaker', 'DescribeFlowDefinition'),
+        ('sagemaker', 'DescribeHub'),
+        ('sagemaker', 'DescribeHubContent'),
+        ('sagemaker', 'DescribeHumanTaskUi'),
+        ('sagemaker', 'DescribeHyperParameterTuningJob'),
+        ('sagemaker', 'DescribeImage'),
+        ('sagemaker', 'DescribeImageVersion'),
+        ('sagemaker', 'DescribeInferenceComponent'),
+        ('sagemaker', 'DescribeInferenceExperiment'),
+        ('sagemaker', 'DescribeInferenceRecommendationsJob'),
+        ('sagemaker', 'DescribeLabelingJob'),
+        ('sagemaker', 'DescribeLineageGroup'),
+        ('sagemaker', 'DescribeModel'),
+        ('sagemaker', 'DescribeModelBiasJobDefinition'),
+        ('sagemaker', 'DescribeModelCard'),
+        ('sagemaker', 'DescribeModelCardExportJob'),
+        ('sagemaker', 'DescribeModelExplainabilityJobDefinition'),
+        ('sagemaker', 'DescribeModelPackage'),
+        ('sagemaker', 'DescribeModelPackageGroup'),
+        ('sagemaker', 'DescribeModelQualityJobDefinition'),
+        ('sagemaker', 'DescribeMonitoringSchedule'),
+        ('sagemaker', 'DescribeNotebookInstance'),
+        ('sagemaker', 'DescribeNotebookInstanceLifecycleConfig'),
+        ('sagemaker', 'DescribePipeline'),
+        ('sagemaker', 'DescribePipelineDefinitionForExecution'),
+        ('sagemaker', 'DescribePipelineExecution'),
+        ('sagemaker', 'DescribeProcessingJob'),
+        ('sagemaker', 'DescribeProject'),
+        ('sagemaker', 'DescribeSpace'),
+        ('sagemaker', 'DescribeStudioLifecycleConfig'),
+        ('sagemaker', 'DescribeSubscribedWorkteam'),
+        ('sagemaker', 'DescribeTrainingJob'),
+        ('sagemaker', 'DescribeTransformJob'),
+        ('sagemaker', 'DescribeTrial'),
+        ('sagemaker', 'DescribeTrialComponent'),
+        ('sagemaker', 'DescribeUserProfile'),
+        ('sagemaker', 'DescribeWorkforce'),
+        ('sagemaker', 'DescribeWorkteam'),
+        ('sagemaker', 'GetSearchSuggestions'),
+        ('sagemaker', 'ListActions'),
+        ('sagemaker', 'ListAlgorithms'),
+        ('sagemaker', 'ListAliases'),
+        ('sagemaker', 'ListAppImageConfigs'),
+        ('sagemaker', 'ListApps'),
+        ('sagemaker', 'ListArtifacts'),
+        ('sagemaker', 'ListAssociations'),
+        ('sagemaker', 'ListAutoMLJobs'),
+        ('sagemaker', 'ListCandidatesForAutoMLJob'),
+        ('sagemaker', 'ListClusterNodes'),
+        ('sagemaker', 'ListClusters'),
+        ('sagemaker', 'ListCodeRepositories'),
+        ('sagemaker', 'ListCompilationJobs'),
+        ('sagemaker', 'ListContexts'),
+        ('sagemaker', 'ListDataQualityJobDefinitions'),
+        ('sagemaker', 'ListDeviceFleets'),
+        ('sagemaker', 'ListDevices'),
+        ('sagemaker', 'ListDomains'),
+        ('sagemaker', 'ListEdgeDeploymentPlans'),
+        ('sagemaker', 'ListEdgePackagingJobs'),
+        ('sagemaker', 'ListEndpointConfigs'),
+        ('sagemaker', 'ListEndpoints'),
+        ('sagemaker', 'ListExperiments'),
+        ('sagemaker', 'ListFeatureGroups'),
+        ('sagemaker', 'ListFlowDefinitions'),
+        ('sagemaker', 'ListHubContentVersions'),
+        ('sagemaker', 'ListHubContents'),
+        ('sagemaker', 'ListHubs'),
+        ('sagemaker', 'ListHumanTaskUis'),
+        ('sagemaker', 'ListHyperParameterTuningJobs'),
+        ('sagemaker', 'ListImageVersions'),
+        ('sagemaker', 'ListImages'),
+        ('sagemaker', 'ListInferenceComponents'),
+        ('sagemaker', 'ListInferenceExperiments'),
+        ('sagemaker', 'ListInferenceRecommendationsJobSteps'),
+        ('sagemaker', 'ListInferenceRecommendationsJobs'),
+        ('sagemaker', 'ListLabelingJobs'),
+        ('sagemaker', 'ListLabelingJobsForWorkteam'),
+        ('sagemaker', 'ListLineageGroups'),
+        ('sagemaker', 'ListModelBiasJobDefinitions'),
+        ('sagemaker', 'ListModelCardExportJobs'),
+        ('sagemaker', 'ListModelCardVersions'),
+        ('sagemaker', 'ListModelCards'),
+        ('sagemaker', 'ListModelExplainabilityJobDefinitions'),
+        ('sagemaker', 'ListModelMetadata'),
+        ('sagemaker', 'ListModelPackageGroups'),
+        ('sagemaker', 'ListModelPackages'),
+        ('sagemaker', 'ListModelQualityJobDefinitions'),
+        ('sagemaker', 'ListModels'),
+        ('sagemaker', 'ListMonitoringAlertHistory'),
+        ('sagemaker', 'ListMonitoringAlerts'),
+        ('sagemaker', 'ListMonitoringExecutions'),
+        ('sagemaker', 'ListMonitoringSchedules'),
+        ('sagemaker', 'ListNotebookInstanceLifecycleConfigs'),
+        ('sagemaker', 'ListNotebookInstances'),
+        ('sagemaker', 'ListPipelineExecutionSteps'),
+        ('sagemaker', 'ListPipelineExecutions'),
+        ('sagemaker', 'ListPipelineParametersForExecution'),
+        ('sagemaker', 'ListPipelines'),
+        ('sagemaker', 'ListProcessingJobs'),
+        ('sagemaker', 'ListProjects'),
+        ('sagemaker', 'ListResourceCatalogs'),
+        ('sagemaker', 'ListSpaces'),
+        ('sagemaker', 'ListStageDevices'),
+        ('sagemaker', 'ListStudioLifecycleConfigs'),
+        ('sagemaker', 'ListSubscribedWorkteams'),
+        ('sagemaker', 'ListTags'),
+        ('sagemaker', 'ListTrainingJobs'),
+        ('sagemaker', 'ListTrainingJobsForHyperParameterTuningJob'),
+        ('sagemaker', 'ListTransformJobs'),
+        ('sagemaker', 'ListTrialComponents'),
+        ('sagemaker', 'ListTrials'),
+        ('sagemaker', 'ListUserProfiles'),
+        ('sagemaker', 'ListWorkforces'),
+        ('sagemaker', 'ListWorkteams'),
+        ('sagemaker', 'Search'),
+        ('sagemaker-a2i-runtime', 'DescribeHumanLoop'),
+        ('sagemaker-a2i-runtime', 'ListHumanLoops'),
+        ('savingsplans', 'DescribeSavingsPlanRates'),
+        ('savingsplans', 'DescribeSavingsPlans'),
+        ('savingsplans', 'DescribeSavingsPlansOfferingRates'),
+        ('savingsplans', 'DescribeSavingsPlansOfferings'),
+        ('savingsplans', 'ListTagsForResource'),
+        ('scheduler', 'GetSchedule'),
+        ('scheduler', 'GetScheduleGroup'),
+        ('scheduler', 'ListScheduleGroups'),
+        ('scheduler', 'ListSchedules'),
+        ('scheduler', 'ListTagsForResource'),
+        ('schemas', 'DescribeCodeBinding'),
+        ('schemas', 'DescribeDiscoverer'),
+        ('schemas', 'DescribeRegistry'),
+        ('schemas', 'DescribeSchema'),
+        ('schemas', 'GetCodeBindingSource'),
+        ('schemas', 'GetDiscoveredSchema'),
+        ('schemas', 'GetResourcePolicy'),
+        ('schemas', 'ListDiscoverers'),
+        ('schemas', 'ListRegistries'),
+        ('schemas', 'ListSchemaVersions'),
+        ('schemas', 'ListSchemas'),
+        ('schemas', 'ListTagsForResource'),
+        ('schemas', 'SearchSchemas'),
+        ('sdb', 'GetAttributes'),
+        ('sdb', 'ListDomains'),
+        ('sdb', 'Select'),
+        ('secretsmanager', 'DescribeSecret'),
+        ('secretsmanager', 'GetResourcePolicy'),
+        ('secretsmanager', 'ListSecretVersionIds'),
+        ('secretsmanager', 'ListSecrets'),
+        ('securityhub', 'BatchGetSecurityControls'),
+        ('securityhub', 'BatchGetStandardsControlAssociations'),
+        ('securityhub', 'DescribeActionTargets'),
+        ('securityhub', 'DescribeHub'),
+        ('securityhub', 'DescribeOrganizationConfiguration'),
+        ('securityhub', 'DescribeProducts'),
+        ('securityhub', 'DescribeStandards'),
+        ('securityhub', 'DescribeStandardsControls'),
+        ('securityhub', 'GetAdministratorAccount'),
+        ('securityhub', 'GetConfigurationPolicy'),
+        ('securityhub', 'GetConfigurationPolicyAssociation'),
+        ('securityhub', 'GetEnabledStandards'),
+        ('securityhub', 'GetFindingAggregator'),
+        ('securityhub', 'GetFindingHistory'),
+        ('securityhub', 'GetFindings'),
+        ('securityhub', 'GetInsightResults'),
+        ('securityhub', 'GetInsights'),
+        ('securityhub', 'GetInvitationsCount'),
+        ('securityhub', 'GetMasterAccount'),
+        ('securityhub', 'GetMembers'),
+        ('securityhub', 'GetSecurityControlDefinition'),
+        ('securityhub', 'ListAutomationRules'),
+        ('securityhub', 'ListConfigurationPolicies'),
+        ('securityhub', 'ListConfigurationPolicyAssociations'),
+        ('securityhub', 'ListEnabledProductsForImport'),
+        ('securityhub', 'ListFindingAggregators'),
+        ('securityhub', 'ListInvitations'),
+        ('securityhub', 'ListMembers'),
+        ('securityhub', 'ListOrganizationAdminAccounts'),
+        ('securityhub', 'ListSecurityControlDefinitions'),
+        ('securityhub', 'ListStandardsControlAssociations'),
+        ('securityhub', 'ListTagsForResource'),
+        ('serverlessrepo', 'GetApplication'),
+        ('serverlessrepo', 'GetApplicationPolicy'),
+        ('serverlessrepo', 'GetCloudFormationTemplate'),
+        ('serverlessrepo', 'ListApplicationDependencies'),
+        ('serverlessrepo', 'ListApplicationVersions'),
+        ('serverlessrepo', 'ListApplications'),
+        ('service-quotas', 'GetAWSDefaultServiceQuota'),
+        ('service-quotas', 'GetAssociationForServiceQuotaTemplate'),
+        ('service-quotas', 'GetRequestedServiceQuotaChange'),
+        ('service-quotas', 'GetServiceQuota'),
+        ('service-quotas', 'GetServiceQuotaIncreaseRequestFromTemplate'),
+        ('service-quotas', 'ListAWSDefaultServiceQuotas'),
+        ('service-quotas', 'ListRequestedServiceQuotaChangeHistory'),
+        ('service-quotas', 'ListRequestedServiceQuotaChangeHistoryByQuota'),
+        ('service-quotas', 'ListServiceQuotaIncreaseRequestsInTemplate'),
+        ('service-quotas', 'ListServiceQuotas'),
+        ('service-quotas', 'ListServices'),
+        ('service-quotas', 'ListTagsForResource'),
+        ('servicecatalog', 'DescribeConstraint'),
+        ('servicecatalog', 'DescribeCopyProductStatus'),
+        ('servicecatalog', 'DescribePortfolio'),
+        ('servicecatalog', 'DescribePortfolioShareStatus'),
+        ('servicecatalog', 'DescribePortfolioShares'),
+        ('servicecatalog', 'DescribeProduct'),
+        ('servicecatalog', 'DescribeProductAsAdmin'),
+        ('servicecatalog', 'DescribeProductView'),
+        ('servicecatalog', 'DescribeProvisionedProduct'),
+        ('servicecatalog', 'DescribeProvisionedProductPlan'),
+        ('servicecatalog', 'DescribeProvisioningArtifact'),
+        ('servicecatalog', 'DescribeProvisioningParameters'),
+        ('servicecatalog', 'DescribeRecord'),
+        ('servicecatalog', 'DescribeServiceAction'),
+        ('servicecatalog', 'DescribeServiceActionExecutionParameters'),
+        ('servicecatalog', 'DescribeTagOption'),
+        ('servicecatalog', 'ListAcceptedPortfolioShares'),
+        ('servicecatalog', 'ListBudgetsForResource'),
+        ('servicecatalog', 'ListConstraintsForPortfolio'),
+        ('servicecatalog', 'ListLaunchPaths'),
+        ('servicecatalog', 'ListOrganizationPortfolioAccess'),
+        ('servicecatalog', 'ListPortfolioAccess'),
+        ('servicecatalog', 'ListPortfolios'),
+        ('servicecatalog', 'ListPortfoliosForProduct'),
+        ('servicecatalog', 'ListPrincipalsForPortfolio'),
+        ('servicecatalog', 'ListProvisionedProductPlans'),
+        ('servicecatalog', 'ListProvisioningArtifacts'),
+        ('servicecatalog', 'ListProvisioningArtifactsForServiceAction'),
+        ('servicecatalog', 'ListRecordHistory'),
+        ('servicecatalog', 'ListResourcesForTagOption'),
+        ('servicecatalog', 'ListServiceActions'),
+        ('servicecatalog', 'ListServiceActionsForProvisioningArtifact'),
+        ('servicecatalog', 'ListStackInstancesForProvisionedProduct'),
+        ('servicecatalog', 'ListTagOptions'),
+        ('servicecatalog', 'ScanProvisionedProducts'),
+        ('servicecatalog', 'SearchProducts'),
+        ('servicecatalog', 'SearchProductsAsAdmin'),
+        ('servicecatalog', 'SearchProvisionedProducts'),
+        ('servicecatalog-appregistry', 'GetApplication'),
+        ('servicecatalog-appregistry', 'GetAttributeGroup'),
+        ('servicecatalog-appregistry', 'ListApplications'),
+        ('servicecatalog-appregistry', 'ListAssociatedAttributeGroups'),
+        ('servicecatalog-appregistry', 'ListAssociatedResources'),
+        ('servicecatalog-appregistry', 'ListAttributeGroups'),
+        ('servicecatalog-appregistry', 'ListAttributeGroupsForApplication'),
+        ('servicecatalog-appregistry', 'ListTagsForResource'),
+        ('servicediscovery', 'DiscoverInstances'),
+        ('servicediscovery', 'DiscoverInstancesRevision'),
+        ('servicediscovery', 'GetInstance'),
+        ('servicediscovery', 'GetInstancesHealthStatus'),
+        ('servicediscovery', 'GetNamespace'),
+        ('servicediscovery', 'GetOperation'),
+        ('servicediscovery', 'GetService'),
+        ('servicediscovery', 'ListInstances'),
+        ('servicediscovery', 'ListNamespaces'),
+        ('servicediscovery', 'ListOperations'),
+        ('servicediscovery', 'ListServices'),
+        ('servicediscovery', 'ListTagsForResource'),
+        ('ses', 'DescribeActiveReceiptRuleSet'),
+        ('ses', 'DescribeConfigurationSet'),
+        ('ses', 'DescribeReceiptRule'),
+        ('ses', 'DescribeReceiptRuleSet'),
+        ('ses', 'GetAccountSendingEnabled'),
+        ('ses', 'GetCustomVerificationEmailTemplate'),
+        ('ses', 'GetIdentityDkimAttributes'),
+        ('ses', 'GetIdentityMailFromDomainAttributes'),
+        ('ses', 'GetIdentityNotificationAttributes'),
+        ('ses', 'GetIdentityPolicies'),
+        ('ses', 'GetIdentityVerificationAttributes'),
+        ('ses', 'GetSendQuota'),
+        ('ses', 'GetSendStatistics'),
+        ('ses', 'GetTemplate'),
+        ('ses', 'ListConfigurationSets'),
+        ('ses', 'ListCustomVerificationEmailTemplates'),
+        ('ses', 'ListIdentities'),
+        ('ses', 'ListIdentityPolicies'),
+        ('ses', 'ListReceiptFilters'),
+        ('ses', 'ListReceiptRuleSets'),
+        ('ses', 'ListTemplates'),
+        ('ses', 'ListVerifiedEmailAddresses'),
+        ('sesv2', 'BatchGetMetricData'),
+        ('sesv2', 'GetAccount'),
+        ('sesv2', 'GetBlacklistReports'),
+        ('sesv2', 'GetConfigurationSet'),
+        ('sesv2', 'GetConfigurationSetEventDestinations'),
+        ('sesv2', 'GetContact'),
+        ('sesv2', 'GetContactList'),
+        ('sesv2', 'GetCustomVerificationEmailTemplate'),
+        ('sesv2', 'GetDedicatedIp'),
+        ('sesv2', 'GetDedicatedIpPool'),
+        ('sesv2', 'GetDedicatedIps'),
+        ('sesv2', 'GetDeliverabilityDashboardOptions'),
+        ('sesv2', 'GetDeliverabilityTestReport'),
+        ('sesv2', 'GetDomainDeliverabilityCampaign'),
+        ('sesv2', 'GetDomainStatisticsReport'),
+        ('sesv2', 'GetEmailIdentity'),
+        ('sesv2', 'GetEmailIdentityPolicies'),
+        ('sesv2', 'GetEmailTemplate'),
+        ('sesv2', 'GetExportJob'),
+        ('sesv2', 'GetImportJob'),
+        ('sesv2', 'GetMessageInsights'),
+        ('sesv2', 'GetSuppressedDestination'),
+        ('sesv2', 'ListConfigurationSets'),
+        ('sesv2', 'ListContactLists'),
+        ('sesv2', 'ListContacts'),
+        ('sesv2', 'ListCustomVerificationEmailTemplates'),
+        ('sesv2', 'ListDedicatedIpPools'),
+        ('sesv2', 'ListDeliverabilityTestReports'),
+        ('sesv2', 'ListDomainDeliverabilityCampaigns'),
+        ('sesv2', 'ListEmailIdentities'),
+        ('sesv2', 'ListEmailTemplates'),
+        ('sesv2', 'ListExportJobs'),
+        ('sesv2', 'ListImportJobs'),
+        ('sesv2', 'ListRecommendations'),
+        ('sesv2', 'ListSuppressedDestinations'),
+        ('sesv2', 'ListTagsForResource'),
+        ('shield', 'DescribeAttack'),
+        ('shield', 'DescribeAttackStatistics'),
+        ('shield', 'DescribeDRTAccess'),
+        ('shield', 'DescribeEmergencyContactSettings'),
+        ('shield', 'DescribeProtection'),
+        ('shield', 'DescribeProtectionGroup'),
+        ('shield', 'DescribeSubscription'),
+        ('shield', 'GetSubscriptionState'),
+        ('shield', 'ListAttacks'),
+        ('shield', 'ListProtectionGroups'),
+        ('shield', 'ListProtections'),
+        ('shield', 'ListResourcesInProtectionGroup'),
+        ('shield', 'ListTagsForResource'),
+        ('signer', 'DescribeSigningJob'),
+        ('signer', 'GetRevocationStatus'),
+        ('signer', 'GetSigningPlatform'),
+        ('signer', 'GetSigningProfile'),
+        ('signer', 'ListProfilePermissions'),
+        ('signer', 'ListSigningJobs'),
+        ('signer', 'ListSigningPlatforms'),
+        ('signer', 'ListSigningProfiles'),
+        ('signer', 'ListTagsForResource'),
+        ('sms-voice', 'GetConfigurationSetEventDestinations'),
+        ('sms-voice', 'ListConfigurationSets'),
+        ('snowball', 'DescribeAddress'),
+        ('snowball', 'DescribeAddresses'),
+        ('snowball', 'DescribeCluster'),
+        ('snowball', 'DescribeJob'),
+        ('snowball', 'DescribeReturnShippingLabel'),
+        ('snowball', 'GetJobManifest'),
+        ('snowball', 'GetJobUnlockCode'),
+        ('snowball', 'GetSnowballUsage'),
+        ('snowball', 'GetSoftwareUpdates'),
+        ('snowball', 'ListClusterJobs'),
+        ('snowball', 'ListClusters'),
+        ('snowball', 'ListCompatibleImages'),
+        ('snowball', 'ListJobs'),
+        ('snowball', 'ListLongTermPricing'),
+        ('snowball', 'ListPickupLocations'),
+        ('snowball', 'ListServiceVersions'),
+        ('sns', 'CheckIfPhoneNumberIsOptedOut'),
+        ('sns', 'GetDataProtectionPolicy'),
+        ('sns', 'GetEndpointAttributes'),
+        ('sns', 'GetPlatformApplicationAttributes'),
+        ('sns', 'GetSMSAttributes'),
+        ('sns', 'GetSMSSandboxAccountStatus'),
+        ('sns', 'GetSubscriptionAttributes'),
+        ('sns', 'GetTopicAttributes'),
+        ('sns', 'ListEndpointsByPlatformApplication'),
+        ('sns', 'ListOriginationNumbers'),
+        ('sns', 'ListPhoneNumbersOptedOut'),
+        ('sns', 'ListPlatformApplications'),
+        ('sns', 'ListSMSSandboxPhoneNumbers'),
+        ('sns', 'ListSubscriptions'),
+        ('sns', 'ListSubscriptionsByTopic'),
+        ('sns', 'ListTagsForResource'),
+        ('sns', 'ListTopics'),
+        ('sqs', 'GetQueueAttributes'),
+        ('sqs', 'GetQueueUrl'),
+        ('sqs', 'ListDeadLetterSourceQueues'),
+        ('sqs', 'ListMessageMoveTasks'),
+        ('sqs', 'ListQueueTags'),
+        ('sqs', 'ListQueues'),
+        ('sqs', 'ReceiveMessage'),
+        ('ssm', 'DescribeActivations'),
+        ('ssm', 'DescribeAssociation'),
+        ('ssm', 'DescribeAssociationExecutionTargets'),
+        ('ssm', 'DescribeAssociationExecutions'),
+        ('ssm', 'DescribeAutomationExecutions'),
+        ('ssm', 'DescribeAutomationStepExecutions'),
+        ('ssm', 'DescribeAvailablePatches'),
+        ('ssm', 'DescribeDocument'),
+        ('ssm', 'DescribeDocumentPermission'),
+        ('ssm', 'DescribeEffectiveInstanceAssociations'),
+        ('ssm', 'DescribeEffectivePatchesForPatchBaseline'),
+        ('ssm', 'DescribeInstanceAssociationsStatus'),
+        ('ssm', 'DescribeInstanceInformation'),
+        ('ssm', 'DescribeInstancePatchStates'),
+        ('ssm', 'DescribeInstancePatchStatesForPatchGroup'),
+        ('ssm', 'DescribeInstancePatches'),
+        ('ssm', 'DescribeInventoryDeletions'),
+        ('ssm', 'DescribeMaintenanceWindowExecutionTaskInvocations'),
+        ('ssm', 'DescribeMaintenanceWindowExecutionTasks'),
+        ('ssm', 'DescribeMaintenanceWindowExecutions'),
+        ('ssm', 'DescribeMaintenanceWindowSchedule'),
+        ('ssm', 'DescribeMaintenanceWindowTargets'),
+        ('ssm', 'DescribeMaintenanceWindowTasks'),
+        ('ssm', 'DescribeMaintenanceWindows'),
+        ('ssm', 'DescribeMaintenanceWindowsForTarget'),
+        ('ssm', 'DescribeOpsItems'),
+        ('ssm', 'DescribeParameters'),
+        ('ssm', 'DescribePatchBaselines'),
+        ('ssm', 'DescribePatchGroupState'),
+        ('ssm', 'DescribePatchGroups'),
+        ('ssm', 'DescribePatchProperties'),
+        ('ssm', 'DescribeSessions'),
+        ('ssm', 'GetAutomationExecution'),
+        ('ssm', 'GetCalendarState'),
+        ('ssm', 'GetCommandInvocation'),
+        ('ssm', 'GetConnectionStatus'),
+        ('ssm', 'GetDefaultPatchBaseline'),
+        ('ssm', 'GetDeployablePatchSnapshotForInstance'),
+        ('ssm', 'GetDocument'),
+        ('ssm', 'GetInventory'),
+        ('ssm', 'GetInventorySchema'),
+        ('ssm', 'GetMaintenanceWindow'),
+        ('ssm', 'GetMaintenanceWindowExecution'),
+        ('ssm', 'GetMaintenanceWindowExecutionTask'),
+        ('ssm', 'GetMaintenanceWindowExecutionTaskInvocation'),
+        ('ssm', 'GetMaintenanceWindowTask'),
+        ('ssm', 'GetOpsItem'),
+        ('ssm', 'GetOpsMetadata'),
+        ('ssm', 'GetOpsSummary'),
+        ('ssm', 'GetParameter'),
+        ('ssm', 'GetParameterHistory'),
+        ('ssm', 'GetParameters'),
+        ('ssm', 'GetParametersByPath'),
+        ('ssm', 'GetPatchBaseline'),
+        ('ssm', 'GetPatchBaselineForPatchGroup'),
+        ('ssm', 'GetResourcePolicies'),
+        ('ssm', 'GetServiceSetting'),
+        ('ssm', 'ListAssociationVersions'),
+        ('ssm', 'ListAssociations'),
+        ('ssm', 'ListCommandInvocations'),
+        ('ssm', 'ListCommands'),
+        ('ssm', 'ListComplianceItems'),
+        ('ssm', 'ListComplianceSummaries'),
+        ('ssm', 'ListDocumentMetadataHistory'),
+        ('ssm', 'ListDocumentVersions'),
+        ('ssm', 'ListDocuments'),
+        ('ssm', 'ListInventoryEntries'),
+        ('ssm', 'ListOpsItemEvents'),
+        ('ssm', 'ListOpsItemRelatedItems'),
+        ('ssm', 'ListOpsMetadata'),
+        ('ssm', 'ListResourceComplianceSummaries'),
+        ('ssm', 'ListResourceDataSync'),
+        ('ssm', 'ListTagsForResource'),
+        ('ssm-contacts', 'DescribeEngagement'),
+        ('ssm-contacts', 'DescribePage'),
+        ('ssm-contacts', 'GetContact'),
+        ('ssm-contacts', 'GetContactChannel'),
+        ('ssm-contacts', 'GetContactPolicy'),
+        ('ssm-contacts', 'GetRotation'),
+        ('ssm-contacts', 'GetRotationOverride'),
+        ('ssm-contacts', 'ListContactChannels'),
+        ('ssm-contacts', 'ListContacts'),
+        ('ssm-contacts', 'ListEngagements'),
+        ('ssm-contacts', 'ListPageReceipts'),
+        ('ssm-contacts', 'ListPageResolutions'),
+        ('ssm-contacts', 'ListPagesByContact'),
+        ('ssm-contacts', 'ListPagesByEngagement'),
+        ('ssm-contacts', 'ListPreviewRotationShifts'),
+        ('ssm-contacts', 'ListRotationOverrides'),
+        ('ssm-contacts', 'ListRotationShifts'),
+        ('ssm-contacts', 'ListRotations'),
+        ('ssm-contacts', 'ListTagsForResource'),
+        ('ssm-incidents', 'GetIncidentRecord'),
+        ('ssm-incidents', 'GetReplicationSet'),
+        ('ssm-incidents', 'GetResourcePolicies'),
+        ('ssm-incidents', 'GetResponsePlan'),
+        ('ssm-incidents', 'GetTimelineEvent'),
+        ('ssm-incidents', 'ListIncidentFindings'),
+        ('ssm-incidents', 'ListIncidentRecords'),
+        ('ssm-incidents', 'ListRelatedItems'),
+        ('ssm-incidents', 'ListReplicationSets'),
+        ('ssm-incidents', 'ListResponsePlans'),
+        ('ssm-incidents', 'ListTagsForResource'),
+        ('ssm-incidents', 'ListTimelineEvents'),
+        ('sso', 'GetRoleCredentials'),
+        ('sso', 'ListAccountRoles'),
+        ('sso', 'ListAccounts'),
+        ('sso-admin', 'DescribeAccountAssignmentCreationStatus'),
+        ('sso-admin', 'DescribeAccountAssignmentDeletionStatus'),
+        ('sso-admin', 'DescribeApplication'),
+        ('sso-admin', 'DescribeApplicationAssignment'),
+        ('sso-admin', 'DescribeApplicationProvider'),
+        ('sso-admin', 'DescribeInstance'),
+        ('sso-admin', 'DescribeInstanceAccessControlAttributeConfiguration'),
+        ('sso-admin', 'DescribePermissionSet'),
+        ('sso-admin', 'DescribePermissionSetProvisioningStatus'),
+        ('sso-admin', 'DescribeTrustedTokenIssuer'),
+        ('sso-admin', 'GetApplicationAccessScope'),
+        ('sso-admin', 'GetApplicationAssignmentConfiguration'),
+        ('sso-admin', 'GetApplicationAuthenticationMethod'),
+        ('sso-admin', 'GetApplicationGrant'),
+        ('sso-admin', 'GetInlinePolicyForPermissionSet'),
+        ('sso-admin', 'GetPermissionsBoundaryForPermissionSet'),
+        ('sso-admin', 'ListAccountAssignmentCreationStatus'),
+        ('sso-admin', 'ListAccountAssignmentDeletionStatus'),
+        ('sso-admin', 'ListAccountAssignments'),
+        ('sso-admin', 'ListAccountAssignmentsForPrincipal'),
+        ('sso-admin', 'ListAccountsForProvisionedPermissionSet'),
+        ('sso-admin', 'ListApplicationAccessScopes'),
+        ('sso-admin', 'ListApplicationAssignments'),
+        ('sso-admin', 'ListApplicationAssignmentsForPrincipal'),
+        ('sso-admin', 'ListApplicationAuthenticationMethods'),
+        ('sso-admin', 'ListApplicationGrants'),
+        ('sso-admin', 'ListApplicationProviders'),
+        ('sso-admin', 'ListApplications'),
+        ('sso-admin', 'ListCustomerManagedPolicyReferencesInPermissionSet'),
+        ('sso-admin', 'ListInstances'),
+        ('sso-admin', 'ListManagedPoliciesInPermissionSet'),
+        ('sso-admin', 'ListPermissionSetProvisioningStatus'),
+        ('sso-admin', 'ListPermissionSets'),
+        ('sso-admin', 'ListPermissionSetsProvisionedToAccount'),
+        ('sso-admin', 'ListTagsForResource'),
+        ('sso-admin', 'ListTrustedTokenIssuers'),
+        ('stepfunctions', 'DescribeActivity'),
+        ('stepfunctions', 'DescribeExecution'),
+        ('stepfunctions', 'DescribeMapRun'),
+        ('stepfunctions', 'DescribeStateMachine'),
+        ('stepfunctions', 'DescribeStateMachineAlias'),
+        ('stepfunctions', 'DescribeStateMachineForExecution'),
+        ('stepfunctions', 'GetExecutionHistory'),
+        ('stepfunctions', 'ListActivities'),
+        ('stepfunctions', 'ListExecutions'),
+        ('stepfunctions', 'ListMapRuns'),
+        ('stepfunctions', 'ListStateMachineAliases'),
+        ('stepfunctions', 'ListStateMachineVersions'),
+        ('stepfunctions', 'ListStateMachines'),
+        ('stepfunctions', 'ListTagsForResource'),
+        ('storagegateway', 'DescribeAvailabilityMonitorTest'),
+        ('storagegateway', 'DescribeBandwidthRateLimit'),
+        ('storagegateway', 'DescribeBandwidthRateLimitSchedule'),
+        ('storagegateway', 'DescribeCache'),
+        ('storagegateway', 'DescribeCachediSCSIVolumes'),
+        ('storagegateway', 'DescribeChapCredentials'),
+        ('storagegateway', 'DescribeFileSystemAssociations'),
+        ('storagegateway', 'DescribeGatewayInformation'),
+        ('storagegateway', 'DescribeMaintenanceStartTime'),
+        ('storagegateway', 'DescribeNFSFileShares'),
+        ('storagegateway', 'DescribeSMBFileShares'),
+        ('storagegateway', 'DescribeSMBSettings'),
+        ('storagegateway', 'DescribeSnapshotSchedule'),
+        ('storagegateway', 'DescribeStorediSCSIVolumes'),
+        ('storagegateway', 'DescribeTapeArchives'),
+        ('storagegateway', 'DescribeTapeRecoveryPoints'),
+        ('storagegateway', 'DescribeTapes'),
+        ('storagegateway', 'DescribeUploadBuffer'),
+        ('storagegateway', 'DescribeVTLDevices'),
+        ('storagegateway', 'DescribeWorkingStorage'),
+        ('storagegateway', 'ListAutomaticTapeCreationPolicies'),
+        ('storagegateway', 'ListFileShares'),
+        ('storagegateway', 'ListFileSystemAssociations'),
+        ('storagegateway', 'ListGateways'),
+        ('storagegateway', 'ListLocalDisks'),
+        ('storagegateway', 'ListTagsForResource'),
+        ('storagegateway', 'ListTapePools'),
+        ('storagegateway', 'ListTapes'),
+        ('storagegateway', 'ListVolumeInitiators'),
+        ('storagegateway', 'ListVolumeRecoveryPoints'),
+        ('storagegateway', 'ListVolumes'),
+        ('sts', 'GetAccessKeyInfo'),
+        ('sts', 'GetCallerIdentity'),
+        ('sts', 'GetFederationToken'),
+        ('sts', 'GetSessionToken'),
+        ('support', 'DescribeAttachment'),
+        ('support', 'DescribeCases'),
+        ('support', 'DescribeCommunications'),
+        ('support', 'DescribeCreateCaseOptions'),
+        ('support', 'DescribeServices'),
+        ('support', 'DescribeSeverityLevels'),
+        ('support', 'DescribeSupportedLanguages'),
+        ('support', 'DescribeTrustedAdvisorCheckRefreshStatuses'),
+        ('support', 'DescribeTrustedAdvisorCheckResult'),
+        ('support', 'DescribeTrustedAdvisorCheckSummaries'),
+        ('support', 'DescribeTrustedAdvisorChecks'),
+        ('swf', 'CountClosedWorkflowExecutions'),
+        ('swf', 'CountOpenWorkflowExecutions'),
+        ('swf', 'CountPendingActivityTasks'),
+        ('swf', 'CountPendingDecisionTasks'),
+        ('swf', 'DescribeActivityType'),
+        ('swf', 'DescribeDomain'),
+        ('swf', 'DescribeWorkflowExecution'),
+        ('swf', 'DescribeWorkflowType'),
+        ('swf', 'GetWorkflowExecutionHistory'),
+        ('swf', 'ListActivityTypes'),
+        ('swf', 'ListClosedWorkflowExecutions'),
+        ('swf', 'ListDomains'),
+        ('swf', 'ListOpenWorkflowExecutions'),
+        ('swf', 'ListTagsForResource'),
+        ('swf', 'ListWorkflowTypes'),
+        ('synthetics', 'DescribeCanaries'),
+        ('synthetics', 'DescribeCanariesLastRun'),
+        ('synthetics', 'DescribeRuntimeVersions'),
+        ('synthetics', 'GetCanary'),
+        ('synthetics', 'GetCanaryRuns'),
+        ('synthetics', 'GetGroup'),
+        ('synthetics', 'ListAssociatedGroups'),
+        ('synthetics', 'ListGroupResources'),
+        ('synthetics', 'ListGroups'),
+        ('synthetics', 'ListTagsForResource'),
+        ('timestream-query', 'DescribeEndpoints'),
+        ('timestream-query', 'DescribeScheduledQuery'),
+        ('timestream-query', 'ListScheduledQueries'),
+        ('timestream-query', 'ListTagsForResource'),
+        ('timestream-write', 'DescribeBatchLoadTask'),
+        ('timestream-write', 'DescribeDatabase'),
+        ('timestream-write', 'DescribeEndpoints'),
+        ('timestream-write', 'DescribeTable'),
+        ('timestream-write', 'ListBatchLoadTasks'),
+        ('timestream-write', 'ListDatabases'),
+        ('timestream-write', 'ListTables'),
+        ('timestream-write', 'ListTagsForResource'),
+        ('tnb', 'GetSolFunctionInstance'),
+        ('tnb', 'GetSolFunctionPackage'),
+        ('tnb', 'GetSolFunctionPackageContent'),
+        ('tnb', 'GetSolFunctionPackageDescriptor'),
+        ('tnb', 'GetSolNetworkInstance'),
+        ('tnb', 'GetSolNetworkOperation'),
+        ('tnb', 'GetSolNetworkPackage'),
+        ('tnb', 'GetSolNetworkPackageContent'),
+        ('tnb', 'GetSolNetworkPackageDescriptor'),
+        ('tnb', 'ListSolFunctionInstances'),
+        ('tnb', 'ListSolFunctionPackages'),
+        ('tnb', 'ListSolNetworkInstances'),
+        ('tnb', 'ListSolNetworkOperations'),
+        ('tnb', 'ListSolNetworkPackages'),
+        ('tnb', 'ListTagsForResource'),
+        ('transcribe', 'GetCallAnalyticsCategory'),
+        ('transcribe', 'GetCallAnalyticsJob'),
+        ('transcribe', 'GetMedicalScribeJob'),
+        ('transcribe', 'GetMedicalTranscriptionJob'),
+        ('transcribe', 'GetMedicalVocabulary'),
+        ('transcribe', 'GetTranscriptionJob'),
+        ('transcribe', 'GetVocabulary'),
+        ('transcribe', 'GetVocabularyFilter'),
+        ('transcribe', 'ListCallAnalyticsCategories'),
+        ('transcribe', 'ListCallAnalyticsJobs'),
+        ('transcribe', 'ListLanguageModels'),
+        ('transcribe', 'ListMedicalScribeJobs'),
+        ('transcribe', 'ListMedicalTranscriptionJobs'),
+        ('transcribe', 'ListMedicalVocabularies'),
+        ('transcribe', 'ListTagsForResource'),
+        ('transcribe', 'ListTranscriptionJobs'),
+        ('transcribe', 'ListVocabularies'),
+        ('transcribe', 'ListVocabularyFilters'),
+        ('transfer', 'DescribeAccess'),
+        ('transfer', 'DescribeAgreement'),
+        ('transfer', 'DescribeCertificate'),
+        ('transfer', 'DescribeConnector'),
+        ('transfer', 'DescribeExecution'),
+        ('transfer', 'DescribeHostKey'),
+        ('transfer', 'DescribeProfile'),
+        ('transfer', 'DescribeSecurityPolicy'),
+        ('transfer', 'DescribeServer'),
+        ('transfer', 'DescribeUser'),
+        ('transfer', 'DescribeWorkflow'),
+        ('transfer', 'ListAccesses'),
+        ('transfer', 'ListAgreements'),
+        ('transfer', 'ListCertificates'),
+        ('transfer', 'ListConnectors'),
+        ('transfer', 'ListExecutions'),
+        ('transfer', 'ListHostKeys'),
+        ('transfer', 'ListProfiles'),
+        ('transfer', 'ListSecurityPolicies'),
+        ('transfer', 'ListServers'),
+        ('transfer', 'ListTagsForResource'),
+        ('transfer', 'ListUsers'),
+        ('transfer', 'ListWorkflows'),
+        ('transfer', 'TestIdentityProvider'),
+        ('translate', 'DescribeTextTranslationJob'),
+        ('translate', 'GetParallelData'),
+        ('translate', 'GetTerminology'),
+        ('translate', 'ListLanguages'),
+        ('translate', 'ListParallelData'),
+        ('translate', 'ListTagsForResource'),
+        ('translate', 'ListTerminologies'),
+        ('translate', 'ListTextTranslationJobs'),
+        ('verifiedpermissions', 'GetIdentitySource'),
+        ('verifiedpermissions', 'GetPolicy'),
+        ('verifiedpermissions', 'GetPolicyStore'),
+        ('verifiedpermissions', 'GetPolicyTemplate'),
+        ('verifiedpermissions', 'GetSchema'),
+        ('verifiedpermissions', 'IsAuthorized'),
+        ('verifiedpermissions', 'IsAuthorizedWithToken'),
+        ('verifiedpermissions', 'ListIdentitySources'),
+        ('verifiedpermissions', 'ListPolicies'),
+        ('verifiedpermissions', 'ListPolicyStores'),
+        ('verifiedpermissions', 'ListPolicyTemplates'),
+        ('vpc-lattice', 'GetAccessLogSubscription'),
+        ('vpc-lattice', 'GetAuthPolicy'),
+        ('vpc-lattice', 'GetListener'),
+        ('vpc-lattice', 'GetResourcePolicy'),
+        ('vpc-lattice', 'GetRule'),
+        ('vpc-lattice', 'GetService'),
+        ('vpc-lattice', 'GetServiceNetwork'),
+        ('vpc-lattice', 'GetServiceNetworkServiceAssociation'),
+        ('vpc-lattice', 'GetServiceNetworkVpcAssociation'),
+        ('vpc-lattice', 'GetTargetGroup'),
+        ('vpc-lattice', 'ListAccessLogSubscriptions'),
+        ('vpc-lattice', 'ListListeners'),
+        ('vpc-lattice', 'ListRules'),
+        ('vpc-lattice', 'ListServiceNetworkServiceAssociations'),
+        ('vpc-lattice', 'ListServiceNetworkVpcAssociations'),
+        ('vpc-lattice', 'ListServiceNetworks'),
+        ('vpc-lattice', 'ListServices'),
+        ('vpc-lattice', 'ListTagsForResource'),
+        ('vpc-lattice', 'ListTargetGroups'),
+        ('vpc-lattice', 'ListTargets'),
+        ('waf', 'GetByteMatchSet'),
+        ('waf', 'GetChangeToken'),
+        ('waf', 'GetChangeTokenStatus'),
+        ('waf', 'GetGeoMatchSet'),
+        ('waf', 'GetIPSet'),
+        ('waf', 'GetLoggingConfiguration'),
+        ('waf', 'GetPermissionPolicy'),
+        ('waf', 'GetRateBasedRule'),
+        ('waf', 'GetRateBasedRuleManagedKeys'),
+        ('waf', 'GetRegexMatchSet'),
+        ('waf', 'GetRegexPatternSet'),
+        ('waf', 'GetRule'),
+        ('waf', 'GetRuleGroup'),
+        ('waf', 'GetSampledRequests'),
+        ('waf', 'GetSizeConstraintSet'),
+        ('waf', 'GetSqlInjectionMatchSet'),
+        ('waf', 'GetWebACL'),
+        ('waf', 'GetXssMatchSet'),
+        ('waf', 'ListActivatedRulesInRuleGroup'),
+        ('waf', 'ListByteMatchSets'),
+        ('waf', 'ListGeoMatchSets'),
+        ('waf', 'ListIPSets'),
+        ('waf', 'ListLoggingConfigurations'),
+        ('waf', 'ListRateBasedRules'),
+        ('waf', 'ListRegexMatchSets'),
+        ('waf', 'ListRegexPatternSets'),
+        ('waf', 'ListRuleGroups'),
+        ('waf', 'ListRules'),
+        ('waf', 'ListSizeConstraintSets'),
+        ('waf', 'ListSqlInjectionMatchSets'),
+        ('waf', 'ListSubscribedRuleGroups'),
+        ('waf', 'ListTagsForResource'),
+        ('waf', 'ListWebACLs'),
+        ('waf', 'ListXssMatchSets'),
+        ('waf-regional', 'GetByteMatchSet'),
+        ('waf-regional', 'GetChangeToken'),
+        ('waf-regional', 'GetChangeTokenStatus'),
+        ('waf-regional', 'GetGeoMatchSet'),
+        ('waf-regional', 'GetIPSet'),
+        ('waf-regional', 'GetLoggingConfiguration'),
+        ('waf-regional', 'GetPermissionPolicy'),
+        ('waf-regional', 'GetRateBasedRule'),
+        ('waf-regional', 'GetRateBasedRuleManagedKeys'),
+        ('waf-regional', 'GetRegexMatchSet'),
+        ('waf-regional', 'GetRegexPatternSet'),
+        ('waf-regional', 'GetRule'),
+        ('waf-regional', 'GetRuleGroup'),
+        ('waf-regional', 'GetSampledRequests'),
+        ('waf-regional', 'GetSizeConstraintSet'),
+        ('waf-regional', 'GetSqlInjectionMatchSet'),
+        ('waf-regional', 'GetWebACL'),
+        ('waf-regional', 'GetWebACLForResource'),
+        ('waf-regional', 'GetXssMatchSet'),
+        ('waf-regional', 'ListActivatedRulesInRuleGroup'),
+        ('waf-regional', 'ListByteMatchSets'),
+        ('waf-regional', 'ListGeoMatchSets'),
+        ('waf-regional', 'ListIPSets'),
+        ('waf-regional', 'ListLoggingConfigurations'),
+        ('waf-regional', 'ListRateBasedRules'),
+        ('waf-regional', 'ListRegexMatchSets'),
+        ('waf-regional', 'ListRegexPatternSets'),
+        ('waf-regional', 'ListResourcesForWebACL'),
+        ('waf-regional', 'ListRuleGroups'),
+        ('waf-regional', 'ListRules'),
+        ('waf-regional', 'ListSizeConstraintSets'),
+        ('waf-regional', 'ListSqlInjectionMatchSets'),
+        ('waf-regional', 'ListSubscribedRuleGroups'),
+        ('waf-regional', 'ListTagsForResource'),
+        ('waf-regional', 'ListWebACLs'),
+        ('waf-regional', 'ListXssMatchSets'),
+        ('wafv2', 'CheckCapacity'),
+        ('wafv2', 'DescribeAllManagedProducts'),
+        ('wafv2', 'DescribeManagedProductsByVendor'),
+        ('wafv2', 'DescribeManagedRuleGroup'),
+        ('wafv2', 'GetDecryptedAPIKey'),
+        ('wafv2', 'GetIPSet'),
+        ('wafv2', 'GetLoggingConfiguration'),
+        ('wafv2', 'GetManagedRuleSet'),
+        ('wafv2', 'GetMobileSdkRelease'),
+        ('wafv2', 'GetPermissionPolicy'),
+        ('wafv2', 'GetRateBasedStatementManagedKeys'),
+        ('wafv2', 'GetRegexPatternSet'),
+        ('wafv2', 'GetRuleGroup'),
+        ('wafv2', 'GetSampledRequests'),
+        ('wafv2', 'GetWebACL'),
+        ('wafv2', 'GetWebACLForResource'),
+        ('wafv2', 'ListAPIKeys'),
+        ('wafv2', 'ListAvailableManagedRuleGroupVersions'),
+        ('wafv2', 'ListAvailableManagedRuleGroups'),
+        ('wafv2', 'ListIPSets'),
+        ('wafv2', 'ListLoggingConfigurations'),
+        ('wafv2', 'ListManagedRuleSets'),
+        ('wafv2', 'ListMobileSdkReleases'),
+        ('wafv2', 'ListRegexPatternSets'),
+        ('wafv2', 'ListResourcesForWebACL'),
+        ('wafv2', 'ListRuleGroups'),
+        ('wafv2', 'ListTagsForResource'),
+        ('wafv2', 'ListWebACLs'),
+        ('wellarchitected', 'ExportLens'),
+        ('wellarchitected', 'GetAnswer'),
+        ('wellarchitected', 'GetConsolidatedReport'),
+        ('wellarchitected', 'GetLens'),
+        ('wellarchitected', 'GetLensReview'),
+        ('wellarchitected', 'GetLensReviewReport'),
+        ('wellarchitected', 'GetLensVersionDifference'),
+        ('wellarchitected', 'GetMilestone'),
+        ('wellarchitected', 'GetProfile'),
+        ('wellarchitected', 'GetProfileTemplate'),
+        ('wellarchitected', 'GetReviewTemplate'),
+        ('wellarchitected', 'GetReviewTemplateAnswer'),
+        ('wellarchitected', 'GetReviewTemplateLensReview'),
+        ('wellarchitected', 'GetWorkload'),
+        ('wellarchitected', 'ListAnswers'),
+        ('wellarchitected', 'ListCheckDetails'),
+        ('wellarchitected', 'ListCheckSummaries'),
+        ('wellarchitected', 'ListLensReviewImprovements'),
+        ('wellarchitected', 'ListLensReviews'),
+        ('wellarchitected', 'ListLensShares'),
+        ('wellarchitected', 'ListLenses'),
+        ('wellarchitected', 'ListMilestones'),
+        ('wellarchitected', 'ListNotifications'),
+        ('wellarchitected', 'ListProfileNotifications'),
+        ('wellarchitected', 'ListProfileShares'),
+        ('wellarchitected', 'ListProfiles'),
+        ('wellarchitected', 'ListReviewTemplateAnswers'),
+        ('wellarchitected', 'ListReviewTemplates'),
+        ('wellarchitected', 'ListShareInvitations'),
+        ('wellarchitected', 'ListTagsForResource'),
+        ('wellarchitected', 'ListTemplateShares'),
+        ('wellarchitected', 'ListWorkloadShares'),
+        ('wellarchitected', 'ListWorkloads'),
+        ('workdocs', 'DescribeActivities'),
+        ('workdocs', 'DescribeComments'),
+        ('workdocs', 'DescribeDocumentVersions'),
+        ('workdocs', 'DescribeFolderContents'),
+        ('workdocs', 'DescribeGroups'),
+        ('workdocs', 'DescribeNotificationSubscriptions'),
+        ('workdocs', 'DescribeResourcePermissions'),
+        ('workdocs', 'DescribeRootFolders'),
+        ('workdocs', 'DescribeUsers'),
+        ('workdocs', 'GetCurrentUser'),
+        ('workdocs', 'GetDocument'),
+        ('workdocs', 'GetDocumentPath'),
+        ('workdocs', 'GetDocumentVersion'),
+        ('workdocs', 'GetFolder'),
+        ('workdocs', 'GetFolderPath'),
+        ('workdocs', 'GetResources'),
+        ('workmail', 'DescribeEmailMonitoringConfiguration'),
+        ('workmail', 'DescribeEntity'),
+        ('workmail', 'DescribeGroup'),
+        ('workmail', 'DescribeInboundDmarcSettings'),
+        ('workmail', 'DescribeMailboxExportJob'),
+        ('workmail', 'DescribeOrganization'),
+        ('workmail', 'DescribeResource'),
+        ('workmail', 'DescribeUser'),
+        ('workmail', 'GetAccessControlEffect'),
+        ('workmail', 'GetDefaultRetentionPolicy'),
+        ('workmail', 'GetImpersonationRole'),
+        ('workmail', 'GetImpersonationRoleEffect'),
+        ('workmail', 'GetMailDomain'),
+        ('workmail', 'GetMailboxDetails'),
+        ('workmail', 'GetMobileDeviceAccessEffect'),
+        ('workmail', 'GetMobileDeviceAccessOverride'),
+        ('workmail', 'ListAccessControlRules'),
+        ('workmail', 'ListAliases'),
+        ('workmail', 'ListAvailabilityConfigurations'),
+        ('workmail', 'ListGroupMembers'),
+        ('workmail', 'ListGroups'),
+        ('workmail', 'ListGroupsForEntity'),
+        ('workmail', 'ListImpersonationRoles'),
+        ('workmail', 'ListMailDomains'),
+        ('workmail', 'ListMailboxExportJobs'),
+        ('workmail', 'ListMailboxPermissions'),
+        ('workmail', 'ListMobileDeviceAccessOverrides'),
+        ('workmail', 'ListMobileDeviceAccessRules'),
+        ('workmail', 'ListOrganizations'),
+        ('workmail', 'ListResourceDelegates'),
+        ('workmail', 'ListResources'),
+        ('workmail', 'ListTagsForResource'),
+        ('workmail', 'ListUsers'),
+        ('workspaces', 'DescribeAccount'),
+        ('workspaces', 'DescribeAccountModifications'),
+        ('workspaces', 'DescribeApplicationAssociations'),
+        ('workspaces', 'DescribeApplications'),
+        ('workspaces', 'DescribeBundleAssociations'),
+        ('workspaces', 'DescribeClientBranding'),
+        ('workspaces', 'DescribeClientProperties'),
+        ('workspaces', 'DescribeConnectClientAddIns'),
+        ('workspaces', 'DescribeConnectionAliasPermissions'),
+        ('workspaces', 'DescribeConnectionAliases'),
+        ('workspaces', 'DescribeImageAssociations'),
+        ('workspaces', 'DescribeIpGroups'),
+        ('workspaces', 'DescribeTags'),
+        ('workspaces', 'DescribeWorkspaceAssociations'),
+        ('workspaces', 'DescribeWorkspaceBundles'),
+        ('workspaces', 'DescribeWorkspaceDirectories'),
+        ('workspaces', 'DescribeWorkspaceImagePermissions'),
+        ('workspaces', 'DescribeWorkspaceImages'),
+        ('workspaces', 'DescribeWorkspaceSnapshots'),
+        ('workspaces', 'DescribeWorkspaces'),
+        ('workspaces', 'DescribeWorkspacesConnectionStatus'),
+        ('workspaces-web', 'GetBrowserSettings'),
+        ('workspaces-web', 'GetIdentityProvider'),
+        ('workspaces-web', 'GetIpAccessSettings'),
+        ('workspaces-web', 'GetNetworkSettings'),
+        ('workspaces-web', 'GetPortal'),
+        ('workspaces-web', 'GetPortalServiceProviderMetadata'),
+        ('workspaces-web', 'GetTrustStore'),
+        ('workspaces-web', 'GetTrustStoreCertificate'),
+        ('workspaces-web', 'GetUserAccessLoggingSettings'),
+        ('workspaces-web', 'GetUserSettings'),
+        ('workspaces-web', 'ListBrowserSettings'),
+        ('workspaces-web', 'ListIdentityProviders'),
+        ('workspaces-web', 'ListIpAccessSettings'),
+        ('workspaces-web', 'ListNetworkSettings'),
+        ('workspaces-web', 'ListPortals'),
+        ('workspaces-web', 'ListTagsForResource'),
+        ('workspaces-web', 'ListTrustStoreCertificates'),
+        ('workspaces-web', 'ListTrustStores'),
+        ('workspaces-web', 'ListUserAccessLoggingSettings'),
+        ('workspaces-web', 'ListUserSettings'),
+        ('xray', 'BatchGetTraces'),
+        ('xray', 'GetEncryptionConfig'),
+        ('xray', 'GetGroup'),
+        ('xray', 'GetGroups'),
+        ('xray', 'GetInsight'),
+        ('xray', 'GetInsightEvents'),
+        ('xray', 'GetInsightImpactGraph'),
+        ('xray', 'GetInsightSummaries'),
+        ('xray', 'GetSamplingRules'),
+        ('xray', 'GetSamplingStatisticSummaries'),
+        ('xray', 'GetSamplingTargets'),
+        ('xray', 'GetServiceGraph'),
+        ('xray', 'GetTimeSeriesServiceStatistics'),
+        ('xray', 'GetTraceGraph'),
+        ('xray', 'GetTraceSummaries'),
+    }
+)
@@ -11,19 +11,30 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-import importlib.resources
-import json
+import functools
+import gzip
+import ijson
+import msgpack
+import orjson
 import os
-import requests
-from collections import defaultdict
+import queue
+import sys
+import threading
+import urllib3
+from ._readonly_data import READONLY
+from collections.abc import Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
 from loguru import logger
 from pathlib import Path
-from typing import List
+from typing import cast
 
 
 SERVICE_REFERENCE_URL = 'https://servicereference.us-east-1.amazonaws.com/'
-METADATA_FILE = 'data/api_metadata.json'
 DEFAULT_REQUEST_TIMEOUT = 5
+SERVICE_FETCH_MAX_WORKERS = 8
+SERVICE_PRIME_MAX_WORKERS = 2
+CACHE_COMPRESS_LEVEL = 3
+HAS_CACHE_MAXSIZE = 4096
 OVERRIDES = {
     'sts': {
         'AssumeRole': False,
@@ -47,17 +58,156 @@ OVERRIDES = {
 
 # 로컬 캐시 디렉토리 경로
 # 환경변수 AWS_API_MCP_CACHE_DIR로 지정 가능, 미지정 시 ~/.aws/aws-api-mcp/cache/
-CACHE_DIR = Path(os.environ.get('AWS_API_MCP_CACHE_DIR', str(Path.home() / '.aws' / 'aws-api-mcp' / 'cache')))
-# 서비스 참조 URL 목록 캐시 파일
-SERVICE_REFERENCE_CACHE_FILE = CACHE_DIR / 'service_reference_urls.json'
-# 서비스별 읽기 전용 작업 목록 캐시 디렉토리
-SERVICE_OPERATIONS_CACHE_DIR = CACHE_DIR / 'service_operations'
+CACHE_DIR = Path(
+    os.environ.get('AWS_API_MCP_CACHE_DIR', str(Path.home() / '.aws' / 'aws-api-mcp' / 'cache'))
+)
+# 서비스 참조 URL 목록 캐시 파일 (gzip 압축한 msgpack, {서비스: URL})
+SERVICE_REFERENCE_CACHE_FILE = CACHE_DIR / 'service_reference_urls.mp.gz'
+# 서비스별 읽기 전용 작업 목록 캐시 파일 (gzip 압축한 msgpack 레코드 스트림, [서비스, msgpack으로 묶은 [작업, ...]])
+# 서비스별 목록은 bytes로 한 번 더 묶여 있어 조회한 서비스만 디코딩한다.
+# 새로 조회한 서비스는 파일 전체를 다시 쓰지 않고 레코드 하나를 이어 붙인다.
+SERVICE_OPERATIONS_CACHE_FILE = CACHE_DIR / 'service_operations.mp.gz'
+# 이전 버전이 JSON으로 저장하던 캐시. 새 형식의 캐시가 없을 때 한 번 읽어서 새 형식으로 옮긴다.
+LEGACY_SERVICE_REFERENCE_CACHE_FILE = CACHE_DIR / 'service_reference_urls.json'
+LEGACY_SERVICE_OPERATIONS_CACHE_DIR = CACHE_DIR / 'service_operations'
+
+
+# 서비스 참조 문서 조회에 재사용하는 커넥션 풀
+_HTTP = urllib3.PoolManager(
+    maxsize=SERVICE_FETCH_MAX_WORKERS + SERVICE_PRIME_MAX_WORKERS,
+    retries=urllib3.Retry(total=1),
+)
+
+# has()가 기다리는 서비스별 작업 목록 조회를 실행하는 공용 스레드 풀
+_SERVICE_FETCH_EXECUTOR = ThreadPoolExecutor(
+    max_workers=SERVICE_FETCH_MAX_WORKERS, thread_name_prefix='read-only-operations'
+)
 
 
 def _ensure_cache_dir():
     """캐시 디렉토리가 존재하지 않으면 생성한다."""
     CACHE_DIR.mkdir(parents=True, exist_ok=True)
-    SERVICE_OPERATIONS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+
+
+def _open_cache_file(cache_file: Path) -> gzip.GzipFile | None:
+    """gzip으로 압축된 캐시 파일을 연다. 캐시 파일이 없으면 None을 반환한다."""
+    if not cache_file.exists():
+        return None
+    return gzip.GzipFile(cache_file, 'rb')
+
+
+def _read_cache_file(cache_file: Path) -> bytes | None:
+    """캐시 파일 전체를 읽는다. 캐시 파일이 없으면 None을 반환한다."""
+    f = _open_cache_file(cache_file)
+    if f is None:
+        return None
+    with f:
+        return f.read()
+
+
+def _packb(obj) -> bytes:
+    """msgpack으로 직렬화한다.
+
+    msgpack.packb는 Packer(autoreset=False)일 때를 위해 None도 반환하도록 타입이 붙어 있지만
+    packb는 항상 bytes를 반환한다.
+    """
+    return cast(bytes, msgpack.packb(obj, use_bin_type=True))
+
+
+def _write_cache_file(cache_file: Path, data: bytes):
+    """캐시 파일을 gzip으로 압축해 저장한다."""
+    with gzip.open(cache_file, 'wb', compresslevel=CACHE_COMPRESS_LEVEL) as f:
+        f.write(data)
+
+
+def _compress_cache_records(records: Iterable[tuple[str, bytes]]) -> bytes:
+    """레코드들을 gzip 멤버 하나로 압축한다."""
+    data = b''.join(_packb(list(record)) for record in records)
+    return gzip.compress(data, compresslevel=CACHE_COMPRESS_LEVEL)
+
+
+def _append_cache_records(cache_file: Path, records: Iterable[tuple[str, bytes]]):
+    """레코드들을 gzip 멤버 하나로 압축해 캐시 파일 끝에 이어 붙인다.
+
+    여러 프로세스가 동시에 이어 붙여도 섞이지 않도록 압축을 먼저 끝내고 한 번에 쓴다.
+    """
+    data = _compress_cache_records(records)
+    with open(cache_file, 'ab') as f:
+        f.write(data)
+
+
+def _rewrite_cache_records(cache_file: Path, records: Iterable[tuple[str, bytes]]):
+    """레코드들만 담은 캐시 파일을 새로 쓴다.
+
+    다른 프로세스가 쓰다 만 파일을 읽지 않도록 임시 파일에 쓴 뒤 교체한다.
+    """
+    tmp_file = cache_file.with_name(f'{cache_file.name}.{os.getpid()}.tmp')
+    tmp_file.write_bytes(_compress_cache_records(records))
+    os.replace(tmp_file, cache_file)
+
+
+def _load_service_operations_cache() -> dict[str, bytes]:
+    """서비스별 읽기 전용 작업 목록 캐시 파일의 레코드를 처음부터 끝까지 읽는다.
+
+    같은 서비스의 레코드가 여러 번 있으면 마지막 레코드를 사용한다. 파일 끝의 gzip 멤버가
+    덜 쓰였으면 다른 프로세스가 아직 이어 붙이는 중일 수 있으므로 그 앞까지만 읽고 파일은 그대로
+    둔다. 중간의 멤버가 손상되었으면 그 뒤에 이어 붙인 레코드도 읽을 수 없으므로, 그 앞까지
+    읽은 레코드만으로 파일을 다시 써서 다음 실행부터는 손상되지 않은 파일에 이어 붙이게 한다.
+    서비스별 작업 목록은 묶인 bytes 그대로 두고, 디코딩은 _unpack_service_operations에 맡긴다.
+    """
+    cache = {}
+    unpacker = msgpack.Unpacker(raw=False)
+    try:
+        f = _open_cache_file(SERVICE_OPERATIONS_CACHE_FILE)
+        if f is None:
+            return _migrate_legacy_service_operations_cache()
+        with f:
+            # read()는 쓰다 만 gzip 멤버에서 예외가 나면 그 앞까지 읽은 내용도 버리므로
+            # read1()으로 조금씩 읽어 앞의 레코드를 먼저 반영한다.
+            while chunk := f.read1():
+                unpacker.feed(chunk)
+                for service, operations in unpacker:
+                    cache[service] = operations
+    except EOFError as e:
+        logger.debug(f'Service operations cache ends with an incomplete record: {e}')
+    except Exception as e:
+        logger.warning(f'Failed to load service operations cache, compacting it: {e}')
+        try:
+            _rewrite_cache_records(SERVICE_OPERATIONS_CACHE_FILE, cache.items())
+        except Exception as e:
+            logger.warning(f'Failed to compact service operations cache: {e}')
+    return cache
+
+
+def _pack_service_operations(operations: Iterable[str]) -> bytes:
+    """서비스 하나의 읽기 전용 작업 목록을 캐시에 저장할 bytes로 묶는다."""
+    return _packb(sorted(operations))
+
+
+def _unpack_service_operations(packed: bytes) -> set[str]:
+    """캐시에 저장된 서비스 하나의 읽기 전용 작업 목록을 set으로 푼다."""
+    return set(map(sys.intern, msgpack.unpackb(packed, raw=False)))
+
+
+def _migrate_legacy_service_operations_cache() -> dict[str, bytes]:
+    """이전 버전이 서비스마다 JSON 파일로 저장하던 캐시를 읽어 레코드 스트림 파일로 옮긴다."""
+    cache = {}
+    if not LEGACY_SERVICE_OPERATIONS_CACHE_DIR.is_dir():
+        return cache
+    for cache_file in sorted(LEGACY_SERVICE_OPERATIONS_CACHE_DIR.glob('*.json')):
+        try:
+            cache[cache_file.stem] = _pack_service_operations(
+                orjson.loads(cache_file.read_bytes())
+            )
+        except Exception as e:
+            logger.warning(f'Failed to migrate service operations cache {cache_file}: {e}')
+    if cache:
+        try:
+            _append_cache_records(SERVICE_OPERATIONS_CACHE_FILE, cache.items())
+            logger.info(f'Migrated service operations cache of {len(cache)} services')
+        except Exception as e:
+            logger.warning(f'Failed to save migrated service operations cache: {e}')
+    return cache
 
 
 class ServiceReferenceUrlsByService(dict):
@@ -75,98 +225,205 @@ class ServiceReferenceUrlsByService(dict):
             return
         # 캐시가 없으면 외부 호출
         try:
-            response = requests.get(SERVICE_REFERENCE_URL, timeout=DEFAULT_REQUEST_TIMEOUT).json()
-            for service_reference in response:
+            response = _HTTP.request('GET', SERVICE_REFERENCE_URL, timeout=DEFAULT_REQUEST_TIMEOUT)
+            if response.status != 200:
+                raise RuntimeError(f'unexpected HTTP status {response.status}')
+            for service_reference in orjson.loads(response.data):
                 self[service_reference['service']] = service_reference['url']
-            self._save_cache(response)
+            self._save_cache()
             logger.info('Service reference loaded from remote and cached locally')
         except Exception as e:
             logger.error(f'Error retrieving the service reference document: {e}')
             raise RuntimeError(f'Error retrieving the service reference document: {e}')
 
-    def _save_cache(self, response: list):
-        """외부 호출 결과를 로컬 캐시 파일에 저장한다."""
+    def _save_cache(self):
+        """외부 호출 결과를 {서비스: URL} 형태로 로컬 캐시 파일에 저장한다."""
         try:
             _ensure_cache_dir()
-            with open(SERVICE_REFERENCE_CACHE_FILE, 'w') as f:
-                json.dump(response, f)
+            _write_cache_file(SERVICE_REFERENCE_CACHE_FILE, _packb(dict(self)))
         except Exception as e:
             logger.warning(f'Failed to save service reference cache: {e}')
 
     def _load_cache(self) -> bool:
         """로컬 캐시 파일에서 서비스 참조 URL 목록을 로드한다."""
-        if not SERVICE_REFERENCE_CACHE_FILE.exists():
-            return False
         try:
-            with open(SERVICE_REFERENCE_CACHE_FILE, 'r') as f:
-                response = json.load(f)
-            for service_reference in response:
-                self[service_reference['service']] = service_reference['url']
+            data = _read_cache_file(SERVICE_REFERENCE_CACHE_FILE)
+            if data is None:
+                return self._migrate_legacy_cache()
+            self.update(msgpack.unpackb(data, raw=False))
             return True
         except Exception as e:
             logger.warning(f'Failed to load service reference cache: {e}')
             return False
 
+    def _migrate_legacy_cache(self) -> bool:
+        """이전 버전이 JSON으로 저장하던 서비스 참조 URL 목록이 있으면 읽어서 새 형식으로 저장한다."""
+        if not LEGACY_SERVICE_REFERENCE_CACHE_FILE.exists():
+            return False
+        for service_reference in orjson.loads(LEGACY_SERVICE_REFERENCE_CACHE_FILE.read_bytes()):
+            self[service_reference['service']] = service_reference['url']
+        self._save_cache()
+        return True
+
 
 class ReadOnlyOperations(dict):
     """Read only operations list by service."""
 
-    def __init__(self, service_reference_urls_by_service: dict[str, str]):
-        """Initialize the read only operations list."""
+    def __init__(self, service_reference_urls_by_service: dict[str, str], prime: bool = False):
+        """Initialize the read only operations list.
+
+        prime이 True이면 모든 서비스의 작업 목록을 백그라운드에서 미리 가져온다.
+        """
         super().__init__()
         self._service_reference_urls_by_service = service_reference_urls_by_service
-        self._known_readonly_operations = self._get_known_readonly_operations_from_metadata()
-        for service, operations in self._get_custom_readonly_operations().items():
-            if service in self._known_readonly_operations:
-                self._known_readonly_operations[service] = [
-                    *self._known_readonly_operations[service],
-                    *operations,
-                ]
-            else:
-                self._known_readonly_operations[service] = operations
+        self._service_futures: dict[str, Future] = {}
+        self._service_futures_lock = threading.Lock()
+        self._prime_services: queue.SimpleQueue[str] = queue.SimpleQueue()
+        self._prime_threads: list[threading.Thread] = []
+        self._service_operations_cache: dict[str, bytes] | None = None
+        self._service_operations_cache_lock = threading.Lock()
+        self._cached_has = functools.lru_cache(maxsize=HAS_CACHE_MAXSIZE)(self._has)
+        if prime:
+            threading.Thread(
+                target=self._prime, name='read-only-operations-prime', daemon=True
+            ).start()
+
+    def __setitem__(self, service, operations):
+        """Set the read only operations of a service.
+
+        Lookups are only cached for services that are loaded or can be fetched, and a fetched
+        service's lookups are cached after it is set, so only replacing the operations of an
+        already loaded service can leave stale results behind.
+        """
+        replaced = service in self
+        super().__setitem__(service, operations)
+        if replaced:
+            self._cached_has.cache_clear()
 
     def has(self, service, operation) -> bool:
         """Check if the operation is in the read only operations list."""
-        logger.info(f'checking in read only list : {service} - {operation}')
+        if service not in self and service not in self._service_reference_urls_by_service:
+            return self._has(service, operation)
+        return self._cached_has(service, operation)
+
+    def _has(self, service, operation) -> bool:
+        logger.trace('checking in read only list : {} - {}', service, operation)
         if service in OVERRIDES and operation in OVERRIDES[service]:
             return OVERRIDES[service][operation]
-        if (
-            service in self._known_readonly_operations
-            and operation in self._known_readonly_operations[service]
-        ):
+        if (service, operation) in READONLY:
             return True
         if service not in self:
             if service not in self._service_reference_urls_by_service:
                 return False
-            self._cache_ready_only_operations_for_service(service)
+            future = self._get_service_future(service)
+            try:
+                future.result()
+            except Exception:
+                self._discard_failed_future(service, future)
+                raise
         return operation in self[service]
 
-    def _cache_ready_only_operations_for_service(self, service: str):
-        """서비스별 읽기 전용 작업 목록을 가져온다.
+    def _prime(self):
+        """로컬 캐시에 없는 서비스의 작업 목록을 백그라운드 데몬 스레드에서 미리 가져온다.
 
-        로컬 캐시를 우선 사용하고, 캐시가 없을 때만 외부 URL을 호출한다.
+        로컬 캐시에 있는 서비스는 has()가 처음 조회할 때 디코딩하므로 미리 가져오지 않는다.
+        미리 가져오기 스레드는 데몬 스레드이므로 프로세스 종료를 막지 않는다.
         """
-        cache_file = SERVICE_OPERATIONS_CACHE_DIR / f'{service}.json'
+        cache = self._get_service_operations_cache()
+        for service in self._service_reference_urls_by_service:
+            if service not in self and service not in cache:
+                self._prime_services.put(service)
+        for i in range(SERVICE_PRIME_MAX_WORKERS):
+            thread = threading.Thread(
+                target=self._prime_worker, name=f'read-only-operations-prime-{i}', daemon=True
+            )
+            self._prime_threads.append(thread)
+            thread.start()
 
-        # 로컬 캐시 우선
-        if cache_file.exists():
+    def _prime_worker(self):
+        """미리 가져올 서비스를 하나씩 꺼내 조회한다.
+
+        조회를 시작하는 시점에만 future를 등록하므로, 아직 차례가 오지 않은 서비스를 has()가
+        조회하면 미리 가져오기를 기다리지 않고 _SERVICE_FETCH_EXECUTOR에서 바로 조회한다.
+        이미 has()가 조회를 시작한 서비스는 건너뛴다.
+        """
+        while True:
             try:
-                with open(cache_file, 'r') as f:
-                    self[service] = json.load(f)
-                logger.info(f'Service operations for {service} loaded from local cache')
+                service = self._prime_services.get_nowait()
+            except queue.Empty:
                 return
+            with self._service_futures_lock:
+                if service in self._service_futures:
+                    continue
+                future = Future()
+                future.set_running_or_notify_cancel()
+                self._service_futures[service] = future
+            try:
+                self._cache_ready_only_operations_for_service(service)
             except Exception as e:
-                logger.warning(f'Failed to load service operations cache for {service}: {e}')
+                future.set_exception(e)
+                self._discard_failed_future(service, future)
+            else:
+                future.set_result(None)
+
+    def _discard_failed_future(self, service: str, future: Future):
+        """실패한 조회는 다음 호출에서 다시 시도할 수 있도록 버린다."""
+        if future.cancelled() or future.exception() is None:
+            return
+        with self._service_futures_lock:
+            if self._service_futures.get(service) is future:
+                del self._service_futures[service]
+
+    def _get_service_future(self, service: str) -> Future:
+        """서비스별 작업 목록 조회 future를 반환한다.
+
+        같은 서비스에 대한 동시 호출이 각자 외부 URL을 호출하지 않도록
+        서비스당 하나의 조회만 실행하고 나머지 호출은 그 결과를 기다린다.
+        """
+        with self._service_futures_lock:
+            future = self._service_futures.get(service)
+            if future is None:
+                future = _SERVICE_FETCH_EXECUTOR.submit(
+                    self._cache_ready_only_operations_for_service, service
+                )
+                self._service_futures[service] = future
+            return future
+
+    def _cache_ready_only_operations_for_service(self, service: str):
+        """서비스별 읽기 전용 작업 목록을 가져온다.
+
+        로컬 캐시를 우선 사용하고, 캐시가 없을 때만 외부 URL을 호출한다.
+        """
+        # 로컬 캐시 우선
+        cached_operations = self._get_service_operations_cache().get(service)
+        if cached_operations is not None:
+            self[service] = _unpack_service_operations(cached_operations)
+            logger.info(f'Service operations for {service} loaded from local cache')
+            return
 
         # 캐시가 없으면 외부 호출
+        # 응답 전체를 dict로 만들지 않고 Action 단위로 스트리밍 파싱한다.
         try:
-            response = requests.get(
-                self._service_reference_urls_by_service[service], timeout=DEFAULT_REQUEST_TIMEOUT
-            ).json()
-            self[service] = []
-            for action in response['Actions']:
-                if not action['Annotations']['Properties']['IsWrite']:
-                    self[service].append(action['Name'])
+            response = _HTTP.request(
+                'GET',
+                self._service_reference_urls_by_service[service],
+                timeout=DEFAULT_REQUEST_TIMEOUT,
+                preload_content=False,
+            )
+            try:
+                if response.status != 200:
+                    raise RuntimeError(f'unexpected HTTP status {response.status}')
+                operations = set()
+                for action in ijson.items(response, 'Actions.item'):
+                    try:
+                        is_write = action['Annotations']['Properties']['IsWrite']
+                    except KeyError:
+                        is_write = True
+                    if not is_write:
+                        operations.add(sys.intern(action['Name']))
+            finally:
+                response.release_conn()
+            self[service] = operations
             self._save_service_cache(service, self[service])
         except Exception as e:
             logger.error(f'Error retrieving the service reference document for {service}: {e}')
@@ -174,52 +431,34 @@ class ReadOnlyOperations(dict):
                 f'Error retrieving the service reference document for {service}: {e}'
             )
 
-    @staticmethod
-    def _save_service_cache(service: str, operations: list):
+    def _get_service_operations_cache(self) -> dict[str, bytes]:
+        """로컬 캐시 파일은 처음 필요할 때 한 번만 읽고 이후에는 메모리의 내용을 사용한다."""
+        with self._service_operations_cache_lock:
+            if self._service_operations_cache is None:
+                self._service_operations_cache = _load_service_operations_cache()
+            return self._service_operations_cache
+
+    def _save_service_cache(self, service: str, operations: set[str]):
         """서비스별 읽기 전용 작업 목록을 로컬 캐시에 저장한다."""
-        try:
-            _ensure_cache_dir()
-            cache_file = SERVICE_OPERATIONS_CACHE_DIR / f'{service}.json'
-            with open(cache_file, 'w') as f:
-                json.dump(operations, f)
-        except Exception as e:
-            logger.warning(f'Failed to save service operations cache for {service}: {e}')
-
-    def _get_known_readonly_operations_from_metadata(self) -> dict[str, List[str]]:
-        known_readonly_operations = defaultdict(list)
-        with (
-            importlib.resources.files('awslabs.aws_api_mcp_server.core')
-            .joinpath(METADATA_FILE)
-            .open() as metadata_file
-        ):
-            data = json.load(metadata_file)
-        for service, operations in data.items():
-            for operation, operation_metadata in operations.items():
-                operation_type = operation_metadata.get('type')
-                if operation_type == 'ReadOnly':
-                    known_readonly_operations[service].append(operation)
-        return known_readonly_operations
-
-    @staticmethod
-    def _get_custom_readonly_operations() -> dict[str, List[str]]:
-        return {
-            's3': ['ls', 'presign'],
-            'cloudfront': ['sign'],
-            'cloudtrail': ['validate-logs'],
-            'codeartifact': ['login'],
-            'codecommit': ['credential-helper'],
-            'datapipeline': ['list-runs'],
-            'ecr': ['get-login', 'get-login-password'],
-            'ecr-public': ['get-login-password'],
-            'eks': ['get-token'],
-            'emr': ['describe-cluster'],
-            'gamelift': ['get-game-session-log'],
-            'logs': ['start-live-tail'],
-            'rds': ['generate-db-auth-token'],
-            'configservice': ['get-status'],
-        }
+        cache = self._get_service_operations_cache()
+        with self._service_operations_cache_lock:
+            cache[service] = _pack_service_operations(operations)
+            try:
+                _ensure_cache_dir()
+                _append_cache_records(SERVICE_OPERATIONS_CACHE_FILE, [(service, cache[service])])
+            except Exception as e:
+                logger.warning(f'Failed to save service operations cache for {service}: {e}')
 
 
+@functools.lru_cache(maxsize=1)
 def get_read_only_operations() -> ReadOnlyOperations:
-    """Get the read only operations."""
-    return ReadOnlyOperations(ServiceReferenceUrlsByService())
+    """Get the read only operations.
+
+    프로세스 안에서 한 번만 생성하고 이후 호출에는 같은 객체를 반환한다.
+    """
+    return ReadOnlyOperations(ServiceReferenceUrlsByService(), prime=True)
+
+
+def reset_read_only_operations():
+    """다음 get_read_only_operations() 호출이 새 객체를 만들도록 캐시된 객체를 버린다."""
+    get_read_only_operations.cache_clear()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""패키지에 포함되는 읽기 전용 작업 모듈을 생성하는 스크립트.
+
+`data/api_metadata.json`의 읽기 전용 작업과 CLI 사용자 정의 작업을 합쳐
+`metadata/_readonly_data.py`에 (서비스, 작업) 튜플의 frozenset 리터럴로 기록한다.
+런타임은 이 모듈을 import만 하므로 시작할 때 메타데이터를 읽거나 병합하지 않는다.
+api_metadata.json이나 CUSTOM_READONLY_OPERATIONS를 바꾼 뒤에는 이 스크립트를 다시 실행해야 한다.
+"""
+
+import simdjson
+from pathlib import Path
+
+
+PACKAGE_DIR = Path(__file__).resolve().parent.parent / 'awslabs/aws_api_mcp_server/core'
+METADATA_FILE = PACKAGE_DIR / 'data/api_metadata.json'
+OUTPUT_FILE = PACKAGE_DIR / 'metadata/_readonly_data.py'
+
+# api_metadata.json에 없는 CLI 사용자 정의 명령 중 읽기 전용인 것
+CUSTOM_READONLY_OPERATIONS = {
+    's3': {'ls', 'presign'},
+    'cloudfront': {'sign'},
+    'cloudtrail': {'validate-logs'},
+    'codeartifact': {'login'},
+    'codecommit': {'credential-helper'},
+    'datapipeline': {'list-runs'},
+    'ecr': {'get-login', 'get-login-password'},
+    'ecr-public': {'get-login-password'},
+    'eks': {'get-token'},
+    'emr': {'describe-cluster'},
+    'gamelift': {'get-game-session-log'},
+    'logs': {'start-live-tail'},
+    'rds': {'generate-db-auth-token'},
+    'configservice': {'get-status'},
+}
+
+MODULE_HEADER = '''\
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""읽기 전용 (서비스, 작업) 목록.
+
+scripts/gen_readonly_module.py가 생성한 파일이므로 직접 수정하지 않는다.
+"""
+
+'''
+
+
+def collect_readonly_operations(metadata_file: Path = METADATA_FILE) -> set[tuple[str, str]]:
+    """api_metadata.json의 읽기 전용 작업과 사용자 정의 작업을 (서비스, 작업) 집합으로 합친다."""
+    document = simdjson.Parser().parse(metadata_file.read_bytes())
+    readonly_operations = {
+        (service, operation)
+        for service, operations in document.items()
+        for operation, operation_metadata in operations.items()
+        if operation_metadata.get('type') == 'ReadOnly'
+    }
+    for service, operations in CUSTOM_READONLY_OPERATIONS.items():
+        readonly_operations.update((service, operation) for operation in operations)
+    return readonly_operations
+
+
+def render_module(readonly_operations: set[tuple[str, str]]) -> str:
+    """모듈 소스를 ruff format을 거쳐도 바뀌지 않는 모양으로 만든다."""
+    lines = [MODULE_HEADER + 'READONLY: frozenset[tuple[str, str]] = frozenset(', '    {']
+    lines.extend(
+        f'        ({service!r}, {operation!r}),'
+        for service, operation in sorted(readonly_operations)
+    )
+    lines.extend(['    }', ')', ''])
+    return '\n'.join(lines)
+
+
+def main():
+    """_readonly_data.py를 다시 생성한다."""
+    readonly_operations = collect_readonly_operations()
+    OUTPUT_FILE.write_text(render_module(readonly_operations))
+    print(f'Wrote {len(readonly_operations)} read only operations -> {OUTPUT_FILE}')
+
+
+if __name__ == '__main__':
+    main()
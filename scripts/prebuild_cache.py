@@ -19,75 +19,249 @@
 이후 폐쇄망 런타임에서는 이 캐시 파일을 사용한다.
 """
 
-import json
-import requests
+import asyncio
+import gzip
+import httpx
+import msgpack
+import orjson
+import os
+import simdjson
 import sys
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+
 SERVICE_REFERENCE_URL = 'https://servicereference.us-east-1.amazonaws.com/'
 REQUEST_TIMEOUT = 10
-MAX_WORKERS = 20
+MAX_KEEPALIVE_CONNECTIONS = 50
+MAX_CONNECTIONS = 100
+CACHE_COMPRESS_LEVEL = 3
+
+
+def _extract_read_only_operations(document: bytes) -> list[str]:
+    """서비스 참조 문서에서 Actions[*].Name과 Actions[*].Annotations.Properties.IsWrite만 읽는다.
 
+    simdjson 객체는 접근한 필드만 파이썬 객체로 변환하므로 Resources, ActionConditionKeys 등
+    나머지 필드는 디코딩되지 않는다.
+    """
+    read_only_ops = []
+    for action in simdjson.Parser().parse(document).get('Actions', []):
+        try:
+            is_write = action['Annotations']['Properties']['IsWrite']
+        except KeyError:
+            is_write = True
+        if not is_write:
+            read_only_ops.append(action['Name'])
+    return read_only_ops
 
-def fetch_service_operations(service_name: str, service_url: str, operations_dir: Path) -> bool:
-    """서비스별 읽기 전용 작업 목록을 가져와 캐시 파일로 저장한다."""
+
+def _load_msgpack_cache(path: Path) -> dict:
+    """이전 실행에서 저장한 msgpack 캐시 파일을 읽는다. 없거나 읽을 수 없으면 빈 dict를 반환한다."""
+    if not path.exists():
+        return {}
     try:
-        svc_resp = requests.get(service_url, timeout=REQUEST_TIMEOUT)
-        svc_resp.raise_for_status()
-        svc_data = svc_resp.json()
-        read_only_ops = [
-            action['Name']
-            for action in svc_data.get('Actions', [])
-            if not action.get('Annotations', {}).get('Properties', {}).get('IsWrite', True)
-        ]
-        svc_file = operations_dir / f'{service_name}.json'
-        with open(svc_file, 'w') as f:
-            json.dump(read_only_ops, f)
-        return True
+        with gzip.open(path, 'rb') as f:
+            return msgpack.unpackb(f.read(), raw=False)
     except Exception as e:
-        print(f'  WARNING: Failed to cache {service_name}: {e}', file=sys.stderr)
-        return False
+        print(f'  WARNING: Ignoring unreadable cache {path}: {e}', file=sys.stderr)
+        return {}
 
 
-def main():
-    cache_dir = Path(sys.argv[1]) if len(sys.argv) > 1 else Path('/app/cache')
-    operations_dir = cache_dir / 'service_operations'
-    cache_dir.mkdir(parents=True, exist_ok=True)
-    operations_dir.mkdir(parents=True, exist_ok=True)
+def _load_service_operations_records(path: Path) -> dict[str, bytes]:
+    """이전 실행에서 저장한 서비스별 작업 목록 레코드 스트림을 읽는다.
 
-    # 1. 서비스 참조 URL 목록 가져오기
-    print(f'Fetching service reference from {SERVICE_REFERENCE_URL} ...')
+    같은 서비스의 레코드가 여러 번 있으면 마지막 레코드를 사용한다.
+    """
+    records = {}
+    if not path.exists():
+        return records
+    unpacker = msgpack.Unpacker(raw=False)
     try:
-        response = requests.get(SERVICE_REFERENCE_URL, timeout=REQUEST_TIMEOUT)
-        response.raise_for_status()
-        service_list = response.json()
+        with gzip.open(path, 'rb') as f:
+            # 쓰다 만 gzip 멤버 앞의 레코드는 살리도록 read1()으로 조금씩 읽는다.
+            while chunk := f.read1():
+                unpacker.feed(chunk)
+                for service, operations in unpacker:
+                    records[service] = operations
     except Exception as e:
-        print(f'ERROR: Failed to fetch service reference: {e}', file=sys.stderr)
-        sys.exit(1)
-
-    ref_file = cache_dir / 'service_reference_urls.json'
-    with open(ref_file, 'w') as f:
-        json.dump(service_list, f)
-    print(f'Cached {len(service_list)} service references -> {ref_file}')
-
-    # 2. 각 서비스별 읽기 전용 작업 목록을 병렬로 가져오기
-    success = 0
-    failed = 0
-    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
-        futures = {
-            executor.submit(
-                fetch_service_operations, svc['service'], svc['url'], operations_dir
-            ): svc['service']
-            for svc in service_list
-        }
-        for future in as_completed(futures):
-            if future.result():
-                success += 1
-            else:
-                failed += 1
-
-    print(f'Done: {success} services cached, {failed} failed')
+        print(f'  WARNING: Ignoring rest of unreadable cache {path}: {e}', file=sys.stderr)
+    return records
+
+
+async def _write_service_operations_records(
+    queue: asyncio.Queue[tuple[str, bytes] | None], output_file: Path
+) -> int:
+    """큐에서 꺼낸 (서비스, 작업 목록) 레코드를 하나의 파일에 차례로 쓴다.
+
+    None을 꺼내면 종료하고 쓴 레코드 수를 반환한다.
+    """
+    written = 0
+    with gzip.open(output_file, 'wb', compresslevel=CACHE_COMPRESS_LEVEL) as f:
+        while (record := await queue.get()) is not None:
+            f.write(msgpack.packb(list(record), use_bin_type=True))
+            written += 1
+    return written
+
+
+def _load_etags(etags_file: Path) -> dict[str, dict[str, str]]:
+    """URL별 ETag/Last-Modified 값을 저장한 사이드카 파일을 읽는다."""
+    if not etags_file.exists():
+        return {}
+    try:
+        return orjson.loads(etags_file.read_bytes())
+    except Exception as e:
+        print(f'  WARNING: Ignoring unreadable {etags_file}: {e}', file=sys.stderr)
+        return {}
+
+
+async def _conditional_get(
+    client: httpx.AsyncClient, url: str, etags: dict[str, dict[str, str]], has_cached: bool
+) -> httpx.Response | None:
+    """캐시된 응답이 있으면 If-None-Match/If-Modified-Since를 붙여 요청한다.
+
+    서버가 304를 반환하면 None을 반환한다. etags는 읽기만 하며, 새 응답의 검증자는
+    호출하는 쪽이 응답을 처리한 뒤에 _response_validators로 저장한다.
+    """
+    headers = {}
+    validators = etags.get(url, {}) if has_cached else {}
+    if 'etag' in validators:
+        headers['If-None-Match'] = validators['etag']
+    if 'last_modified' in validators:
+        headers['If-Modified-Since'] = validators['last_modified']
+    response = await client.get(url, headers=headers)
+    if response.status_code == httpx.codes.NOT_MODIFIED:
+        return None
+    response.raise_for_status()
+    return response
+
+
+def _response_validators(response: httpx.Response) -> dict[str, str]:
+    """응답의 ETag/Last-Modified를 etags.json에 저장할 형태로 꺼낸다."""
+    return {
+        key: value
+        for key, value in (
+            ('etag', response.headers.get('ETag')),
+            ('last_modified', response.headers.get('Last-Modified')),
+        )
+        if value
+    }
+
+
+async def fetch_service_operations(
+    client: httpx.AsyncClient,
+    service_name: str,
+    service_url: str,
+    cached_operations: bytes | None,
+    etags: dict[str, dict[str, str]],
+) -> bytes | None:
+    """서비스별 읽기 전용 작업 목록을 msgpack으로 묶어 가져온다.
+
+    이전 캐시가 있고 서버 문서가 바뀌지 않았으면(304) 이전 캐시를 그대로 반환한다.
+    가져오지 못하면 이전 캐시를, 이전 캐시도 없으면 None을 반환한다.
+    """
+    try:
+        svc_resp = await _conditional_get(
+            client, service_url, etags, cached_operations is not None
+        )
+        if svc_resp is None:
+            return cached_operations
+        operations = msgpack.packb(
+            sorted(_extract_read_only_operations(svc_resp.content)), use_bin_type=True
+        )
+        # 처리하지 못한 응답의 검증자를 저장하면 다음 실행부터 304만 받아 갱신되지 않으므로
+        # 응답을 모두 처리한 뒤에 저장한다.
+        etags[service_url] = _response_validators(svc_resp)
+        return operations
+    except Exception as e:
+        if cached_operations is not None:
+            print(
+                f'  WARNING: Failed to refresh {service_name}, keeping cached copy: {e}',
+                file=sys.stderr,
+            )
+        else:
+            print(f'  WARNING: Failed to cache {service_name}: {e}', file=sys.stderr)
+        return cached_operations
+
+
+async def prebuild(cache_dir: Path, transport: httpx.AsyncBaseTransport | None = None):
+    """하나의 커넥션 풀을 공유하며 서비스 참조 데이터를 동시에 가져온다.
+
+    모든 요청이 같은 AsyncClient를 재사용하므로 TLS 핸드셰이크와 TCP 연결이
+    서비스마다 새로 맺어지지 않는다. 같은 캐시 디렉토리로 다시 실행하면 etags.json에
+    저장한 검증자로 조건부 요청을 보내 바뀌지 않은 문서는 다시 받지 않는다.
+    서비스별 결과는 큐를 거쳐 하나의 writer 태스크가 도착하는 순서대로 한 파일에 쓴다.
+    transport를 넘기면 실제 네트워크 대신 그 transport로 요청을 보낸다.
+    """
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    ref_file = cache_dir / 'service_reference_urls.mp.gz'
+    operations_file = cache_dir / 'service_operations.mp.gz'
+    etags_file = cache_dir / 'etags.json'
+
+    cached_urls_by_service = _load_msgpack_cache(ref_file)
+    cached_service_operations = _load_service_operations_records(operations_file)
+    etags = _load_etags(etags_file)
+
+    limits = httpx.Limits(
+        max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS, max_connections=MAX_CONNECTIONS
+    )
+    async with httpx.AsyncClient(
+        http2=True, limits=limits, timeout=REQUEST_TIMEOUT, transport=transport
+    ) as client:
+        # 1. 서비스 참조 URL 목록 가져오기
+        print(f'Fetching service reference from {SERVICE_REFERENCE_URL} ...')
+        try:
+            response = await _conditional_get(
+                client, SERVICE_REFERENCE_URL, etags, bool(cached_urls_by_service)
+            )
+        except Exception as e:
+            print(f'ERROR: Failed to fetch service reference: {e}', file=sys.stderr)
+            sys.exit(1)
+
+        if response is None:
+            urls_by_service = cached_urls_by_service
+            print(f'Service references not modified, keeping {ref_file}')
+        else:
+            urls_by_service = {
+                svc['service']: svc['url'] for svc in orjson.loads(response.content)
+            }
+            with gzip.open(ref_file, 'wb', compresslevel=CACHE_COMPRESS_LEVEL) as f:
+                f.write(msgpack.packb(urls_by_service, use_bin_type=True))
+            etags[SERVICE_REFERENCE_URL] = _response_validators(response)
+            print(f'Cached {len(urls_by_service)} service references -> {ref_file}')
+
+        # 2. 각 서비스별 읽기 전용 작업 목록을 동시에 가져오며, 끝나는 대로 하나의 writer가
+        #    임시 파일에 레코드로 이어 쓰기
+        queue: asyncio.Queue[tuple[str, bytes] | None] = asyncio.Queue()
+        tmp_file = operations_file.with_name(f'{operations_file.name}.tmp')
+        writer = asyncio.create_task(_write_service_operations_records(queue, tmp_file))
+
+        async def fetch_and_enqueue(service: str, url: str):
+            operations = await fetch_service_operations(
+                client, service, url, cached_service_operations.get(service), etags
+            )
+            if operations is not None:
+                await queue.put((service, operations))
+
+        await asyncio.gather(
+            *(fetch_and_enqueue(service, url) for service, url in urls_by_service.items())
+        )
+        await queue.put(None)
+        success = await writer
+
+    # 3. 모든 레코드를 쓴 뒤에 캐시 파일을 교체하기
+    os.replace(tmp_file, operations_file)
+
+    # 목록에서 사라진 URL의 검증자는 버린다.
+    live_urls = [SERVICE_REFERENCE_URL, *urls_by_service.values()]
+    with open(etags_file, 'wb') as f:
+        f.write(orjson.dumps({url: etags[url] for url in live_urls if url in etags}))
+
+    failed = len(urls_by_service) - success
+    print(f'Done: {success} services cached, {failed} failed -> {operations_file}')
+
+
+def main():
+    cache_dir = Path(sys.argv[1]) if len(sys.argv) > 1 else Path('/app/cache')
+    asyncio.run(prebuild(cache_dir))
 
 
 if __name__ == '__main__':
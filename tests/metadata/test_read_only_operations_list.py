@@ -1,12 +1,24 @@
+import gzip
+import importlib.util
+import io
+import json
+import msgpack
 import pytest
+import threading
+import time
+from awslabs.aws_api_mcp_server.core.metadata import read_only_operations_list
 from awslabs.aws_api_mcp_server.core.metadata.read_only_operations_list import (
     DEFAULT_REQUEST_TIMEOUT,
     SERVICE_REFERENCE_URL,
     ReadOnlyOperations,
     ServiceReferenceUrlsByService,
+    get_read_only_operations,
+    reset_read_only_operations,
 )
-from requests import Response
-from unittest.mock import MagicMock, call, patch
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import call, patch
+from urllib3 import HTTPResponse
 
 
 TEST_SERVICE = 'testService'
@@ -16,6 +28,52 @@ TEST_READ_OPERATION_2 = 'TestReadOperation2'
 TEST_WRITE_OPERATION = 'TestWriteOperation'
 
 
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path, monkeypatch):
+    """Point the local cache at a temporary directory so tests never share cache state."""
+    monkeypatch.setattr(read_only_operations_list, 'CACHE_DIR', tmp_path)
+    monkeypatch.setattr(
+        read_only_operations_list,
+        'SERVICE_REFERENCE_CACHE_FILE',
+        tmp_path / 'service_reference_urls.mp.gz',
+    )
+    monkeypatch.setattr(
+        read_only_operations_list,
+        'SERVICE_OPERATIONS_CACHE_FILE',
+        tmp_path / 'service_operations.mp.gz',
+    )
+    monkeypatch.setattr(
+        read_only_operations_list,
+        'LEGACY_SERVICE_REFERENCE_CACHE_FILE',
+        tmp_path / 'service_reference_urls.json',
+    )
+    monkeypatch.setattr(
+        read_only_operations_list,
+        'LEGACY_SERVICE_OPERATIONS_CACHE_DIR',
+        tmp_path / 'service_operations',
+    )
+    return tmp_path
+
+
+def _json_response(body) -> HTTPResponse:
+    """Build a preloaded response whose body is the given document."""
+    return HTTPResponse(body=json.dumps(body).encode(), status=200)
+
+
+def _packb(obj) -> bytes:
+    """Serialize with msgpack, narrowing packb's optional return type."""
+    packed = msgpack.packb(obj, use_bin_type=True)
+    assert packed is not None
+    return packed
+
+
+def _streamed_response(body: dict) -> HTTPResponse:
+    """Build a streamed response whose body is the given document."""
+    return HTTPResponse(
+        body=io.BytesIO(json.dumps(body).encode()), status=200, preload_content=False
+    )
+
+
 @pytest.fixture
 def sample_service_reference_list_response():
     """Fixture providing a sample policy document."""
@@ -71,37 +129,30 @@ def sample_service_reference_response():
     }
 
 
-@patch('requests.get')
+@patch.object(read_only_operations_list._HTTP, 'request')
 def test_read_only_operations_initialization(
-    mocked_requests_get, sample_service_reference_list_response
+    mocked_http_request, sample_service_reference_list_response
 ):
     """Test ReadOnlyOperations initialization."""
-    mocked_service_reference_list_response = MagicMock(spec=Response)
-    mocked_service_reference_list_response.json.return_value = (
-        sample_service_reference_list_response
-    )
-    mocked_requests_get.return_value = mocked_service_reference_list_response
+    mocked_service_reference_list_response = _json_response(sample_service_reference_list_response)
+    mocked_http_request.return_value = mocked_service_reference_list_response
 
     operations = ReadOnlyOperations(ServiceReferenceUrlsByService())
 
     assert isinstance(operations, dict)
-    mocked_requests_get.assert_called_once_with(
-        SERVICE_REFERENCE_URL, timeout=DEFAULT_REQUEST_TIMEOUT
+    mocked_http_request.assert_called_once_with(
+        'GET', SERVICE_REFERENCE_URL, timeout=DEFAULT_REQUEST_TIMEOUT
     )
 
 
-@patch('requests.get')
+@patch.object(read_only_operations_list._HTTP, 'request')
 def test_read_only_operations_has_method_missing_service(
-    mocked_requests_get, sample_service_reference_list_response, sample_service_reference_response
+    mocked_http_request, sample_service_reference_list_response, sample_service_reference_response
 ):
     """Test the has method of ReadOnlyOperations when the provided service is missing."""
-    mocked_service_reference_list_response = MagicMock(spec=Response)
-    mocked_service_reference_list_response.json.return_value = (
-        sample_service_reference_list_response
-    )
-    mocked_service_reference_response = MagicMock(spec=Response)
-    mocked_service_reference_response.json.return_value = sample_service_reference_response
-    mocked_requests_get.side_effect = [
+    mocked_service_reference_list_response = _json_response(sample_service_reference_list_response)
+    mocked_service_reference_response = _streamed_response(sample_service_reference_response)
+    mocked_http_request.side_effect = [
         mocked_service_reference_list_response,
         mocked_service_reference_response,
     ]
@@ -111,27 +162,23 @@ def test_read_only_operations_has_method_missing_service(
     assert isinstance(operations, dict)
     assert operations.has(TEST_SERVICE, TEST_READ_OPERATION)
     assert not operations.has(TEST_SERVICE, TEST_WRITE_OPERATION)
-    mocked_requests_get.assert_has_calls(
+    mocked_http_request.assert_has_calls(
         [
-            call(SERVICE_REFERENCE_URL, timeout=DEFAULT_REQUEST_TIMEOUT),
-            call(TEST_URL, timeout=DEFAULT_REQUEST_TIMEOUT),
+            call('GET', SERVICE_REFERENCE_URL, timeout=DEFAULT_REQUEST_TIMEOUT),
+            call('GET', TEST_URL, timeout=DEFAULT_REQUEST_TIMEOUT, preload_content=False),
         ],
         any_order=False,
     )
 
 
-@patch('requests.get')
+@patch.object(read_only_operations_list._HTTP, 'request')
 def test_read_only_operations_has_method_second_call_for_service_queries_local_cache(
-    mocked_requests_get, sample_service_reference_list_response, sample_service_reference_response
+    mocked_http_request, sample_service_reference_list_response, sample_service_reference_response
 ):
     """Test the has method of ReadOnlyOperations when the provided service is available."""
-    mocked_service_reference_list_response = MagicMock(spec=Response)
-    mocked_service_reference_list_response.json.return_value = (
-        sample_service_reference_list_response
-    )
-    mocked_service_reference_response = MagicMock(spec=Response)
-    mocked_service_reference_response.json.return_value = sample_service_reference_response
-    mocked_requests_get.side_effect = [
+    mocked_service_reference_list_response = _json_response(sample_service_reference_list_response)
+    mocked_service_reference_response = _streamed_response(sample_service_reference_response)
+    mocked_http_request.side_effect = [
         mocked_service_reference_list_response,
         mocked_service_reference_response,
     ]
@@ -143,24 +190,234 @@ def test_read_only_operations_has_method_second_call_for_service_queries_local_c
     assert operations.has(TEST_SERVICE, TEST_READ_OPERATION)
     # Second call for the same service, should lookup data from local cache
     assert operations.has(TEST_SERVICE, TEST_READ_OPERATION_2)
-    mocked_requests_get.assert_has_calls(
+    mocked_http_request.assert_has_calls(
         [
-            call(SERVICE_REFERENCE_URL, timeout=DEFAULT_REQUEST_TIMEOUT),
-            call(TEST_URL, timeout=DEFAULT_REQUEST_TIMEOUT),
+            call('GET', SERVICE_REFERENCE_URL, timeout=DEFAULT_REQUEST_TIMEOUT),
+            call('GET', TEST_URL, timeout=DEFAULT_REQUEST_TIMEOUT, preload_content=False),
         ],
         any_order=False,
     )
-    assert mocked_requests_get.call_count == 2
+    assert mocked_http_request.call_count == 2
+
+
+@patch.object(read_only_operations_list._HTTP, 'request')
+def test_read_only_operations_service_operations_loaded_from_local_cache(
+    mocked_http_request, sample_service_reference_response
+):
+    """Test that service operations fetched once are reloaded from the local cache as a set."""
+    mocked_http_request.return_value = _streamed_response(sample_service_reference_response)
+
+    ReadOnlyOperations({TEST_SERVICE: TEST_URL}).has(TEST_SERVICE, TEST_READ_OPERATION)
+    operations = ReadOnlyOperations({TEST_SERVICE: TEST_URL})
+
+    assert operations.has(TEST_SERVICE, TEST_READ_OPERATION_2)
+    assert not operations.has(TEST_SERVICE, TEST_WRITE_OPERATION)
+    assert operations[TEST_SERVICE] == {TEST_READ_OPERATION, TEST_READ_OPERATION_2}
+    mocked_http_request.assert_called_once_with(
+        'GET', TEST_URL, timeout=DEFAULT_REQUEST_TIMEOUT, preload_content=False
+    )
+
+
+@patch.object(read_only_operations_list._HTTP, 'request')
+def test_read_only_operations_only_decodes_queried_service_from_local_cache(
+    mocked_http_request, isolated_cache_dir
+):
+    """Test that only the queried service is decoded from the local cache."""
+    with gzip.GzipFile(isolated_cache_dir / 'service_operations.mp.gz', 'wb') as f:
+        f.write(_packb([TEST_SERVICE, _packb([TEST_READ_OPERATION])]))
+        # Not valid msgpack, so decoding this entry would raise
+        f.write(_packb(['otherService', b'\xc1']))
+    operations = ReadOnlyOperations({TEST_SERVICE: TEST_URL, 'otherService': TEST_URL})
+
+    assert operations.has(TEST_SERVICE, TEST_READ_OPERATION)
+    assert not operations.has(TEST_SERVICE, TEST_READ_OPERATION_2)
+    assert 'otherService' not in operations
+    mocked_http_request.assert_not_called()
+
+
+@patch.object(read_only_operations_list._HTTP, 'request')
+def test_read_only_operations_appends_fetched_services_to_local_cache(
+    mocked_http_request, isolated_cache_dir, sample_service_reference_response
+):
+    """Test that each fetched service is appended to the local cache as its own record."""
+    cache_file = isolated_cache_dir / 'service_operations.mp.gz'
+    mocked_http_request.side_effect = [
+        _streamed_response(sample_service_reference_response),
+        _streamed_response(sample_service_reference_response),
+    ]
+    urls_by_service = {TEST_SERVICE: TEST_URL, 'otherService': TEST_URL}
+
+    operations = ReadOnlyOperations(urls_by_service)
+    operations.has(TEST_SERVICE, TEST_READ_OPERATION)
+    operations.has('otherService', TEST_READ_OPERATION)
+    with gzip.open(cache_file, 'rb') as f:
+        records = list(msgpack.Unpacker(f, raw=False))
+    # A record left half-written by an interrupted process
+    with open(cache_file, 'ab') as f:
+        f.write(gzip.compress(_packb(['brokenService', b'']))[:-4])
+    operations = ReadOnlyOperations(urls_by_service)
+
+    assert [service for service, _ in records] == [TEST_SERVICE, 'otherService']
+
+    assert operations.has(TEST_SERVICE, TEST_READ_OPERATION_2)
+    assert operations.has('otherService', TEST_READ_OPERATION_2)
+    assert mocked_http_request.call_count == 2
+
+
+def test_service_operations_cache_compacted_after_truncated_record(isolated_cache_dir):
+    """Test that a cache with a half-written record is rewritten so later appends stay readable."""
+    cache_file = isolated_cache_dir / 'service_operations.mp.gz'
+    packed = _packb([TEST_READ_OPERATION])
+    with open(cache_file, 'ab') as f:
+        f.write(gzip.compress(_packb(['a', packed])))
+        f.write(gzip.compress(_packb(['broken', packed]))[:-4])
+        f.write(gzip.compress(_packb(['c', packed])))
+
+    assert list(read_only_operations_list._load_service_operations_cache()) == ['a', 'broken']
+
+    read_only_operations_list._append_cache_records(cache_file, [('c', packed)])
+
+    assert list(read_only_operations_list._load_service_operations_cache()) == ['a', 'broken', 'c']
+    assert not list(isolated_cache_dir.glob('*.tmp'))
+
+
+def test_service_operations_cache_not_compacted_while_last_record_is_written(
+    isolated_cache_dir,
+):
+    """Test that a record still being appended by another process is left in place."""
+    cache_file = isolated_cache_dir / 'service_operations.mp.gz'
+    packed = _packb([TEST_READ_OPERATION])
+    pending = gzip.compress(_packb(['b', packed]))
+    with open(cache_file, 'ab') as f:
+        f.write(gzip.compress(_packb(['a', packed])))
+        f.write(pending[:-4])
+    contents = cache_file.read_bytes()
+
+    assert list(read_only_operations_list._load_service_operations_cache()) == ['a', 'b']
+    assert cache_file.read_bytes() == contents
+
+    with open(cache_file, 'ab') as f:
+        f.write(pending[-4:])
+
+    assert list(read_only_operations_list._load_service_operations_cache()) == ['a', 'b']
+    assert cache_file.read_bytes() == contents + pending[-4:]
+
+
+@patch.object(read_only_operations_list._HTTP, 'request')
+def test_read_only_operations_has_method_action_without_annotations(
+    mocked_http_request, sample_service_reference_response
+):
+    """Test that actions without IsWrite annotations are treated as write operations."""
+    sample_service_reference_response['Actions'].append({'Name': 'UnannotatedOperation'})
+    mocked_http_request.return_value = _streamed_response(sample_service_reference_response)
+
+    operations = ReadOnlyOperations({TEST_SERVICE: TEST_URL})
+
+    assert operations.has(TEST_SERVICE, TEST_READ_OPERATION)
+    assert not operations.has(TEST_SERVICE, 'UnannotatedOperation')
+
+
+@patch.object(read_only_operations_list._HTTP, 'request')
+def test_read_only_operations_has_method_concurrent_calls_fetch_service_once(
+    mocked_http_request, sample_service_reference_response
+):
+    """Test that concurrent has calls for an uncached service share a single fetch."""
+
+    def slow_response(*args, **kwargs):
+        time.sleep(0.1)
+        return _streamed_response(sample_service_reference_response)
+
+    mocked_http_request.side_effect = slow_response
+    operations = ReadOnlyOperations({TEST_SERVICE: TEST_URL})
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(
+            executor.map(lambda _: operations.has(TEST_SERVICE, TEST_READ_OPERATION), range(8))
+        )
+
+    assert all(results)
+    mocked_http_request.assert_called_once_with(
+        'GET', TEST_URL, timeout=DEFAULT_REQUEST_TIMEOUT, preload_content=False
+    )
+
+
+@patch.object(read_only_operations_list._HTTP, 'request')
+def test_read_only_operations_prime_fetches_services_in_background(
+    mocked_http_request, sample_service_reference_response
+):
+    """Test that priming fetches every service once and has waits for the primed result."""
+
+    def slow_response(*args, **kwargs):
+        time.sleep(0.1)
+        return _streamed_response(sample_service_reference_response)
+
+    mocked_http_request.side_effect = slow_response
 
+    operations = ReadOnlyOperations({TEST_SERVICE: TEST_URL}, prime=True)
 
-@patch('requests.get')
+    assert operations.has(TEST_SERVICE, TEST_READ_OPERATION)
+    assert not operations.has(TEST_SERVICE, TEST_WRITE_OPERATION)
+    mocked_http_request.assert_called_once_with(
+        'GET', TEST_URL, timeout=DEFAULT_REQUEST_TIMEOUT, preload_content=False
+    )
+
+
+@patch.object(read_only_operations_list._HTTP, 'request')
+def test_read_only_operations_has_method_does_not_wait_for_prime_backlog(
+    mocked_http_request, sample_service_reference_response
+):
+    """Test that has fetches a service right away instead of queueing behind priming."""
+    release_prime = threading.Event()
+    fetched_by = {}
+
+    def response(method, url, **kwargs):
+        thread_name = threading.current_thread().name
+        if thread_name.startswith('read-only-operations-prime'):
+            release_prime.wait()
+        fetched_by.setdefault(url, []).append(thread_name)
+        return _streamed_response(sample_service_reference_response)
+
+    mocked_http_request.side_effect = response
+    urls_by_service = {f'service{i}': f'{TEST_URL}/{i}' for i in range(40)}
+    operations = ReadOnlyOperations(urls_by_service)
+    operations._prime()
+
+    try:
+        assert operations.has('service39', TEST_READ_OPERATION)
+        [thread_name] = fetched_by[f'{TEST_URL}/39']
+        assert thread_name.startswith('read-only-operations_')
+    finally:
+        while not operations._prime_services.empty():
+            operations._prime_services.get_nowait()
+        release_prime.set()
+        for thread in operations._prime_threads:
+            thread.join()
+
+
+@patch.object(read_only_operations_list._HTTP, 'request')
+def test_read_only_operations_prime_skips_services_in_local_cache(
+    mocked_http_request, isolated_cache_dir
+):
+    """Test that priming leaves services already in the local cache to be decoded on demand."""
+    with gzip.GzipFile(isolated_cache_dir / 'service_operations.mp.gz', 'wb') as f:
+        f.write(_packb([TEST_SERVICE, _packb([TEST_READ_OPERATION])]))
+    operations = ReadOnlyOperations({TEST_SERVICE: TEST_URL})
+
+    operations._prime()
+
+    assert operations._service_futures == {}
+    assert TEST_SERVICE not in operations
+    assert operations.has(TEST_SERVICE, TEST_READ_OPERATION)
+    mocked_http_request.assert_not_called()
+
+
+@patch.object(read_only_operations_list._HTTP, 'request')
 def test_read_only_operations_has_method_error(
-    mocked_requests_get, sample_service_reference_list_response
+    mocked_http_request, sample_service_reference_list_response
 ):
     """Test the has method of ReadOnlyOperations when the service reference API call throws an error."""
-    mocked_response = MagicMock(spec=Response)
-    mocked_response.json.return_value = sample_service_reference_list_response
-    mocked_requests_get.side_effect = [
+    mocked_response = _json_response(sample_service_reference_list_response)
+    mocked_http_request.side_effect = [
         mocked_response,
         RuntimeError('Error while calling service reference API'),
     ]
@@ -170,24 +427,79 @@ def test_read_only_operations_has_method_error(
     assert isinstance(operations, dict)
     with pytest.raises(RuntimeError):
         operations.has(TEST_SERVICE, TEST_READ_OPERATION)
-    mocked_requests_get.assert_has_calls(
+    mocked_http_request.assert_has_calls(
         [
-            call(SERVICE_REFERENCE_URL, timeout=DEFAULT_REQUEST_TIMEOUT),
-            call(TEST_URL, timeout=DEFAULT_REQUEST_TIMEOUT),
+            call('GET', SERVICE_REFERENCE_URL, timeout=DEFAULT_REQUEST_TIMEOUT),
+            call('GET', TEST_URL, timeout=DEFAULT_REQUEST_TIMEOUT, preload_content=False),
         ],
         any_order=False,
     )
 
 
-@patch('requests.get')
-def test_service_reference_urls_by_service_error(mocked_requests_get):
+@patch.object(read_only_operations_list._HTTP, 'request')
+def test_read_only_operations_has_method_retries_after_error(
+    mocked_http_request, sample_service_reference_response
+):
+    """Test that a failed service fetch is not remembered and the next has call retries it."""
+    mocked_http_request.side_effect = [
+        RuntimeError('Error while calling service reference API'),
+        _streamed_response(sample_service_reference_response),
+    ]
+
+    operations = ReadOnlyOperations({TEST_SERVICE: TEST_URL})
+
+    with pytest.raises(RuntimeError):
+        operations.has(TEST_SERVICE, TEST_READ_OPERATION)
+    assert operations.has(TEST_SERVICE, TEST_READ_OPERATION)
+    assert mocked_http_request.call_count == 2
+
+
+@patch.object(read_only_operations_list._HTTP, 'request')
+def test_service_reference_urls_by_service_loaded_from_local_cache(
+    mocked_http_request, sample_service_reference_list_response
+):
+    """Test that the service reference list is fetched once and then reloaded from the local cache."""
+    mocked_response = _json_response(sample_service_reference_list_response)
+    mocked_http_request.return_value = mocked_response
+
+    ServiceReferenceUrlsByService()
+    urls_by_service = ServiceReferenceUrlsByService()
+
+    assert urls_by_service == {TEST_SERVICE: TEST_URL}
+    mocked_http_request.assert_called_once_with(
+        'GET', SERVICE_REFERENCE_URL, timeout=DEFAULT_REQUEST_TIMEOUT
+    )
+
+
+@patch.object(read_only_operations_list._HTTP, 'request')
+def test_json_cache_from_previous_version_is_migrated(mocked_http_request, isolated_cache_dir):
+    """Test that the JSON cache written by the previous version is loaded and migrated."""
+    (isolated_cache_dir / 'service_reference_urls.json').write_text(
+        json.dumps([{'service': TEST_SERVICE, 'url': TEST_URL}])
+    )
+    (isolated_cache_dir / 'service_operations').mkdir()
+    (isolated_cache_dir / 'service_operations' / f'{TEST_SERVICE}.json').write_text(
+        json.dumps([TEST_READ_OPERATION])
+    )
+
+    operations = ReadOnlyOperations(ServiceReferenceUrlsByService())
+
+    assert operations.has(TEST_SERVICE, TEST_READ_OPERATION)
+    assert not operations.has(TEST_SERVICE, TEST_READ_OPERATION_2)
+    assert (isolated_cache_dir / 'service_reference_urls.mp.gz').exists()
+    assert (isolated_cache_dir / 'service_operations.mp.gz').exists()
+    mocked_http_request.assert_not_called()
+
+
+@patch.object(read_only_operations_list._HTTP, 'request')
+def test_service_reference_urls_by_service_error(mocked_http_request):
     """Test ServiceReferenceUrlsByService initialization when the service reference API call throws an error."""
-    mocked_requests_get.side_effect = RuntimeError('Error while calling service reference API')
+    mocked_http_request.side_effect = RuntimeError('Error while calling service reference API')
 
     with pytest.raises(RuntimeError):
         ServiceReferenceUrlsByService()
-    mocked_requests_get.assert_has_calls(
-        [call(SERVICE_REFERENCE_URL, timeout=DEFAULT_REQUEST_TIMEOUT)], any_order=False
+    mocked_http_request.assert_has_calls(
+        [call('GET', SERVICE_REFERENCE_URL, timeout=DEFAULT_REQUEST_TIMEOUT)], any_order=False
     )
 
 
@@ -199,6 +511,32 @@ def test_read_only_operations_has_method_custom_operation():
     assert not operations.has('s3', 'sync')
 
 
+def test_read_only_operations_has_method_cache_invalidated_on_service_update():
+    """Test that cached has results are dropped when a service's operations are set."""
+    operations = ReadOnlyOperations({})
+    assert not operations.has(TEST_SERVICE, TEST_READ_OPERATION)
+
+    operations[TEST_SERVICE] = {TEST_READ_OPERATION}
+
+    assert operations.has(TEST_SERVICE, TEST_READ_OPERATION)
+
+
+def test_read_only_operations_has_method_cache_kept_when_new_service_is_set():
+    """Test that setting a service that was not loaded keeps other cached has results."""
+    operations = ReadOnlyOperations({})
+    operations[TEST_SERVICE] = {TEST_READ_OPERATION}
+    assert operations.has(TEST_SERVICE, TEST_READ_OPERATION)
+
+    operations['other-service'] = {TEST_READ_OPERATION}
+
+    assert operations._cached_has.cache_info().currsize == 1
+
+    operations[TEST_SERVICE] = {TEST_READ_OPERATION_2}
+
+    assert operations._cached_has.cache_info().currsize == 0
+    assert not operations.has(TEST_SERVICE, TEST_READ_OPERATION)
+
+
 def test_read_only_operations_has_method_operation_from_metadata():
     """Test the has method of ReadOnlyOperations with operations defined in api metadata."""
     operations = ReadOnlyOperations({})
@@ -210,6 +548,21 @@ def test_read_only_operations_has_method_operation_from_metadata():
     assert not operations.has('rds', 'CreateDBSecurityGroup')
 
 
+def test_readonly_data_module_is_up_to_date():
+    """Test that _readonly_data.py matches what scripts/gen_readonly_module.py generates."""
+    script = Path(__file__).resolve().parents[2] / 'scripts' / 'gen_readonly_module.py'
+    spec = importlib.util.spec_from_file_location('gen_readonly_module', script)
+    assert spec is not None and spec.loader is not None
+    gen_readonly_module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(gen_readonly_module)
+
+    expected = gen_readonly_module.render_module(gen_readonly_module.collect_readonly_operations())
+
+    assert gen_readonly_module.OUTPUT_FILE.read_text() == expected, (
+        'Run scripts/gen_readonly_module.py to regenerate _readonly_data.py'
+    )
+
+
 def test_read_only_operations_overrides():
     """Test the has method of ReadOnlyOperations with overrides."""
     operations = ReadOnlyOperations({})
@@ -223,3 +576,28 @@ def test_read_only_operations_overrides():
     assert not operations.has('cognito-identity', 'GetCredentialsForIdentity')
     assert not operations.has('cognito-identity', 'GetOpenIdToken')
     assert not operations.has('sso', 'GetRoleCredentials')
+
+
+@patch.object(read_only_operations_list, 'ServiceReferenceUrlsByService')
+@patch.object(read_only_operations_list, 'ReadOnlyOperations')
+def test_get_read_only_operations_returns_cached_instance(
+    mocked_read_only_operations, mocked_service_reference_urls_by_service
+):
+    """Test that get_read_only_operations builds the index once until it is reset."""
+    mocked_read_only_operations.side_effect = [object(), object()]
+    reset_read_only_operations()
+    try:
+        first = get_read_only_operations()
+
+        assert get_read_only_operations() is first
+        mocked_service_reference_urls_by_service.assert_called_once()
+        mocked_read_only_operations.assert_called_once_with(
+            mocked_service_reference_urls_by_service.return_value, prime=True
+        )
+
+        reset_read_only_operations()
+
+        assert get_read_only_operations() is not first
+        assert mocked_read_only_operations.call_count == 2
+    finally:
+        reset_read_only_operations()
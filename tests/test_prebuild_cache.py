@@ -0,0 +1,155 @@
+import httpx
+import importlib.util
+import msgpack
+import orjson
+import pytest
+from pathlib import Path
+
+
+SERVICE_URLS = {
+    'svc1': 'https://servicereference.us-east-1.amazonaws.com/v1/svc1/svc1.json',
+    'svc2': 'https://servicereference.us-east-1.amazonaws.com/v1/svc2/svc2.json',
+}
+
+
+def _load_prebuild_cache_module():
+    script = Path(__file__).resolve().parents[1] / 'scripts' / 'prebuild_cache.py'
+    spec = importlib.util.spec_from_file_location('prebuild_cache', script)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+prebuild_cache = _load_prebuild_cache_module()
+
+
+class FakeServiceReference:
+    """Service reference endpoint that honours If-None-Match and records every request."""
+
+    def __init__(self):
+        """Start with two services that each have one read-only action."""
+        self.requests: list[httpx.Request] = []
+        self.failing_urls: set[str] = set()
+        self.garbled_urls: set[str] = set()
+        self.operations = {'svc1': ['GetThing'], 'svc2': ['ListThings']}
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        """Answer a request like the service reference endpoint."""
+        self.requests.append(request)
+        url = str(request.url)
+        if url in self.failing_urls:
+            return httpx.Response(500)
+        if url == prebuild_cache.SERVICE_REFERENCE_URL:
+            etag = '"list"'
+            body = [{'service': service, 'url': url} for service, url in SERVICE_URLS.items()]
+        else:
+            service = next(service for service, svc_url in SERVICE_URLS.items() if svc_url == url)
+            etag = f'"{service}-{len(self.operations[service])}"'
+            actions = [
+                {'Name': name, 'Annotations': {'Properties': {'IsWrite': False}}}
+                for name in self.operations[service]
+            ]
+            actions.append({'Name': 'PutThing', 'Annotations': {'Properties': {'IsWrite': True}}})
+            body = {'Name': service, 'Actions': actions}
+        if request.headers.get('If-None-Match') == etag:
+            return httpx.Response(304)
+        if url in self.garbled_urls:
+            return httpx.Response(200, content=b'{"Actions": [', headers={'ETag': etag})
+        return httpx.Response(200, json=body, headers={'ETag': etag})
+
+    def transport(self) -> httpx.MockTransport:
+        """Build a transport that routes requests to this endpoint."""
+        return httpx.MockTransport(self.handler)
+
+    def reset(self):
+        """Forget the recorded requests."""
+        self.requests.clear()
+
+
+@pytest.fixture
+def service_reference():
+    """Fake service reference endpoint."""
+    return FakeServiceReference()
+
+
+def _cached_operations(cache_dir: Path) -> dict[str, list[str]]:
+    records = prebuild_cache._load_service_operations_records(
+        cache_dir / 'service_operations.mp.gz'
+    )
+    return {
+        service: msgpack.unpackb(operations, raw=False) for service, operations in records.items()
+    }
+
+
+async def test_prebuild_writes_cache_files(tmp_path, service_reference):
+    """Test that a first run writes the reference list, the operation records and the etags."""
+    await prebuild_cache.prebuild(tmp_path, service_reference.transport())
+
+    assert _cached_operations(tmp_path) == {'svc1': ['GetThing'], 'svc2': ['ListThings']}
+    assert prebuild_cache._load_msgpack_cache(tmp_path / 'service_reference_urls.mp.gz') == (
+        SERVICE_URLS
+    )
+    assert orjson.loads((tmp_path / 'etags.json').read_bytes()) == {
+        prebuild_cache.SERVICE_REFERENCE_URL: {'etag': '"list"'},
+        SERVICE_URLS['svc1']: {'etag': '"svc1-1"'},
+        SERVICE_URLS['svc2']: {'etag': '"svc2-1"'},
+    }
+
+
+async def test_prebuild_rerun_sends_conditional_requests(tmp_path, service_reference):
+    """Test that a re-run revalidates every document and picks up the changed one."""
+    await prebuild_cache.prebuild(tmp_path, service_reference.transport())
+    service_reference.reset()
+    service_reference.operations['svc2'] = ['ListThings', 'DescribeThing']
+
+    await prebuild_cache.prebuild(tmp_path, service_reference.transport())
+
+    assert all('If-None-Match' in request.headers for request in service_reference.requests)
+    assert _cached_operations(tmp_path) == {
+        'svc1': ['GetThing'],
+        'svc2': ['DescribeThing', 'ListThings'],
+    }
+    assert orjson.loads((tmp_path / 'etags.json').read_bytes())[SERVICE_URLS['svc2']] == {
+        'etag': '"svc2-2"'
+    }
+
+
+async def test_prebuild_rerun_keeps_cached_service_on_fetch_error(tmp_path, service_reference):
+    """Test that a service whose refresh fails keeps its previously cached operations."""
+    await prebuild_cache.prebuild(tmp_path, service_reference.transport())
+    service_reference.failing_urls.add(SERVICE_URLS['svc1'])
+
+    await prebuild_cache.prebuild(tmp_path, service_reference.transport())
+
+    assert _cached_operations(tmp_path) == {'svc1': ['GetThing'], 'svc2': ['ListThings']}
+
+
+async def test_prebuild_first_run_skips_service_on_fetch_error(tmp_path, service_reference):
+    """Test that a service that cannot be fetched and was never cached is left out."""
+    service_reference.failing_urls.add(SERVICE_URLS['svc1'])
+
+    await prebuild_cache.prebuild(tmp_path, service_reference.transport())
+
+    assert _cached_operations(tmp_path) == {'svc2': ['ListThings']}
+
+
+async def test_prebuild_does_not_store_validator_of_unparsable_document(
+    tmp_path, service_reference
+):
+    """Test that a document that fails to parse is fetched again on the next run."""
+    await prebuild_cache.prebuild(tmp_path, service_reference.transport())
+    service_reference.operations['svc1'] = ['GetThing', 'GetOtherThing']
+    service_reference.garbled_urls.add(SERVICE_URLS['svc1'])
+
+    await prebuild_cache.prebuild(tmp_path, service_reference.transport())
+
+    assert _cached_operations(tmp_path)['svc1'] == ['GetThing']
+    assert orjson.loads((tmp_path / 'etags.json').read_bytes())[SERVICE_URLS['svc1']] == {
+        'etag': '"svc1-1"'
+    }
+
+    service_reference.garbled_urls.clear()
+    await prebuild_cache.prebuild(tmp_path, service_reference.transport())
+
+    assert _cached_operations(tmp_path)['svc1'] == ['GetOtherThing', 'GetThing']